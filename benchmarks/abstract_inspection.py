@@ -0,0 +1,160 @@
+"""
+Compares source based and bytecode based abstract factories detection.
+
+Run with: ``python -m benchmarks.abstract_inspection [--modules N]``
+"""
+import argparse
+import importlib
+import linecache
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, List, Sequence, Tuple
+
+from di.utils.inspection.abstract import BytecodeAbstractInspector
+from di.utils.inspection.module_factories import (
+    ModuleFactoriesInspector,
+    NonAbstractFactoryFilter,
+)
+
+FIXTURE_MODULES = [
+    "tests.di.utils.inspection.module_abstract",
+    "tests.di.utils.inspection.module_all_present",
+    "tests.di.utils.inspection.module_empty_annotations",
+    "tests.di.utils.inspection.module_model",
+    "tests.di.declarative.mod_abstract",
+    "tests.di.declarative.mod_config",
+    "tests.di.declarative.mod_impl",
+    "tests.di.declarative.mod_plugins",
+    "tests.di.declarative.mod_simple",
+    "tests.di.declarative.mod_simple_impl",
+]
+
+_CLASS_TEMPLATE = """
+class {name}{base}:
+    def __init__(self, value: int = {index}):
+        self.value = value
+{methods}
+"""
+
+_METHOD_TEMPLATE = """
+    def method_{index}(self, argument: int) -> int:
+        result = self.value
+        for item in range(argument):
+            result += item * {index}
+        return result
+"""
+
+_ABSTRACT_METHOD_TEMPLATE = """
+    def abstract_{index}(self, argument: int) -> int:
+        raise NotImplementedError(f"{{self}} does not implement {index}")
+"""
+
+
+def generate_package(
+    root: Path, modules: int, classes: int = 10, methods: int = 5
+) -> List[str]:
+    package = root / "di_bench_domain"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    names = []
+    for module_index in range(modules):
+        parts = []
+        for class_index in range(classes):
+            abstract = class_index % 3 == 0
+            body = "".join(
+                _METHOD_TEMPLATE.format(index=index) for index in range(methods)
+            )
+            if abstract:
+                body += _ABSTRACT_METHOD_TEMPLATE.format(index=class_index)
+            base = f"(Class{class_index - 1})" if class_index % 3 == 1 else ""
+            parts.append(
+                _CLASS_TEMPLATE.format(
+                    name=f"Class{class_index}",
+                    base=base,
+                    index=class_index,
+                    methods=body,
+                )
+            )
+        name = f"module_{module_index}"
+        (package / f"{name}.py").write_text("".join(parts))
+        names.append(f"di_bench_domain.{name}")
+    return names
+
+
+def _scan(modules: Sequence[ModuleType], bytecode: bool) -> List[Tuple[str, str]]:
+    inspector = ModuleFactoriesInspector([NonAbstractFactoryFilter(bytecode=bytecode)])
+    return [
+        (module.__name__, name)
+        for module in modules
+        for name, _ in inspector.filtered_factories(module)
+    ]
+
+
+def _measure(fn: Callable[[], object], repeat: int, setup: Callable[[], None]):
+    best = float("inf")
+    for _ in range(repeat):
+        setup()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _cold():
+    linecache.clearcache()
+    BytecodeAbstractInspector.code_cache.clear()
+
+
+def _nothing():
+    pass
+
+
+def compare(label: str, modules: Sequence[ModuleType], repeat: int):
+    source_result = _scan(modules, bytecode=False)
+    bytecode_result = _scan(modules, bytecode=True)
+    if source_result != bytecode_result:
+        raise AssertionError(f"Strategies disagree on {label}")
+
+    rows = []
+    for bytecode in (False, True):
+
+        def _run():
+            _scan(modules, bytecode=bytecode)
+
+        rows.append(
+            (
+                "bytecode" if bytecode else "source",
+                _measure(_run, repeat, _cold),
+                _measure(_run, repeat, _nothing),
+            )
+        )
+    print(f"{label}: {len(modules)} modules, {len(source_result)} factories")
+    print(f"  {'strategy':<10}{'cold [ms]':>12}{'warm [ms]':>12}")
+    for name, cold, warm in rows:
+        print(f"  {name:<10}{cold * 1000:>12.2f}{warm * 1000:>12.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--modules", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    fixtures = [importlib.import_module(name) for name in FIXTURE_MODULES]
+    compare("fixtures", fixtures, args.repeat)
+
+    with tempfile.TemporaryDirectory() as directory:
+        names = generate_package(Path(directory), args.modules)
+        sys.path.insert(0, directory)
+        try:
+            generated = [importlib.import_module(name) for name in names]
+            compare("generated", generated, args.repeat)
+        finally:
+            sys.path.remove(directory)
+
+
+if __name__ == "__main__":
+    main()
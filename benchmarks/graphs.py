@@ -0,0 +1,192 @@
+"""
+Synthetic dependency graph generators used by benchmark suite.
+
+Every generator returns ``GeneratedApp`` with factory declaring application,
+types resolved by ``value_of`` and type queried by ``values_by_type``.
+Classes are generated once, so repeated declarations measure only the DI.
+"""
+import inspect
+from dataclasses import dataclass
+from typing import Callable, Collection, Dict, List, Sequence, Tuple, Type
+
+from di.declarative import DeclarativeApp, DeclarativeModule, add_factories, type_check
+
+
+class Node:
+    pass
+
+
+class Plugin(Node):
+    pass
+
+
+@dataclass
+class GeneratedApp:
+    name: str
+    declare: Callable[[], DeclarativeApp]
+    # resolved one by one with value_of
+    roots: Sequence[Type]
+    # queried with values_by_type (non strict)
+    query: Type
+    elements: int
+
+
+def node_class(
+    name: str, dependencies: Sequence[Tuple[str, Type]] = (), base: Type = Node
+) -> Type:
+    # class with annotated constructor, as written by hand
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+    parameters = [
+        inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD),
+        *(
+            inspect.Parameter(
+                arg, inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=type_
+            )
+            for arg, type_ in dependencies
+        ),
+    ]
+    __init__.__signature__ = inspect.Signature(parameters)  # type: ignore
+    __init__.__annotations__ = dict(dependencies)
+    return type(name, (base,), {"__init__": __init__, "__module__": __name__})
+
+
+def wide(size: int = 10000) -> GeneratedApp:
+    classes = [node_class(f"Wide{index}") for index in range(size)]
+    return GeneratedApp(
+        name="wide",
+        declare=lambda: DeclarativeApp(DeclarativeModule(add_factories(*classes))),
+        roots=classes,
+        query=Node,
+        elements=size,
+    )
+
+
+def deep(size: int = 1000) -> GeneratedApp:
+    classes = [node_class("Deep0")]
+    for index in range(1, size):
+        classes.append(node_class(f"Deep{index}", [("previous", classes[-1])]))
+    return GeneratedApp(
+        name="deep",
+        declare=lambda: DeclarativeApp(DeclarativeModule(add_factories(*classes))),
+        roots=[classes[-1]],
+        query=Node,
+        elements=size,
+    )
+
+
+def diamond(size: int = 1000, width: int = 4) -> GeneratedApp:
+    # layers of nodes, every node depends on every node of previous layer,
+    # so each dependency is reachable by many paths
+    layers: List[List[Type]] = [[node_class("Diamond0")]]
+    count = 1
+    while count < size:
+        layer_width = 1 if len(layers) % 2 == 0 else width
+        previous = layers[-1]
+        layer = [
+            node_class(
+                f"Diamond{count + index}",
+                [
+                    (f"dependency{number}", type_)
+                    for number, type_ in enumerate(previous)
+                ],
+            )
+            for index in range(layer_width)
+        ]
+        layers.append(layer)
+        count += layer_width
+    classes = [type_ for layer in layers for type_ in layer]
+    return GeneratedApp(
+        name="diamond",
+        declare=lambda: DeclarativeApp(DeclarativeModule(add_factories(*classes))),
+        roots=layers[-1],
+        query=Node,
+        elements=len(classes),
+    )
+
+
+def aggregation(size: int = 1000) -> GeneratedApp:
+    plugins = [node_class(f"Plugin{index}", base=Plugin) for index in range(size)]
+    registry = node_class("Registry", [("plugins", Collection[Plugin])])
+    return GeneratedApp(
+        name="aggregation",
+        declare=lambda: DeclarativeApp(
+            DeclarativeModule(add_factories(*plugins, registry)),
+            agg_checks=[type_check(Plugin)],
+        ),
+        roots=[registry],
+        query=Plugin,
+        elements=size + 1,
+    )
+
+
+def many_modules(
+    size: int = 500, per_module: int = 4, every_global: int = 10
+) -> GeneratedApp:
+    # every n-th module is global with shared services, imported automatically
+    # by all other modules; services of other modules depend on shared
+    # service and on service of previous module imported by name
+    shared: List[List[Type]] = []
+    chained: List[List[Type]] = []
+    for index in range(size):
+        if index % every_global == 0:
+            shared.append(
+                [
+                    node_class(f"Shared{index}Service{number}")
+                    for number in range(per_module)
+                ]
+            )
+            continue
+        dependencies = [("shared", shared[-1][0])]
+        if chained:
+            dependencies.append(("previous", chained[-1][0]))
+        chained.append(
+            [
+                node_class(f"Module{index}Service{number}", dependencies)
+                for number in range(per_module)
+            ]
+        )
+
+    def _declare() -> DeclarativeApp:
+        return DeclarativeApp(
+            *(
+                DeclarativeModule(
+                    add_factories(*classes), name=f"shared{index}", global_=True
+                )
+                for index, classes in enumerate(shared)
+            ),
+            *(
+                DeclarativeModule(
+                    add_factories(*classes),
+                    imports=[f"module{index - 1}"] if index else [],
+                    name=f"module{index}",
+                )
+                for index, classes in enumerate(chained)
+            ),
+        )
+
+    return GeneratedApp(
+        name="many_modules",
+        declare=_declare,
+        roots=[classes[-1] for classes in chained],
+        query=Node,
+        elements=size * per_module,
+    )
+
+
+GENERATORS: Dict[str, Callable[..., GeneratedApp]] = {
+    "wide": wide,
+    "deep": deep,
+    "diamond": diamond,
+    "aggregation": aggregation,
+    "many_modules": many_modules,
+}
+
+SIZES = {
+    "wide": 10000,
+    "deep": 1000,
+    "diamond": 1000,
+    "aggregation": 1000,
+    "many_modules": 500,
+}
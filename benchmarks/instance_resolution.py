@@ -0,0 +1,105 @@
+"""
+Compares transient elements resolution in available instance engines.
+
+Run with: ``python -m benchmarks.instance_resolution [--calls N]``
+"""
+import argparse
+import time
+from typing import List
+
+from di.core.element import Element
+from di.core.instance import ApplicationInstanceBuilder
+from di.core.navigator import ApplicationNavigator
+from di.declarative import DeclarativeApp, DeclarativeModule, add_factories
+from di.declarative.app.app import INSTANCE_ENGINES
+
+
+class Config:
+    pass
+
+
+class Repository:
+    def __init__(self, config: Config):
+        self.config = config
+
+
+class Cache:
+    def __init__(self, config: Config):
+        self.config = config
+
+
+class Service:
+    def __init__(self, repository: Repository, cache: Cache):
+        self.repository = repository
+        self.cache = cache
+
+
+class Handler:
+    def __init__(self, service: Service, config: Config):
+        self.service = service
+        self.config = config
+
+
+class Plugin:
+    pass
+
+
+class PluginA(Plugin):
+    pass
+
+
+class PluginB(Plugin):
+    pass
+
+
+class Dispatcher:
+    def __init__(self, handler: Handler, plugins: List[Plugin]):
+        self.handler = handler
+        self.plugins = plugins
+
+
+def build_app() -> DeclarativeApp:
+    return DeclarativeApp(
+        DeclarativeModule(
+            add_factories(Config, Repository, Cache, PluginA, PluginB),
+            add_factories(Service, Handler, singleton=False),
+            add_factories(
+                Dispatcher, singleton=False, agg_checks=[lambda d: d.arg == "plugins"]
+            ),
+        )
+    )
+
+
+def measure(
+    builder: ApplicationInstanceBuilder, element: Element, calls: int, repeat: int
+) -> float:
+    instance = builder.build()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            instance.value_of(element)
+        best = min(best, time.perf_counter() - start)
+    return best / calls
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    composed = build_app().build_composed()
+    (element,) = ApplicationNavigator(composed.application).by_type(Dispatcher)
+    results = {
+        name: measure(engine(composed), element, args.calls, args.repeat)
+        for name, engine in INSTANCE_ENGINES.items()
+    }
+    baseline = results["recursive"]
+    print(f"{'engine':<12}{'per call [us]':>16}{'speedup':>10}")
+    for name, result in results.items():
+        print(f"{name:<12}{result * 1e6:>16.2f}{baseline / result:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Measures cost of provide observers in available instance engines.
+
+Each engine resolves the same transient element without observers
+and with a single no-op observer attached. With ``--baseline`` pointing
+to a checkout without observer hooks, the same resolution is measured
+there too, so the cost of unused hooks is reported.
+
+Run with:
+``python -m benchmarks.observer_overhead [--calls N] [--baseline PATH]``
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, Optional
+
+from benchmarks.instance_resolution import Dispatcher, build_app, measure
+from di.core.navigator import ApplicationNavigator
+from di.declarative.app.app import INSTANCE_ENGINES
+
+
+def measure_engines(calls: int, repeat: int, observed: bool) -> Dict[str, float]:
+    composed = build_app().build_composed()
+    (element,) = ApplicationNavigator(composed.application).by_type(Dispatcher)
+    options = {}
+    if observed:
+        # imported only here, baseline checkout may not define observers
+        from di.core.element import ProvideObserver
+
+        options["observers"] = [ProvideObserver()]
+    return {
+        name: measure(engine(composed, **options), element, calls, repeat)
+        for name, engine in INSTANCE_ENGINES.items()
+    }
+
+
+def measure_baseline(path: str, calls: int, repeat: int) -> Dict[str, float]:
+    # separate process imports di from baseline checkout
+    env = {**os.environ, "PYTHONPATH": os.path.abspath(path)}
+    output = subprocess.run(
+        [
+            sys.executable,
+            os.path.abspath(__file__),
+            "--calls",
+            str(calls),
+            "--repeat",
+            str(repeat),
+            "--plain-json",
+        ],
+        env=env,
+        cwd=path,
+        check=True,
+        stdout=subprocess.PIPE,
+    ).stdout
+    return json.loads(output)
+
+
+def _overhead(value: Optional[float], reference: Optional[float]) -> str:
+    if value is None or reference is None:
+        return f"{'-':>10}"
+    return f"{(value / reference - 1) * 100:>9.1f}%"
+
+
+def _time(value: Optional[float]) -> str:
+    return f"{'-':>14}" if value is None else f"{value * 1e6:>14.2f}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", help="checkout without observer hooks")
+    parser.add_argument("--plain-json", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.plain_json:
+        print(json.dumps(measure_engines(args.calls, args.repeat, observed=False)))
+        return
+
+    baseline = {}
+    if args.baseline:
+        baseline = measure_baseline(args.baseline, args.calls, args.repeat)
+    plain = measure_engines(args.calls, args.repeat, observed=False)
+    observed = measure_engines(args.calls, args.repeat, observed=True)
+
+    print(
+        f"{'engine':<12}{'baseline [us]':>14}{'unused [us]':>14}{'observed [us]':>14}"
+        f"{'unused':>10}{'observed':>10}"
+    )
+    for name in plain:
+        print(
+            f"{name:<12}{_time(baseline.get(name))}{_time(plain[name])}"
+            f"{_time(observed[name])}"
+            f"{_overhead(plain[name], baseline.get(name))}"
+            f"{_overhead(observed[name], plain[name])}"
+        )
+
+
+if __name__ == "__main__":
+    main()
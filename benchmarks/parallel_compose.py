@@ -0,0 +1,103 @@
+"""
+Compares serial and parallel composition of wide import steps.
+
+Each application has a shared base module and ``--modules`` modules
+importing it, all in a single import step. Each module has ``--elements``
+elements depending on base and on each other. Speedup of
+``ParallelApplicationComposer`` depends on available cores, on small
+modules pickling and worker round trip outweigh solving.
+
+Run with:
+``python -m benchmarks.parallel_compose [--modules N ...] [--elements N]``
+"""
+import argparse
+import os
+import time
+from typing import Callable, List
+
+from di.core.app import Application
+from di.core.compose import ApplicationComposer, ParallelApplicationComposer
+from di.core.element import Element
+from di.core.injection import InjectionSolver
+from di.core.injectors import FactoryInjector
+from di.core.module import Module, ModuleElementConsistencyCheck, ModuleImportSolver
+from di.core.provide_strategies import SingletonProvideStrategy
+
+
+class Base:
+    pass
+
+
+# module level types, so problems can be pickled for workers
+def _chain_types(count: int) -> List[type]:
+    types: List[type] = []
+    for index in range(count):
+        previous = types[-1] if types else Base
+
+        def __init__(self, base: Base, previous: previous):  # type: ignore
+            pass
+
+        type_ = type(f"Chain{index}", (), {"__init__": __init__})
+        type_.__module__ = __name__
+        globals()[type_.__name__] = type_
+        types.append(type_)
+    return types
+
+
+def _element(factory: Callable) -> Element:
+    return Element(
+        injector=FactoryInjector(factory), strategy=SingletonProvideStrategy()
+    )
+
+
+def build_application(modules: int, elements: int) -> Application:
+    base = Module(name="base", elements={_element(Base)})
+    base.exports = {*base.elements}
+    application = Application(modules={base})
+    types = _chain_types(elements)
+    for index in range(modules):
+        application.modules.add(
+            Module(
+                name=f"wide{index}",
+                imports={base},
+                elements={_element(type_) for type_ in types},
+            )
+        )
+    return application
+
+
+def measure(composer, application: Application, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        composer.compose(application)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--modules", type=int, nargs="+", default=[2, 8, 32])
+    parser.add_argument("--elements", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    options = InjectionSolver(), ModuleImportSolver(), ModuleElementConsistencyCheck()
+    serial = ApplicationComposer(*options)
+    parallel = ParallelApplicationComposer(*options, max_workers=args.workers)
+
+    print(f"cpus: {os.cpu_count()}, elements per module: {args.elements}")
+    print(f"{'modules':<10}{'serial [ms]':>14}{'parallel [ms]':>14}{'speedup':>10}")
+    for modules in args.modules:
+        application = build_application(modules, args.elements)
+        serial_time = measure(serial, application, args.repeat)
+        parallel_time = measure(parallel, application, args.repeat)
+        print(
+            f"{modules:<10}{serial_time * 1e3:>14.1f}{parallel_time * 1e3:>14.1f}"
+            f"{serial_time / parallel_time:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
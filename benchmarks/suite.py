@@ -0,0 +1,200 @@
+"""
+Times build phases and resolution on synthetic dependency graphs.
+
+Phases are measured separately: ``declare`` (``DeclarativeApp`` construction),
+``build_composed``, ``build_instance`` (bootstrap of composed application),
+``value_of`` (first resolution of root elements) and ``values_by_type``.
+Results are saved as JSON, two result files can be compared to catch
+regressions in solver or runtime locally.
+
+Run with:
+``python -m benchmarks.suite run [--graphs wide deep] [--engines iterative ...]
+[--output results.json]``
+``python -m benchmarks.suite compare base.json results.json [--threshold 0.1]``
+
+All instance engines are measured by default. Engine failing on a graph,
+e.g. recursive engine exceeding recursion limit on deep graph in full scale,
+is recorded with its error instead of times.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from benchmarks.graphs import GENERATORS, SIZES, GeneratedApp
+from di.core.navigator import ApplicationNavigator
+from di.declarative.app.app import INSTANCE_ENGINES
+
+PHASES = ["declare", "build_composed", "build_instance", "value_of", "values_by_type"]
+
+
+def measure(generated: GeneratedApp, engine: str, repeat: int) -> Dict[str, float]:
+    best = {phase: float("inf") for phase in PHASES}
+    for _ in range(repeat):
+        times = {}
+        start = time.perf_counter()
+        app = generated.declare()
+        times["declare"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        composed = app.build_composed()
+        times["build_composed"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        instance = INSTANCE_ENGINES[engine](composed).build()
+        times["build_instance"] = time.perf_counter() - start
+
+        navigator = ApplicationNavigator(composed.application)
+        roots = [
+            element for type_ in generated.roots for element in navigator.by_type(type_)
+        ]
+        start = time.perf_counter()
+        for element in roots:
+            instance.value_of(element)
+        times["value_of"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        values = instance.values_by_type(generated.query, strict=False)
+        times["values_by_type"] = time.perf_counter() - start
+        if not values:
+            raise AssertionError(f"No {generated.query} values in {generated.name}")
+
+        for phase, value in times.items():
+            best[phase] = min(best[phase], value)
+    return best
+
+
+def measure_result(generated: GeneratedApp, engine: str, repeat: int) -> Dict[str, Any]:
+    try:
+        times = measure(generated, engine, repeat)
+    except (RecursionError, MemoryError) as error:
+        # engine limits are results too, other errors are bugs
+        return {"elements": generated.elements, "error": type(error).__name__}
+    return {"elements": generated.elements, "times": times}
+
+
+def run(
+    graphs: Sequence[str], engines: Sequence[str], scale: float, repeat: int
+) -> Dict[str, Any]:
+    results: Dict[str, Dict[str, Any]] = {engine: {} for engine in engines}
+    for name in graphs:
+        generated = GENERATORS[name](max(1, int(SIZES[name] * scale)))
+        for engine in engines:
+            results[engine][name] = measure_result(generated, engine, repeat)
+        print(f"{name} ({generated.elements} elements)", file=sys.stderr)
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "engines": [*engines],
+        "scale": scale,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def format_results(report: Dict[str, Any]) -> str:
+    header = f"{'engine':<14}{'graph':<14}" + "".join(
+        f"{phase:>16}" for phase in PHASES
+    )
+    lines = ["times [ms]", header]
+    for engine, engine_results in report["results"].items():
+        for name, result in engine_results.items():
+            if "error" in result:
+                cells = f"{'failed: ' + result['error']:>16}"
+            else:
+                times = result["times"]
+                cells = "".join(f"{times[phase] * 1e3:>16.2f}" for phase in PHASES)
+            lines.append(f"{engine:<14}{name:<14}{cells}")
+    return "\n".join(lines)
+
+
+def compare(
+    base: Dict[str, Any], current: Dict[str, Any], threshold: float
+) -> List[str]:
+    # returns regressions, ratio above 1 + threshold means slower than base
+    # newly failing engine on graph is a regression too
+    regressions = []
+    for key in ("scale", "python"):
+        if base.get(key) != current.get(key):
+            print(f"Warning: {key} differs ({base.get(key)} vs {current.get(key)})")
+    print(
+        f"{'engine':<14}{'graph':<14}{'phase':<16}{'base ms':>10}"
+        f"{'current ms':>12}{'ratio':>8}"
+    )
+    for engine, engine_results in current["results"].items():
+        base_results = base["results"].get(engine, {})
+        for name, result in engine_results.items():
+            if name not in base_results:
+                continue
+            base_result = base_results[name]
+            if "error" in result or "error" in base_result:
+                print(
+                    f"{engine:<14}{name:<14}{'failed':<16}"
+                    f"base {base_result.get('error', '-')}, "
+                    f"current {result.get('error', '-')}"
+                )
+                if "error" in result and "error" not in base_result:
+                    regressions.append(f"{engine}.{name}")
+                continue
+            base_times = base_result["times"]
+            for phase, value in result["times"].items():
+                if phase not in base_times:
+                    continue
+                ratio = value / base_times[phase] if base_times[phase] else 1.0
+                regression = ratio > 1 + threshold
+                marker = " !" if regression else ""
+                print(
+                    f"{engine:<14}{name:<14}{phase:<16}{base_times[phase] * 1e3:>10.2f}"
+                    f"{value * 1e3:>12.2f}{ratio:>8.2f}{marker}"
+                )
+                if regression:
+                    regressions.append(f"{engine}.{name}.{phase}")
+    return regressions
+
+
+def _load(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as fp:
+        return json.load(fp)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run")
+    run_parser.add_argument("--graphs", nargs="+", choices=[*GENERATORS])
+    run_parser.add_argument("--engines", nargs="+", choices=[*INSTANCE_ENGINES])
+    run_parser.add_argument("--scale", type=float, default=1.0)
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--output")
+
+    compare_parser = commands.add_parser("compare")
+    compare_parser.add_argument("base")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+
+    args = parser.parse_args(argv)
+    if args.command == "run":
+        report = run(
+            args.graphs or [*GENERATORS],
+            args.engines or [*INSTANCE_ENGINES],
+            args.scale,
+            args.repeat,
+        )
+        print(format_results(report))
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as fp:
+                json.dump(report, fp, indent=2)
+        return 0
+
+    regressions = compare(_load(args.base), _load(args.current), args.threshold)
+    if regressions:
+        print(f"Regressions: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
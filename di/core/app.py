@@ -1,20 +1,30 @@
 from dataclasses import dataclass, field
-from typing import Set
+from typing import Any, FrozenSet, Set
 
 from di.core.element import Element
 from di.core.module.base import Module
+from di.utils.versioned import versioned, versioned_property
 
 
 @dataclass
 class Application:
     modules: Set[Module] = field(default_factory=set)
 
-    @property
-    def elements(self) -> Set[Element]:
+    def __setattr__(self, name: str, value: Any):
+        if name == "modules":
+            value = versioned(value)
+        super().__setattr__(name, value)
+
+    # cached until modules or elements of modules change;
+    # immutable, so cached value is shared (set copy was returned before)
+    @versioned_property.depending_on(
+        lambda app: [app.modules, *(module.elements for module in app.modules)]
+    )
+    def elements(self) -> FrozenSet[Element]:
         all_set = set()
         for module in self.modules:
             all_set.update(module.elements)
-        return all_set
+        return frozenset(all_set)
 
 
 class ApplicationRelated:
@@ -19,6 +19,7 @@ from di.core.assignment.matchers import (
     TypeMatcher,
 )
 from di.core.assignment.selectors import DirectAssignmentFactorySelector
+from di.core.assignment.values import IndexedValues, ValueTypeIndex
 
 __all__ = [
     # base
@@ -42,4 +43,7 @@ __all__ = [
     "TypeMatcher",
     # selectors
     "DirectAssignmentFactorySelector",
+    # values
+    "IndexedValues",
+    "ValueTypeIndex",
 ]
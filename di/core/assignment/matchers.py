@@ -1,6 +1,7 @@
 from typing import Collection, Dict, Iterable, Set
 
 from di.core.assignment.base import Matcher
+from di.core.assignment.values import IndexedValues
 from di.core.element import Dependency, Value
 from di.utils.inspection import aggregated_type, is_base_type, is_compatible_type
 
@@ -20,13 +21,27 @@ class BaseTypeMatcher(Matcher):
     def iterate(self, dependency: Dependency, values: Set[Value]) -> Iterable[Value]:
         if is_base_type(dependency.type):
             return
-        for value in values:
+        for value in self._candidates(dependency, values):
             if is_base_type(value.type):
                 continue
             if dependency.source == value.source:
                 continue
             yield value
 
+    def _candidates(self, dependency: Dependency, values: Set[Value]):
+        if isinstance(values, IndexedValues):
+            return values.ordered
+        return values
+
+    @staticmethod
+    def _indexed_candidates(type_, values: Set[Value]) -> Iterable[Value]:
+        if isinstance(values, IndexedValues):
+            candidates = values.type_index.candidates(type_)
+            if candidates is not None:
+                return candidates
+            return values.ordered
+        return values
+
 
 class TypeMatcher(BaseTypeMatcher):
     def iterate(self, dependency: Dependency, values: Set[Value]) -> Iterable[Value]:
@@ -34,6 +49,9 @@ class TypeMatcher(BaseTypeMatcher):
             if is_compatible_type(value.type, dependency.type):
                 yield value
 
+    def _candidates(self, dependency: Dependency, values: Set[Value]):
+        return self._indexed_candidates(dependency.type, values)
+
 
 class TypeIterableMatcher(BaseTypeMatcher):
     def iterate(self, dependency: Dependency, values: Set[Value]) -> Iterable[Value]:
@@ -53,3 +71,6 @@ class TypeAggregationMatcher(BaseTypeMatcher):
         for value in super().iterate(dependency, values):
             if is_compatible_type(value.type, nested_model):
                 yield value
+
+    def _candidates(self, dependency: Dependency, values: Set[Value]):
+        return self._indexed_candidates(aggregated_type(dependency.type), values)
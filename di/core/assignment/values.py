@@ -0,0 +1,65 @@
+from collections import defaultdict
+from typing import Collection, Dict, Iterable, List, Optional, Sequence, Type
+
+from di.core.element import Value
+from di.utils.compat import cached_property
+from di.utils.inspection import is_base_type
+from di.utils.inspection.typing import flatten_new_type
+
+
+class ValueTypeIndex:
+    __slots__ = "_type_map", "_unindexed", "_positions"
+
+    def __init__(self, values: Collection[Value]):
+        self._type_map: Dict[Type, List[Value]] = defaultdict(list)
+        self._unindexed: List[Value] = []
+        self._positions: Dict[Value, int] = {}
+        for value in values:
+            self._add(value)
+
+    def _add(self, value: Value):
+        self._positions.setdefault(value, len(self._positions))
+        type_ = flatten_new_type(value.type)
+        if not type_ or is_base_type(type_):
+            return
+        if not isinstance(type_, type):
+            self._unindexed.append(value)
+            return
+        for sub_type in type_.__mro__:
+            if not is_base_type(sub_type):
+                self._type_map[sub_type].append(value)
+
+    def candidates(self, type_) -> Optional[Collection[Value]]:
+        type_ = flatten_new_type(type_)
+        if not self._indexable(type_):
+            return None
+        indexed = self._type_map.get(type_, ())
+        if not self._unindexed:
+            return indexed
+        # both lists are in insertion order, so merge keeps it
+        return sorted([*indexed, *self._unindexed], key=self._positions.__getitem__)
+
+    @staticmethod
+    def _indexable(type_) -> bool:
+        # classes with custom `__subclasscheck__` (like ABCs) can match
+        # types which do not have them in MRO
+        return (
+            isinstance(type_, type)
+            and type(type_).__subclasscheck__ is type.__subclasscheck__
+        )
+
+
+class IndexedValues(frozenset):
+    ordered: Sequence[Value]
+
+    def __new__(cls, values: Iterable[Value] = ()):
+        # iteration order of given values is kept, so matching results
+        # depend only on order of solved problem elements
+        ordered = [*dict.fromkeys(values)]
+        indexed = super().__new__(cls, ordered)
+        indexed.ordered = ordered
+        return indexed
+
+    @cached_property
+    def type_index(self) -> ValueTypeIndex:
+        return ValueTypeIndex(self.ordered)
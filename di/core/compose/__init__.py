@@ -10,6 +10,21 @@ from di.core.compose.base import (
     ModuleInjectionPlan,
 )
 from di.core.compose.composers import ApplicationComposer
+from di.core.compose.incremental import (
+    ApplicationRecomposition,
+    IncrementalApplicationComposer,
+)
+from di.core.compose.parallel import ParallelApplicationComposer
+from di.core.compose.serialization import (
+    ComposedApplicationLoadError,
+    ComposedApplicationSerializationError,
+    StoredApplicationComposer,
+    dump_composed,
+    element_key,
+    load_composed,
+    read_composed,
+    save_composed,
+)
 
 __all__ = [
     # base
@@ -24,4 +39,18 @@ __all__ = [
     "ModuleInjectionPlan",
     # composers
     "ApplicationComposer",
+    # incremental
+    "ApplicationRecomposition",
+    "IncrementalApplicationComposer",
+    # parallel
+    "ParallelApplicationComposer",
+    # serialization
+    "ComposedApplicationLoadError",
+    "ComposedApplicationSerializationError",
+    "StoredApplicationComposer",
+    "dump_composed",
+    "element_key",
+    "load_composed",
+    "read_composed",
+    "save_composed",
 ]
@@ -1,4 +1,4 @@
-from typing import Collection, Iterable, Sequence
+from typing import Callable, Collection, Iterable, Sequence
 
 from di.core.app import Application
 from di.core.compose.base import (
@@ -14,6 +14,7 @@ from di.core.compose.base import (
 from di.core.element import Element
 from di.core.injection import (
     AbstractInjectionSolver,
+    InjectionPlan,
     InjectionProblem,
     InjectionSolverAssignmentError,
     InjectionSolverCyclicDependencyError,
@@ -26,6 +27,7 @@ from di.core.module import (
     ModuleImportPlan,
     ModuleImportSolverError,
 )
+from di.utils.profiling import null_span, profile_span
 
 
 class ApplicationComposer(AbstractApplicationComposer):
@@ -40,10 +42,15 @@ class ApplicationComposer(AbstractApplicationComposer):
         self.consistency_check = consistency_check
 
     def compose(self, application: Application) -> ComposedApplication:
-        self._consistency_check(application.modules)
-        import_plan = self._module_import_plan(application.modules)
-        injection_plans = [*self._iterate_injection_plans(import_plan.steps)]
-        bootstrap_steps = [*self._iterate_bootstrap_steps(injection_plans)]
+        modules = application.modules
+        with profile_span("compose", "compose", modules=len(modules)):
+            with profile_span("consistency_check", "compose"):
+                self._consistency_check(modules)
+            with profile_span("import_solve", "compose"):
+                import_plan = self._module_import_plan(modules)
+            injection_plans = [*self._iterate_injection_plans(import_plan.steps)]
+            with profile_span("bootstrap_plan", "compose"):
+                bootstrap_steps = [*self._iterate_bootstrap_steps(injection_plans)]
         return ComposedApplication(
             application=application,
             import_plan=import_plan,
@@ -54,8 +61,8 @@ class ApplicationComposer(AbstractApplicationComposer):
     def _consistency_check(self, modules: Collection[Module]):
         try:
             self.consistency_check.check(modules)
-        except ModuleElementConsistencyError:
-            raise ApplicationComposerConsistencyError
+        except ModuleElementConsistencyError as error:
+            raise ApplicationComposerConsistencyError(str(error)) from error
 
     def _module_import_plan(self, modules: Collection[Module]) -> ModuleImportPlan:
         try:
@@ -71,13 +78,40 @@ class ApplicationComposer(AbstractApplicationComposer):
                 yield self._injection_plan(module)
 
     def _injection_plan(self, module: Module) -> ModuleInjectionPlan:
+        return self._module_injection_plan(
+            module, self._injection_problem(module), self.injection_solver.solve
+        )
+
+    @staticmethod
+    def _injection_problem(module: Module) -> InjectionProblem:
+        return InjectionProblem(
+            imports=[*module.imported_elements],
+            elements=[*module.elements],
+        )
+
+    @staticmethod
+    def _module_injection_plan(
+        module: Module,
+        problem: InjectionProblem,
+        solve: Callable[[InjectionProblem], InjectionPlan],
+    ) -> ModuleInjectionPlan:
         try:
-            plan = self.injection_solver.solve(
-                InjectionProblem(
-                    imports=module.imported_elements,
-                    elements=module.elements,
-                )
-            )
+            with profile_span(
+                "solve", "solve", module=module.name, elements=len(problem.elements)
+            ) as span:
+                plan = solve(problem)
+                if span is not null_span:
+                    span.set(
+                        imports=len(problem.imports),
+                        dependencies=sum(
+                            len([*element.dependencies()])
+                            for element in problem.elements
+                        ),
+                        assignments=len(plan.assignments),
+                        injected_values=sum(
+                            len(assignment.values) for assignment in plan.assignments
+                        ),
+                    )
             return ModuleInjectionPlan(
                 module=module,
                 assignments=plan.assignments,
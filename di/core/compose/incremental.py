@@ -0,0 +1,147 @@
+from dataclasses import dataclass
+from typing import Collection, Dict, List, Optional, Set, Tuple
+
+from di.core.app import Application
+from di.core.assignment import Assignment
+from di.core.compose.base import ComposedApplication, ModuleInjectionPlan
+from di.core.compose.composers import ApplicationComposer
+from di.core.element import Element
+from di.core.module import Module, ModuleImportPlan
+
+AssignmentSignature = Tuple[str, type, Tuple[Element, ...]]
+
+
+@dataclass
+class ApplicationRecomposition:
+    composed: ComposedApplication
+    solved: Set[Module]
+    rebuild: Set[Element]
+    removed: Set[Element]
+
+
+class IncrementalApplicationComposer(ApplicationComposer):
+    def recompose(
+        self,
+        previous: ComposedApplication,
+        application: Optional[Application] = None,
+        changed: Collection[Module] = (),
+    ) -> ApplicationRecomposition:
+        application = application or previous.application
+        self._consistency_check(application.modules)
+        import_plan = self._module_import_plan(application.modules)
+        previous_plans = {plan.module: plan for plan in previous.injection_plans}
+        to_solve = self._to_solve(previous, import_plan, previous_plans, changed)
+
+        injection_plans: List[ModuleInjectionPlan] = []
+        for module_step in import_plan.steps:
+            for module in module_step:
+                if module in to_solve:
+                    injection_plans.append(self._injection_plan(module))
+                else:
+                    injection_plans.append(previous_plans[module])
+        composed = ComposedApplication(
+            application=application,
+            import_plan=import_plan,
+            injection_plans=injection_plans,
+            bootstrap_steps=[*self._iterate_bootstrap_steps(injection_plans)],
+        )
+        # modules may be changed in place, so previous elements are taken
+        # from problems of previous plans
+        previous_elements = {
+            element for plan in previous.injection_plans for element in plan.graph.nodes
+        }
+        removed = previous_elements - application.elements
+        return ApplicationRecomposition(
+            composed=composed,
+            solved=to_solve,
+            rebuild=self._rebuild(previous, composed, to_solve),
+            removed=removed,
+        )
+
+    @staticmethod
+    def _to_solve(
+        previous: ComposedApplication,
+        import_plan: ModuleImportPlan,
+        previous_plans: Dict[Module, ModuleInjectionPlan],
+        changed: Collection[Module],
+    ) -> Set[Module]:
+        # changed, new and removed modules are followed by their importers,
+        # which are solved only if their problem (own and imported elements) changed
+        modules = {*import_plan.graph.nodes}
+        importers = import_plan.graph.target_sources()
+        previous_importers = previous.import_plan.graph.target_sources()
+        to_solve = {module for module in modules if module not in previous_plans}
+        to_solve.update(module for module in changed if module in modules)
+        to_visit = [*to_solve]
+        for module in previous_plans:
+            if module not in modules:
+                to_visit.extend(previous_importers.get(module, ()))
+        while to_visit:
+            module = to_visit.pop()
+            if module not in modules:
+                continue
+            if module not in to_solve:
+                plan = previous_plans[module]
+                problem = {*module.imported_elements, *module.elements}
+                if problem == {*plan.graph.nodes}:
+                    continue
+                to_solve.add(module)
+            to_visit.extend(
+                importer for importer in importers[module] if importer not in to_solve
+            )
+        return to_solve
+
+    @classmethod
+    def _rebuild(
+        cls,
+        previous: ComposedApplication,
+        composed: ComposedApplication,
+        solved: Set[Module],
+    ) -> Set[Element]:
+        previous_signatures = cls._signatures(previous)
+        signatures = cls._signatures(composed)
+        rebuild = {
+            element
+            for plan in composed.injection_plans
+            if plan.module in solved
+            for element in plan.module.elements
+            if element not in previous_signatures
+            or signatures.get(element) != previous_signatures[element]
+        }
+        # values of dependents change together with their dependencies
+        dependents: Dict[Element, List[Element]] = {}
+        for plan in composed.injection_plans:
+            for assignment in plan.assignments:
+                for value in assignment.values:
+                    dependents.setdefault(value.source, []).append(
+                        assignment.dependency.source
+                    )
+        to_visit = [*rebuild]
+        while to_visit:
+            element = to_visit.pop()
+            for dependent in dependents.get(element, ()):
+                if dependent not in rebuild:
+                    rebuild.add(dependent)
+                    to_visit.append(dependent)
+        return rebuild
+
+    @classmethod
+    def _signatures(
+        cls, composed: ComposedApplication
+    ) -> Dict[Element, Set[AssignmentSignature]]:
+        signatures: Dict[Element, Set[AssignmentSignature]] = {}
+        for plan in composed.injection_plans:
+            for element in plan.graph.nodes:
+                signatures.setdefault(element, set())
+            for assignment in plan.assignments:
+                element = assignment.dependency.source
+                signatures[element].add(cls._signature(assignment))
+        return signatures
+
+    @staticmethod
+    def _signature(assignment: Assignment) -> AssignmentSignature:
+        return (
+            assignment.dependency.arg,
+            type(assignment.mapper),
+            tuple(value.source for value in assignment.values),
+        )
@@ -0,0 +1,264 @@
+import pickle
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from di.core.assignment import (
+    Assignment,
+    AssignmentFactory,
+    AssignmentFactorySelector,
+    ValuesMapper,
+)
+from di.core.compose.base import ModuleInjectionPlan
+from di.core.compose.composers import ApplicationComposer
+from di.core.element import (
+    Dependency,
+    Element,
+    InjectionResult,
+    Injector,
+    InjectorDependency,
+)
+from di.core.injection import (
+    InjectionGraphEdge,
+    InjectionPlan,
+    InjectionProblem,
+    InjectionSolver,
+    InjectionSolverAssignmentError,
+    InjectionSolverCyclicDependencyError,
+)
+from di.core.module import (
+    AbstractModuleElementConsistencyCheck,
+    AbstractModuleImportSolver,
+    Module,
+)
+from di.utils.graph import DirectionalGraph
+
+# element descriptor: result type and dependencies
+# (arg, type, mandatory, selected assignment factory)
+_DependencyDescriptor = Tuple[str, Optional[Type], bool, AssignmentFactory]
+_ElementDescriptor = Tuple[Optional[Type], Sequence[_DependencyDescriptor]]
+# problem descriptor: imported elements and own elements
+_ProblemDescriptor = Tuple[Sequence[_ElementDescriptor], Sequence[_ElementDescriptor]]
+# solution: assignments (element, arg, mapper, values) and stages
+# or failure, which is reproduced by solving problem locally
+_AssignmentDescriptor = Tuple[int, str, ValuesMapper, Sequence[int]]
+_Solution = Tuple[str, Any]
+
+
+class _DescriptorInjector(Injector):
+    def __init__(self, descriptor: _ElementDescriptor):
+        self._result_type, self._dependencies = descriptor
+
+    def dependencies(self) -> Iterable[InjectorDependency]:
+        return [
+            InjectorDependency(arg=arg, type=type_, mandatory=mandatory)
+            for arg, type_, mandatory, _ in self._dependencies
+        ]
+
+    def result(self) -> Optional[InjectionResult]:
+        return InjectionResult(type=self._result_type)
+
+
+class _PresetFactorySelector(AssignmentFactorySelector):
+    def __init__(self, factories: Dict[Tuple[Element, str], AssignmentFactory]):
+        self._factories = factories
+
+    def select(self, dependency: Dependency) -> AssignmentFactory:
+        return self._factories[dependency.source, dependency.arg]
+
+
+def _solve_descriptor(payload: bytes) -> _Solution:
+    imports, elements = pickle.loads(payload)
+    proxies = [
+        Element(injector=_DescriptorInjector(descriptor), strategy=None)
+        for descriptor in [*imports, *elements]
+    ]
+    indices = {proxy: index for index, proxy in enumerate(proxies)}
+    count = len(imports)
+    imported, owned = proxies[:count], proxies[count:]
+    factories = {
+        (proxy, arg): factory
+        for proxy, (_, dependencies) in zip(owned, elements)
+        for arg, _, _, factory in dependencies
+    }
+    solver = InjectionSolver(factory_selector=_PresetFactorySelector(factories))
+    try:
+        plan = solver.solve(InjectionProblem(imports=imported, elements=owned))
+    except (InjectionSolverAssignmentError, InjectionSolverCyclicDependencyError):
+        return "failure", None
+    assignments = [
+        (
+            indices[assignment.dependency.source],
+            assignment.dependency.arg,
+            assignment.mapper,
+            [indices[value.source] for value in assignment.values],
+        )
+        for assignment in plan.assignments
+    ]
+    stages = [sorted(indices[proxy] for proxy in stage) for stage in plan.stages]
+    return "plan", (assignments, stages)
+
+
+class ParallelApplicationComposer(ApplicationComposer):
+    # import steps with fewer than min_step_size modules are solved serially;
+    # pickling and worker round trip cost roughly as much as solving a small
+    # module, so parallel solve pays off for wide steps of larger modules
+    # (see benchmarks.parallel_compose)
+    def __init__(
+        self,
+        injection_solver: InjectionSolver,
+        import_solver: AbstractModuleImportSolver,
+        consistency_check: AbstractModuleElementConsistencyCheck,
+        max_workers: Optional[int] = None,
+        min_step_size: int = 2,
+        executor_factory: Optional[Callable[[Optional[int]], Executor]] = None,
+    ):
+        super().__init__(injection_solver, import_solver, consistency_check)
+        self.max_workers = max_workers
+        self.min_step_size = min_step_size
+        self.executor_factory = executor_factory or ProcessPoolExecutor
+
+    def _iterate_injection_plans(
+        self, module_steps: Sequence[Collection[Module]]
+    ) -> Iterable[ModuleInjectionPlan]:
+        executor: Optional[Executor] = None
+        try:
+            for module_step in module_steps:
+                if len(module_step) < self.min_step_size:
+                    yield from super()._iterate_injection_plans([module_step])
+                    continue
+                if executor is None:
+                    executor = self.executor_factory(self.max_workers)
+                yield from self._solve_step(executor, module_step)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    def _solve_step(
+        self, executor: Executor, module_step: Collection[Module]
+    ) -> Iterable[ModuleInjectionPlan]:
+        modules = [*module_step]
+        problems = [self._injection_problem(module) for module in modules]
+        futures = [self._submit(executor, problem) for problem in problems]
+        # plans are reattached in step order, so result does not depend
+        # on order in which workers finish
+        for module, problem, future in zip(modules, problems, futures):
+            solution = self._solution(future)
+            if solution is None:
+                solve = self.injection_solver.solve
+            else:
+                solve = _SolutionReattach(solution, self.injection_solver.solve).solve
+            yield self._module_injection_plan(module, problem, solve)
+
+    def _submit(
+        self, executor: Executor, problem: InjectionProblem
+    ) -> Optional[Future]:
+        payload = self._payload(problem)
+        if payload is None:
+            return None
+        try:
+            return executor.submit(_solve_descriptor, payload)
+        except Exception:
+            # broken or shut down pool, problem is solved locally
+            return None
+
+    @staticmethod
+    def _solution(future: Optional[Future]) -> Optional[_Solution]:
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception:
+            # worker failures, e.g. types not importable in spawned worker
+            # or broken process pool, are solved locally
+            return None
+
+    def _payload(self, problem: InjectionProblem) -> Optional[bytes]:
+        selector: AssignmentFactorySelector = self.injection_solver.factory_selector
+        try:
+            descriptor: _ProblemDescriptor = (
+                [self._descriptor(element, None) for element in problem.imports],
+                [self._descriptor(element, selector) for element in problem.elements],
+            )
+            return pickle.dumps(descriptor, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            # problems referencing not importable types are solved locally
+            return None
+
+    @staticmethod
+    def _descriptor(
+        element: Element, selector: Optional[AssignmentFactorySelector]
+    ) -> _ElementDescriptor:
+        if selector is None:
+            return element.value().type, []
+        return (
+            element.value().type,
+            [
+                (dependency.arg, dependency.type, dependency.mandatory, factory)
+                for dependency in element.dependencies()
+                for factory in [selector.select(dependency)]
+            ],
+        )
+
+
+class _SolutionReattach:
+    def __init__(
+        self,
+        solution: _Solution,
+        fallback: Callable[[InjectionProblem], InjectionPlan],
+    ):
+        self.solution = solution
+        self.fallback = fallback
+        self._dependencies: Dict[Element, Dict[str, Dependency]] = {}
+
+    def solve(self, problem: InjectionProblem) -> InjectionPlan:
+        elements: List[Element] = [*problem.imports, *problem.elements]
+        kind, data = self.solution
+        if kind != "plan":
+            # errors are raised with live elements by local solver
+            return self.fallback(problem)
+        assignment_descriptors, stages = data
+        assignments = [
+            self._assignment(elements, descriptor)
+            for descriptor in assignment_descriptors
+        ]
+        return InjectionPlan(
+            assignments=assignments,
+            graph=DirectionalGraph(
+                nodes=elements,
+                edges=[
+                    InjectionGraphEdge(assignment.dependency, value)
+                    for assignment in assignments
+                    for value in assignment.values
+                ],
+            ),
+            stages=[{elements[index] for index in stage} for stage in stages],
+        )
+
+    def _assignment(
+        self, elements: Sequence[Element], descriptor: _AssignmentDescriptor
+    ) -> Assignment:
+        element, arg, mapper, values = descriptor
+        return Assignment(
+            mapper=mapper,
+            dependency=self._dependency(elements[element], arg),
+            values=[elements[value].value() for value in values],
+        )
+
+    def _dependency(self, element: Element, arg: str) -> Dependency:
+        dependencies = self._dependencies.get(element)
+        if dependencies is None:
+            dependencies = self._dependencies[element] = {
+                dependency.arg: dependency for dependency in element.dependencies()
+            }
+        return dependencies[arg]
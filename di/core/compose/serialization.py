@@ -0,0 +1,423 @@
+import hashlib
+import importlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Union
+
+from di.core.app import Application
+from di.core.assignment import (
+    Assignment,
+    AssignmentFactorySelector,
+    MixedIterableValuesMapper,
+    SingleValuesMapper,
+    ValuesMapper,
+)
+from di.core.compose.base import (
+    AbstractApplicationComposer,
+    ApplicationComposerError,
+    ComposedApplication,
+    ModuleBootstrapStep,
+    ModuleInjectionPlan,
+)
+from di.core.element import Dependency, Element
+from di.core.injection import InjectionGraphEdge
+from di.core.injectors import FactoryInjector, ValueInjector
+from di.core.module import Module, ModuleImportGraphEdge, ModuleImportPlan
+from di.utils.graph import DirectionalGraph
+
+_FORMAT_VERSION = 1
+
+
+class ComposedApplicationSerializationError(ApplicationComposerError):
+    pass
+
+
+class ComposedApplicationLoadError(ApplicationComposerError):
+    pass
+
+
+def _reference(obj) -> str:
+    module_name = getattr(obj, "__module__", None) or ""
+    qualname = getattr(obj, "__qualname__", None) or getattr(obj, "__name__", "")
+    return f"{module_name}:{qualname}"
+
+
+def _resolve_reference(reference: str):
+    module_name, qualname = reference.split(":", 1)
+    obj = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def element_key(element: Element) -> str:
+    injector = element.injector
+    if isinstance(injector, FactoryInjector):
+        return f"factory:{_reference(injector.factory)}"
+    if element.label:
+        return f"label:{element.label}"
+    if isinstance(injector, ValueInjector):
+        result = injector.result()
+        return f"value:{_reference(result and result.type)}"
+    raise ComposedApplicationSerializationError(
+        f"Element {element} has no factory nor label to reference"
+    )
+
+
+def _type_modules(type_) -> Iterable[str]:
+    if type_ is None:
+        return
+    module_name = getattr(type_, "__module__", None)
+    if module_name:
+        yield module_name
+    yield from _type_modules(getattr(type_, "__origin__", None))
+    for arg in getattr(type_, "__args__", None) or ():
+        yield from _type_modules(arg)
+
+
+class _ApplicationIndex:
+    def __init__(self, application: Application):
+        element_keys: Dict[Element, str] = {}
+        module_elements: Dict[Module, List[Element]] = {}
+        for module in application.modules:
+            keys = {}
+            for element in module.elements:
+                key = element_keys[element] = element_key(element)
+                if key in keys:
+                    raise ComposedApplicationSerializationError(
+                        f"Elements {keys[key]} and {element} share key {key!r}"
+                    )
+                keys[key] = element
+            module_elements[module] = sorted(module.elements, key=element_keys.get)
+
+        module_keys = {
+            module: self._module_key(module, [element_keys[e] for e in elements])
+            for module, elements in module_elements.items()
+        }
+        if len({*module_keys.values()}) != len(module_keys):
+            raise ComposedApplicationSerializationError("Modules share the same key")
+
+        self.element_keys = element_keys
+        self.module_keys = module_keys
+        self.modules: List[Module] = sorted(module_keys, key=module_keys.get)
+        self.module_index = {module: index for index, module in enumerate(self.modules)}
+        self.elements: List[Element] = [
+            element for module in self.modules for element in module_elements[module]
+        ]
+        self.element_index = {
+            element: index for index, element in enumerate(self.elements)
+        }
+
+    @staticmethod
+    def _module_key(module: Module, element_keys: Sequence[str]) -> str:
+        if module.name:
+            return f"name:{module.name}"
+        digest = hashlib.sha1("\n".join(element_keys).encode("utf-8")).hexdigest()
+        return f"elements:{digest}"
+
+    def elements_of(self, indices: Iterable[int]) -> Set[Element]:
+        return {self.elements[index] for index in indices}
+
+    def indices_of(self, elements: Iterable[Element]) -> List[int]:
+        return sorted(self.element_index[element] for element in elements)
+
+    def modules_indices(self, modules: Iterable[Module]) -> List[int]:
+        return sorted(self.module_index[module] for module in modules)
+
+    def fingerprint(self, selector: Optional[AssignmentFactorySelector] = None) -> str:
+        # structure of modules and elements together with contents
+        # of python modules defining factories and types they use,
+        # selected assignment factories cover aggregation configuration
+        python_modules: Set[str] = set()
+        elements = []
+        for element in self.elements:
+            injector = element.injector
+            if isinstance(injector, FactoryInjector):
+                python_modules.add(getattr(injector.factory, "__module__", None) or "")
+            result = element.value().type
+            python_modules.update(_type_modules(result))
+            dependencies = []
+            for dependency in element.dependencies():
+                python_modules.update(_type_modules(dependency.type))
+                entry = [dependency.arg, repr(dependency.type), dependency.mandatory]
+                if selector is not None:
+                    entry.append(_reference(type(selector.select(dependency))))
+                dependencies.append(entry)
+            elements.append([self.element_keys[element], repr(result), dependencies])
+        structure = {
+            "modules": [
+                [
+                    self.module_keys[module],
+                    self.modules_indices(module.imports),
+                    self.indices_of(module.exports),
+                    self.indices_of(module.bootstrap),
+                ]
+                for module in self.modules
+            ],
+            "elements": elements,
+            "sources": {
+                name: self._source_digest(name) for name in sorted(python_modules)
+            },
+        }
+        data = json.dumps(structure, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def _source_digest(module_name: str) -> Optional[str]:
+        path = getattr(sys.modules.get(module_name), "__file__", None)
+        if not path:
+            return None
+        try:
+            with open(path, "rb") as fp:
+                return hashlib.sha256(fp.read()).hexdigest()
+        except OSError:
+            return None
+
+
+def _dump_mapper(mapper: ValuesMapper) -> Any:
+    if type(mapper) is SingleValuesMapper:
+        return {"single": True}
+    if type(mapper) is MixedIterableValuesMapper:
+        return {
+            "container": _reference(mapper.container_factory),
+            "iterate": [bool(arg) for arg in mapper.iterate_args],
+        }
+    raise ComposedApplicationSerializationError(
+        f"Values mapper {mapper!r} is not serializable"
+    )
+
+
+def _load_mapper(data: Any) -> ValuesMapper:
+    if "single" in data:
+        return SingleValuesMapper()
+    return MixedIterableValuesMapper(
+        container_factory=_resolve_reference(data["container"]),
+        iterate_args=data["iterate"],
+    )
+
+
+def dump_composed(
+    composed: ComposedApplication,
+    selector: Optional[AssignmentFactorySelector] = None,
+) -> Dict[str, Any]:
+    index = _ApplicationIndex(composed.application)
+    element_index = index.element_index
+    return {
+        "version": _FORMAT_VERSION,
+        "fingerprint": index.fingerprint(selector),
+        "modules": [index.module_keys[module] for module in index.modules],
+        "elements": [index.element_keys[element] for element in index.elements],
+        "import_steps": [
+            index.modules_indices(step) for step in composed.import_plan.steps
+        ],
+        "injection_plans": [
+            {
+                "module": index.module_index[plan.module],
+                "assignments": [
+                    [
+                        element_index[assignment.dependency.source],
+                        assignment.dependency.arg,
+                        _dump_mapper(assignment.mapper),
+                        [element_index[value.source] for value in assignment.values],
+                    ]
+                    for assignment in plan.assignments
+                ],
+                "stages": [index.indices_of(stage) for stage in plan.stages],
+            }
+            for plan in composed.injection_plans
+        ],
+        "bootstrap_steps": [
+            {
+                "module": index.module_index[step.module],
+                "steps": [index.indices_of(stage) for stage in step.steps],
+            }
+            for step in composed.bootstrap_steps
+        ],
+    }
+
+
+class _ComposedApplicationLoader:
+    def __init__(
+        self,
+        application: Application,
+        data: Dict[str, Any],
+        selector: Optional[AssignmentFactorySelector] = None,
+    ):
+        self.application = application
+        self.data = data
+        self.selector = selector
+        self.index = _ApplicationIndex(application)
+        self._dependencies: Dict[Element, Dict[str, Dependency]] = {}
+
+    def load(self) -> ComposedApplication:
+        self._validate()
+        index = self.index
+        import_steps = [
+            {index.modules[module] for module in step}
+            for step in self.data["import_steps"]
+        ]
+        injection_plans = [
+            self._injection_plan(plan) for plan in self.data["injection_plans"]
+        ]
+        bootstrap_steps = [
+            ModuleBootstrapStep(
+                module=index.modules[step["module"]],
+                steps=[index.elements_of(stage) for stage in step["steps"]],
+            )
+            for step in self.data["bootstrap_steps"]
+        ]
+        return ComposedApplication(
+            application=self.application,
+            import_plan=ModuleImportPlan(
+                graph=self._import_graph(), steps=import_steps
+            ),
+            injection_plans=injection_plans,
+            bootstrap_steps=bootstrap_steps,
+        )
+
+    def _validate(self):
+        data = self.data
+        if data.get("version") != _FORMAT_VERSION:
+            raise ComposedApplicationLoadError("Unsupported format version")
+        index = self.index
+        if data["modules"] != [index.module_keys[module] for module in index.modules]:
+            raise ComposedApplicationLoadError("Modules do not match")
+        if data["elements"] != [index.element_keys[e] for e in index.elements]:
+            raise ComposedApplicationLoadError("Elements do not match")
+        if data["fingerprint"] != index.fingerprint(self.selector):
+            raise ComposedApplicationLoadError("Fingerprint does not match")
+
+    def _import_graph(self):
+        modules = self.application.modules
+        return DirectionalGraph(
+            nodes=modules,
+            edges=[
+                ModuleImportGraphEdge(module, imported)
+                for module in modules
+                for imported in module.imports
+            ],
+        )
+
+    def _injection_plan(self, data: Dict[str, Any]) -> ModuleInjectionPlan:
+        module = self.index.modules[data["module"]]
+        assignments = [
+            self._assignment(*assignment) for assignment in data["assignments"]
+        ]
+        graph = DirectionalGraph(
+            nodes=[*module.imported_elements, *module.elements],
+            edges=[
+                InjectionGraphEdge(assignment.dependency, value)
+                for assignment in assignments
+                for value in assignment.values
+            ],
+        )
+        return ModuleInjectionPlan(
+            module=module,
+            assignments=assignments,
+            graph=graph,
+            stages=[self.index.elements_of(stage) for stage in data["stages"]],
+        )
+
+    def _assignment(
+        self, element: int, arg: str, mapper: Any, values: Sequence[int]
+    ) -> Assignment:
+        elements = self.index.elements
+        return Assignment(
+            mapper=_load_mapper(mapper),
+            dependency=self._dependency(elements[element], arg),
+            values=[elements[value].value() for value in values],
+        )
+
+    def _dependency(self, element: Element, arg: str) -> Dependency:
+        dependencies = self._dependencies.get(element)
+        if dependencies is None:
+            dependencies = self._dependencies[element] = {
+                dependency.arg: dependency for dependency in element.dependencies()
+            }
+        return dependencies[arg]
+
+
+def load_composed(
+    application: Application,
+    data: Dict[str, Any],
+    selector: Optional[AssignmentFactorySelector] = None,
+) -> ComposedApplication:
+    try:
+        return _ComposedApplicationLoader(application, data, selector).load()
+    except ComposedApplicationLoadError:
+        raise
+    except (KeyError, IndexError, TypeError, ValueError, ImportError) as error:
+        raise ComposedApplicationLoadError(f"Invalid composed application: {error}")
+
+
+def save_composed(
+    composed: ComposedApplication,
+    path: Union[str, os.PathLike],
+    selector: Optional[AssignmentFactorySelector] = None,
+):
+    data = dump_composed(composed, selector)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fp:
+            json.dump(data, fp, separators=(",", ":"))
+        os.replace(tmp_path, str(path))
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def read_composed(
+    application: Application,
+    path: Union[str, os.PathLike],
+    selector: Optional[AssignmentFactorySelector] = None,
+) -> ComposedApplication:
+    try:
+        with open(path, "r", encoding="utf-8") as fp:
+            data = json.load(fp)
+    except (OSError, ValueError) as error:
+        raise ComposedApplicationLoadError(f"Can not read {path}: {error}")
+    return load_composed(application, data, selector)
+
+
+class StoredApplicationComposer(AbstractApplicationComposer):
+    def __init__(
+        self,
+        composer: AbstractApplicationComposer,
+        path: Union[str, os.PathLike],
+        on_error: Optional[Callable[[Exception], None]] = None,
+        selector: Optional[AssignmentFactorySelector] = None,
+    ):
+        self.composer = composer
+        self.path = path
+        self.on_error = on_error
+        self.selector = selector or self._composer_selector(composer)
+
+    @staticmethod
+    def _composer_selector(
+        composer: AbstractApplicationComposer,
+    ) -> Optional[AssignmentFactorySelector]:
+        # stored plan is valid only for the same aggregation configuration
+        solver = getattr(composer, "injection_solver", None)
+        return getattr(solver, "factory_selector", None)
+
+    def compose(self, application: Application) -> ComposedApplication:
+        try:
+            return read_composed(application, self.path, self.selector)
+        except ApplicationComposerError as error:
+            self._error(error)
+        composed = self.composer.compose(application)
+        try:
+            save_composed(composed, self.path, self.selector)
+        except (ComposedApplicationSerializationError, OSError) as error:
+            self._error(error)
+        return composed
+
+    def _error(self, error: Exception):
+        if self.on_error:
+            self.on_error(error)
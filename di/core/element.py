@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, Iterable, MutableMapping, Optional, Type
+from typing import Any, Iterable, Mapping, MutableMapping, Optional, Type
 
 
 @dataclass
@@ -91,6 +91,24 @@ class ProvideStrategy:
         raise NotImplementedError
 
 
+class ProvideObserver:
+    # all events are optional, default implementations do nothing
+    def before_create(self, element: Element):
+        pass
+
+    def after_create(self, element: Element, value: Any):
+        pass
+
+    def cache_hit(self, element: Element, value: Any):
+        pass
+
+    def error(self, element: Element, error: Exception):
+        pass
+
+    def scope_exit(self, scope: str, values: Mapping[Element, Any]):
+        pass
+
+
 __all__ = [
     "InjectorDependency",
     "InjectionResult",
@@ -101,4 +119,5 @@ __all__ = [
     "Element",
     "ProvideContext",
     "ProvideStrategy",
+    "ProvideObserver",
 ]
@@ -5,6 +5,7 @@ from di.core.assignment import (
     AssignmentError,
     AssignmentFactorySelector,
     DirectAssignmentFactorySelector,
+    IndexedValues,
 )
 from di.core.element import Dependency, Element, Value
 from di.core.injection.base import (
@@ -19,7 +20,7 @@ from di.core.injection.base import (
 from di.utils.graph import (
     DirectionalGraph,
     DirectionalGraphIteratorError,
-    DirectionalGraphTopologyIterator,
+    DirectionalGraphKahnIterator,
 )
 
 
@@ -53,6 +54,10 @@ class InjectionSolver(AbstractInjectionSolver):
         self._cache = _InjectionSolverCache()
         self._factory_selector = factory_selector or DirectAssignmentFactorySelector()
 
+    @property
+    def factory_selector(self) -> AssignmentFactorySelector:
+        return self._factory_selector
+
     def solve(self, problem: InjectionProblem) -> InjectionPlan:
         assignments = [*self._iterate_assignments(problem)]
         graph = self._create_graph([*problem.imports, *problem.elements], assignments)
@@ -65,7 +70,7 @@ class InjectionSolver(AbstractInjectionSolver):
 
     def _iterate_assignments(self, problem: InjectionProblem):
         selector = self._factory_selector
-        values = {*self._cache.values(*problem.imports, *problem.elements)}
+        values = IndexedValues(self._cache.values(*problem.imports, *problem.elements))
         for dependency in self._cache.dependencies(*problem.elements):
             factory = selector.select(dependency)
             try:
@@ -93,6 +98,6 @@ class InjectionSolver(AbstractInjectionSolver):
     @staticmethod
     def _create_stages(graph: InjectionGraph) -> List[Set[Element]]:
         try:
-            return [*DirectionalGraphTopologyIterator(graph)]
+            return [*DirectionalGraphKahnIterator(graph)]
         except DirectionalGraphIteratorError:
             raise InjectionSolverCyclicDependencyError
@@ -1,7 +1,7 @@
 from typing import Callable, Iterable, Optional, Type
 
 from di.core.element import InjectionResult, Injector, InjectorDependency
-from di.utils.inspection import FactoryInspection
+from di.utils.inspection import FactoryInspection, FactoryInspectionCache
 
 
 class FactoryInjector(Injector):
@@ -9,26 +9,34 @@ class FactoryInjector(Injector):
         self,
         factory: Callable,
         force_type: Optional[Type] = None,
+        inspection_cache: Optional[FactoryInspectionCache] = None,
     ):
         self._factory = factory
-        inspection = FactoryInspection(factory)
-        self._args = inspection.args
-        self._optional_args = inspection.optional_args
-        self._args_annotations = inspection.args_annotations
-        self._return_type = force_type or inspection.return_type
+        self._force_type = force_type
+        if inspection_cache:
+            self._inspection = inspection_cache.inspect(factory)
+        else:
+            self._inspection = FactoryInspection(factory)
+
+    @property
+    def factory(self) -> Callable:
+        return self._factory
 
     def dependencies(self) -> Iterable[InjectorDependency]:
+        inspection = self._inspection
+        args_annotations = inspection.args_annotations
+        optional_args = inspection.optional_args
         return [
             InjectorDependency(
                 arg=arg,
-                type=self._args_annotations.get(arg),
-                mandatory=arg not in self._optional_args,
+                type=args_annotations.get(arg),
+                mandatory=arg not in optional_args,
             )
-            for arg in self._args
+            for arg in inspection.args
         ]
 
     def result(self) -> Optional[InjectionResult]:
-        return InjectionResult(type=self._return_type)
+        return InjectionResult(type=self._force_type or self._inspection.return_type)
 
     def __call__(self, *args, **kwargs):
         return self._factory(*args, **kwargs)
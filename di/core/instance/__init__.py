@@ -1,25 +1,96 @@
+from di.core.instance.asynchronous import (
+    AsyncProvideContext,
+    AsyncRecursiveApplicationInstance,
+    AsyncRecursiveApplicationInstanceBuilder,
+)
 from di.core.instance.base import (
     ApplicationInstance,
+    ApplicationInstanceBootstrapError,
     ApplicationInstanceBuilder,
+    ApplicationInstanceCloseError,
     ApplicationInstanceElementNotFound,
     ApplicationInstanceError,
     ApplicationInstanceStateError,
+    AsyncApplicationInstance,
+    AsyncApplicationInstanceBuilder,
+    BootstrapExecutor,
+    ValuesCacheInfo,
+)
+from di.core.instance.bootstrap import ThreadPoolBootstrapExecutor, bootstrap_stages
+from di.core.instance.compiled import (
+    CompiledApplicationInstance,
+    CompiledApplicationInstanceBuilder,
+    CompiledProvideContext,
+)
+from di.core.instance.iterative import (
+    IterativeApplicationInstanceBuilder,
+    IterativeProvideContext,
 )
 from di.core.instance.recursive import (
     RecursiveApplicationInstance,
     RecursiveApplicationInstanceBuilder,
     RecursiveProvideContext,
 )
+from di.core.instance.teardown import InstanceTeardown, teardown_stages
+from di.core.instance.threadsafe import (
+    ElementLocks,
+    ThreadSafeApplicationInstanceBuilder,
+    ThreadSafeProvideContext,
+)
+from di.core.instance.timing import (
+    ConstructionReport,
+    ElementTiming,
+    TimedApplicationInstance,
+    TimedApplicationInstanceBuilder,
+    TimedProvideContext,
+    construction_report,
+    element_name,
+)
 
 __all__ = [
     # base
     "ApplicationInstance",
+    "ApplicationInstanceBootstrapError",
     "ApplicationInstanceBuilder",
+    "ApplicationInstanceCloseError",
     "ApplicationInstanceElementNotFound",
     "ApplicationInstanceError",
     "ApplicationInstanceStateError",
+    "AsyncApplicationInstance",
+    "AsyncApplicationInstanceBuilder",
+    "BootstrapExecutor",
+    "ValuesCacheInfo",
+    # asynchronous
+    "AsyncProvideContext",
+    "AsyncRecursiveApplicationInstance",
+    "AsyncRecursiveApplicationInstanceBuilder",
+    # bootstrap
+    "ThreadPoolBootstrapExecutor",
+    "bootstrap_stages",
+    # compiled
+    "CompiledApplicationInstance",
+    "CompiledApplicationInstanceBuilder",
+    "CompiledProvideContext",
+    # iterative
+    "IterativeApplicationInstanceBuilder",
+    "IterativeProvideContext",
     # recurrent
     "RecursiveApplicationInstance",
     "RecursiveApplicationInstanceBuilder",
     "RecursiveProvideContext",
+    # teardown
+    "InstanceTeardown",
+    "teardown_stages",
+    # threadsafe
+    "ElementLocks",
+    "ThreadSafeApplicationInstanceBuilder",
+    "ThreadSafeProvideContext",
+    # timing
+    "ConstructionReport",
+    "ElementTiming",
+    "TimedApplicationInstance",
+    "TimedApplicationInstanceBuilder",
+    "TimedProvideContext",
+    "construction_report",
+    "element_name",
 ]
@@ -0,0 +1,234 @@
+import asyncio
+import inspect
+import warnings
+from typing import Any, Dict, Iterable, Optional, Sequence, Type, Union
+
+from di.core.compose import ComposedApplication
+from di.core.element import Element, ProvideObserver
+from di.core.instance.base import (
+    ApplicationInstanceBootstrapError,
+    ApplicationInstanceElementNotFound,
+    ApplicationInstanceStateError,
+    AsyncApplicationInstance,
+    AsyncApplicationInstanceBuilder,
+)
+from di.core.instance.recursive import RecursiveProvideContext
+from di.core.module import Module, ModuleRelated
+from di.core.navigator import ApplicationNavigator
+from di.core.provide_strategies import (
+    LazySingletonProvideStrategy,
+    LocalProvideStrategy,
+    PendingScopeValue,
+    ProvideScope,
+    ScopedProvideStrategy,
+    SingletonProvideStrategy,
+)
+from di.utils.profiling import profile_span
+
+_missing = object()
+
+
+async def _resolve(value):
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+class AsyncProvideContext(RecursiveProvideContext):
+    def __init__(self, app: ComposedApplication):
+        super().__init__(app)
+        self._pending: Dict[Element, "asyncio.Future[Any]"] = {}
+
+    async def boot_async(self):
+        elements = self._bootstrap_elements
+        results = await asyncio.gather(
+            *(self.provide_async(element) for element in elements),
+            return_exceptions=True,
+        )
+        errors = {
+            element: result
+            for element, result in zip(elements, results)
+            if isinstance(result, BaseException)
+        }
+        if errors:
+            raise ApplicationInstanceBootstrapError(errors)
+
+    def eval(self, element: Element):
+        # strategies not aware of async context get awaitable value
+        # resolved by provide_async
+        return self.eval_async(element)
+
+    async def eval_async(self, element: Element):
+        if not self.has(element):
+            raise ApplicationInstanceStateError(f"Missing element {element}")
+        if self.observers:
+            return await self._observed_eval_async(element)
+        return await self._create_async(element)
+
+    async def _observed_eval_async(self, element: Element):
+        observers = self.observers
+        for observer in observers:
+            observer.before_create(element)
+        try:
+            value = await self._create_async(element)
+        except Exception as error:
+            for observer in observers:
+                observer.error(element, error)
+            raise
+        for observer in observers:
+            observer.after_create(element, value)
+        return value
+
+    async def _create_async(self, element: Element):
+        assignments = self._assignments[element]
+        values = await asyncio.gather(
+            *(
+                asyncio.gather(
+                    *(self.provide_async(value.source) for value in assignment.values)
+                )
+                for assignment in assignments
+            )
+        )
+        kwargs = {
+            assignment.dependency.arg: assignment.mapper.map(assignment_values)
+            for assignment, assignment_values in zip(assignments, values)
+        }
+        return await _resolve(element.injector(**kwargs))
+
+    def provide(self, element: Element):
+        return self.provide_async(element)
+
+    async def provide_async(self, element: Element):
+        strategy = element.strategy
+        if self.observers and element in self.global_state:
+            value = self.global_state[element]
+            for observer in self.observers:
+                observer.cache_hit(element, value)
+            return value
+        # attribute access can not await, so lazy singletons are eager here
+        if type(strategy) in (SingletonProvideStrategy, LazySingletonProvideStrategy):
+            return await self._provide_singleton(element)
+        if type(strategy) is LocalProvideStrategy:
+            return await self.eval_async(element)
+        if type(strategy) is ScopedProvideStrategy:
+            return await self._provide_scoped(strategy, element)
+        return await _resolve(strategy.provide(self, element))
+
+    async def _provide_singleton(self, element: Element):
+        state = self.global_state
+        if element in state:
+            return state[element]
+        pending = self._pending.get(element)
+        if pending is None:
+            pending = asyncio.ensure_future(self._create_singleton(element))
+            self._pending[element] = pending
+        return await asyncio.shield(pending)
+
+    async def _create_singleton(self, element: Element):
+        try:
+            value = self.global_state[element] = await self.eval_async(element)
+        finally:
+            del self._pending[element]
+        return value
+
+    async def _provide_scoped(self, strategy: ScopedProvideStrategy, element: Element):
+        # scope state keeps pending creation, so concurrent consumers share
+        # single creation, created value replaces it in state
+        state = strategy.state()
+        entry = state.get(element, _missing)
+        if entry is not _missing and type(entry) is not PendingScopeValue:
+            return entry
+        if entry is _missing:
+            entry = state[element] = PendingScopeValue(
+                asyncio.ensure_future(self.eval_async(element))
+            )
+        try:
+            value = await asyncio.shield(entry.future)
+        except BaseException:
+            if entry.future.done() and state.get(element) is entry:
+                del state[element]
+            raise
+        if state.get(element) is entry:
+            state[element] = value
+        return value
+
+
+class AsyncRecursiveApplicationInstance(AsyncApplicationInstance):
+    def __init__(
+        self,
+        app: ComposedApplication,
+        ctx: AsyncProvideContext,
+        navigator: Optional[ApplicationNavigator] = None,
+    ):
+        self._navigator = navigator or ApplicationNavigator(app.application)
+        self._ctx = ctx
+
+    async def values_by_type(
+        self,
+        type_: Type,
+        module: Optional[Union[Module, ModuleRelated, str]] = None,
+        strict: bool = True,
+    ) -> Iterable[Any]:
+        elements = self._navigator.by_type(type_=type_, module=module, strict=strict)
+        return await asyncio.gather(*(self.value_of(element) for element in elements))
+
+    async def value_of(self, element: Element):
+        if not self._ctx.has(element):
+            raise ApplicationInstanceElementNotFound(element=element)
+        return await self._ctx.provide_async(element)
+
+    async def aclose(self, timeout: Optional[float] = None):
+        await self._ctx.teardown(timeout=timeout).aclose()
+
+    def add_observer(self, observer: ProvideObserver):
+        self._ctx.add_observer(observer)
+
+    def scope(self, name: str = "request") -> ProvideScope:
+        return ProvideScope(name, observers=self._ctx.observers)
+
+
+class AsyncRecursiveApplicationInstanceBuilder(AsyncApplicationInstanceBuilder):
+    def __init__(
+        self,
+        app: ComposedApplication,
+        eager_type_index: bool = False,
+        observers: Sequence[ProvideObserver] = (),
+    ):
+        self.app = app
+        self.eager_type_index = eager_type_index
+        self.observers = observers
+        self._warn_lazy()
+
+    def _warn_lazy(self):
+        lazy = [
+            element
+            for element in self.app.application.elements
+            if type(element.strategy) is LazySingletonProvideStrategy
+        ]
+        if lazy:
+            warnings.warn(
+                f"Async instance creates lazy singletons {lazy} eagerly, "
+                f"attribute access of lazy proxy could not await their creation",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+
+    async def build(self) -> AsyncRecursiveApplicationInstance:
+        provide_context = self._provide_context()
+        for observer in self.observers:
+            provide_context.add_observer(observer)
+        with profile_span(
+            "bootstrap",
+            "bootstrap",
+            elements=len(provide_context.bootstrap_elements),
+        ):
+            await provide_context.boot_async()
+        navigator = ApplicationNavigator(
+            self.app.application, eager_type_index=self.eager_type_index
+        )
+        return AsyncRecursiveApplicationInstance(
+            app=self.app, ctx=provide_context, navigator=navigator
+        )
+
+    def _provide_context(self):
+        return AsyncProvideContext(self.app)
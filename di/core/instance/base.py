@@ -1,7 +1,10 @@
-from typing import Any, Iterable, Optional, Type, Union
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping, Optional, Type, Union
 
-from di.core.element import Element
+from di.core.compose import ComposedApplication
+from di.core.element import Element, ProvideContext
 from di.core.module import Module, ModuleRelated
+from di.core.provide_strategies import ProvideScope
 
 
 class ApplicationInstanceStateError(AssertionError):
@@ -18,6 +21,28 @@ class ApplicationInstanceElementNotFound(ApplicationInstanceError):
         self.element = element
 
 
+class ApplicationInstanceBootstrapError(ApplicationInstanceError):
+    def __init__(self, errors: Mapping[Element, BaseException]):
+        elements = ", ".join(str(element) for element in errors)
+        super().__init__(f"Bootstrap failed for elements {elements}")
+        self.errors = errors
+
+
+class ApplicationInstanceCloseError(ApplicationInstanceError):
+    def __init__(self, errors: Mapping[Element, BaseException]):
+        elements = ", ".join(str(element) for element in errors)
+        super().__init__(f"Closing failed for elements {elements}")
+        self.errors = errors
+
+
+@dataclass(frozen=True)
+class ValuesCacheInfo:
+    hits: int
+    misses: int
+    bypassed: int
+    currsize: int
+
+
 class ApplicationInstance:
     def values_by_type(
         self,
@@ -30,7 +55,48 @@ class ApplicationInstance:
     def value_of(self, element: Element):
         raise NotImplementedError
 
+    def scope(self, name: str = "request") -> ProvideScope:
+        return ProvideScope(name)
+
+    def fork(self) -> "ApplicationInstance":
+        raise NotImplementedError
+
+    def close(self, timeout: Optional[float] = None):
+        raise NotImplementedError
+
+    async def aclose(self, timeout: Optional[float] = None):
+        raise NotImplementedError
+
 
 class ApplicationInstanceBuilder:
     def build(self) -> ApplicationInstance:
         raise NotImplementedError
+
+
+class AsyncApplicationInstance:
+    async def values_by_type(
+        self,
+        type_: Type,
+        module: Optional[Union[Module, ModuleRelated, str]] = None,
+        strict: bool = True,
+    ) -> Iterable[Any]:
+        raise NotImplementedError
+
+    async def value_of(self, element: Element):
+        raise NotImplementedError
+
+    def scope(self, name: str = "request") -> ProvideScope:
+        return ProvideScope(name)
+
+    async def aclose(self, timeout: Optional[float] = None):
+        raise NotImplementedError
+
+
+class AsyncApplicationInstanceBuilder:
+    async def build(self) -> AsyncApplicationInstance:
+        raise NotImplementedError
+
+
+class BootstrapExecutor:
+    def boot(self, app: ComposedApplication, ctx: ProvideContext):
+        raise NotImplementedError
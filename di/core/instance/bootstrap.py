@@ -0,0 +1,93 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Collection, Dict, Iterable, List, Optional, Set
+
+from di.core.compose import ComposedApplication
+from di.core.element import Element
+from di.core.instance.base import ApplicationInstanceBootstrapError, BootstrapExecutor
+from di.core.instance.recursive import RecursiveProvideContext
+from di.core.provide_strategies import SingletonProvideStrategy
+
+
+class ThreadPoolBootstrapExecutor(BootstrapExecutor):
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers
+
+    def boot(self, app: ComposedApplication, ctx: RecursiveProvideContext):
+        stages = bootstrap_stages(app)
+        if not stages:
+            return
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for stage in stages:
+                futures = [
+                    (element, pool.submit(ctx.provide, element)) for element in stage
+                ]
+                errors = {}
+                for element, future in futures:
+                    error = future.exception()
+                    if error is not None:
+                        errors[element] = error
+                if errors:
+                    raise ApplicationInstanceBootstrapError(errors)
+
+
+def bootstrap_stages(app: ComposedApplication) -> List[Collection[Element]]:
+    # bootstrap elements and singletons they require are grouped by depth,
+    # so every stage task depends only on singletons created by previous stages
+    # and each singleton is created exactly once
+    dependencies = _dependencies(app)
+    required = _required(app, dependencies)
+    levels: Dict[Element, int] = {}
+    stages: List[Set[Element]] = []
+    for element in _topology_order(app):
+        level = 1 + max(
+            (levels[dependency] for dependency in dependencies.get(element, ())),
+            default=-1,
+        )
+        levels[element] = level
+        if element not in required:
+            continue
+        while len(stages) <= level:
+            stages.append(set())
+        stages[level].add(element)
+    return [stage for stage in stages if stage]
+
+
+def _dependencies(app: ComposedApplication) -> Dict[Element, List[Element]]:
+    dependencies: Dict[Element, List[Element]] = {}
+    for injection_plan in app.injection_plans:
+        for assignment in injection_plan.assignments:
+            sources = dependencies.setdefault(assignment.dependency.source, [])
+            sources.extend(value.source for value in assignment.values)
+    return dependencies
+
+
+def _required(
+    app: ComposedApplication, dependencies: Dict[Element, List[Element]]
+) -> Set[Element]:
+    to_visit = [
+        element
+        for module_step in app.bootstrap_steps
+        for step in module_step.steps
+        for element in step
+    ]
+    required = set(to_visit)
+    visited = set(to_visit)
+    while to_visit:
+        element = to_visit.pop()
+        for dependency in dependencies.get(element, ()):
+            if dependency in visited:
+                continue
+            visited.add(dependency)
+            to_visit.append(dependency)
+            if type(dependency.strategy) is SingletonProvideStrategy:
+                required.add(dependency)
+    return required
+
+
+def _topology_order(app: ComposedApplication) -> Iterable[Element]:
+    for injection_plan in app.injection_plans:
+        owned = injection_plan.module.elements
+        for stage in injection_plan.stages:
+            for element in stage:
+                if element in owned:
+                    yield element
@@ -0,0 +1,274 @@
+import keyword
+import linecache
+import sys
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple
+
+from di.core.assignment import Assignment, MixedIterableValuesMapper, SingleValuesMapper
+from di.core.compose import ComposedApplication
+from di.core.element import Element, Injector, ProvideObserver
+from di.core.injectors import FactoryInjector
+from di.core.instance.base import (
+    ApplicationInstanceElementNotFound,
+    ApplicationInstanceStateError,
+)
+from di.core.instance.iterative import IterativeProvideContext
+from di.core.instance.recursive import (
+    RecursiveApplicationInstance,
+    RecursiveApplicationInstanceBuilder,
+)
+from di.core.provide_strategies import LocalProvideStrategy, SingletonProvideStrategy
+
+Thunk = Callable[[], Any]
+
+# thunk of dependency chain level takes up to this many frames
+# (singleton thunk, generated call, mapping of aggregated values)
+_FRAMES_PER_LEVEL = 3
+# frames left for caller of instance and for factories
+_RESERVED_FRAMES = 200
+
+# generated call factories by source, registered in linecache,
+# so tracebacks and debuggers show generated code
+_generated: Dict[str, Callable[..., Thunk]] = {}
+
+
+def _is_keyword_arg(arg: str) -> bool:
+    return arg.isidentifier() and not keyword.iskeyword(arg)
+
+
+def _max_depth() -> int:
+    return max((sys.getrecursionlimit() - _RESERVED_FRAMES) // _FRAMES_PER_LEVEL, 1)
+
+
+def _generated_factory(args: Sequence[str]) -> Callable[..., Thunk]:
+    call_args = ", ".join(f"{arg}=thunk{index}()" for index, arg in enumerate(args))
+    thunks = "".join(f", thunk{index}" for index in range(len(args)))
+    source = (
+        f"def _factory(call{thunks}):\n"
+        f"    def _create():\n"
+        f"        return call({call_args})\n"
+        f"    return _create\n"
+    )
+    factory = _generated.get(source)
+    if factory is None:
+        filename = f"<di compiled call {len(_generated)}>"
+        linecache.cache[filename] = (
+            len(source),
+            None,
+            source.splitlines(keepends=True),
+            filename,
+        )
+        namespace: Dict[str, Any] = {}
+        exec(compile(source, filename, "exec"), namespace)
+        factory = _generated[source] = namespace["_factory"]
+    return factory
+
+
+# elements with dependency chains deeper than recursion limit allows
+# are provided by iterative engine, other elements by compiled thunks
+class CompiledProvideContext(IterativeProvideContext):
+    def __init__(self, app: ComposedApplication):
+        super().__init__(app)
+        self._order = [*self._compile_order(app)]
+        self._compile_all()
+
+    def _compile_all(self):
+        self._creators: Dict[Element, Thunk] = {}
+        self.thunks: Dict[Element, Thunk] = {}
+        self._depths: Dict[Element, int] = {}
+        max_depth = _max_depth()
+        for element in self._order:
+            if self._depth(element) > max_depth:
+                self._delegate(element)
+            else:
+                self._compile(element)
+
+    def _depth(self, element: Element) -> int:
+        # sources are ordered before their dependents
+        depth = self._depths[element] = 1 + max(
+            (self._depths.get(source, 0) for source in self.dependencies_of(element)),
+            default=0,
+        )
+        return depth
+
+    def _delegate(self, element: Element):
+        self._creators[element] = partial(IterativeProvideContext.eval, self, element)
+        self.thunks[element] = partial(IterativeProvideContext.provide, self, element)
+
+    def add_observer(self, observer: ProvideObserver):
+        super().add_observer(observer)
+        # thunks without observers do not check for them at all,
+        # so observed thunks replace them
+        self._compile_all()
+
+    def fork(self) -> "CompiledProvideContext":
+        forked = super().fork()
+        # thunks are bound to global state of compiled context
+        forked._compile_all()
+        return forked
+
+    @staticmethod
+    def _compile_order(app: ComposedApplication) -> Iterable[Element]:
+        for injection_plan in app.injection_plans:
+            owned = injection_plan.module.elements
+            for stage in injection_plan.stages:
+                for element in stage:
+                    if element in owned:
+                        yield element
+
+    def _compile(self, element: Element):
+        creator = self._compile_creator(element)
+        if self.observers:
+            creator = self._observed_creator(element, creator)
+        self._creators[element] = creator
+        self.thunks[element] = self._compile_thunk(element, creator)
+
+    def _compile_creator(self, element: Element) -> Thunk:
+        call = self._direct_call(element.injector)
+        bound = [
+            (assignment.dependency.arg, self._compile_assignment(assignment))
+            for assignment in self._assignments[element]
+        ]
+        if not bound:
+            return call
+        if all(_is_keyword_arg(arg) for arg, _ in bound):
+            return self._generate_call(call, bound)
+
+        def _create():
+            return call(**{arg: thunk() for arg, thunk in bound})
+
+        return _create
+
+    def _observed_creator(self, element: Element, creator: Thunk) -> Thunk:
+        observers = self.observers
+
+        def _create():
+            for observer in observers:
+                observer.before_create(element)
+            try:
+                value = creator()
+            except Exception as error:
+                for observer in observers:
+                    observer.error(element, error)
+                raise
+            for observer in observers:
+                observer.after_create(element, value)
+            return value
+
+        return _create
+
+    @staticmethod
+    def _generate_call(call: Callable, bound: Sequence[Tuple[str, Thunk]]) -> Thunk:
+        # generated function passes every argument by keyword
+        # without building intermediate kwargs dictionary
+        factory = _generated_factory([arg for arg, _ in bound])
+        return factory(call, *[thunk for _, thunk in bound])
+
+    @staticmethod
+    def _direct_call(injector: Injector) -> Callable:
+        if type(injector) is FactoryInjector:
+            return injector.factory
+        return injector
+
+    def _compile_assignment(self, assignment: Assignment) -> Thunk:
+        thunks = [self.thunks[value.source] for value in assignment.values]
+        mapper = assignment.mapper
+        if type(mapper) is SingleValuesMapper:
+            (thunk,) = thunks
+            return thunk
+        if type(mapper) is MixedIterableValuesMapper and not any(mapper.iterate_args):
+            container_factory = mapper.container_factory
+
+            def _aggregate():
+                return container_factory([thunk() for thunk in thunks])
+
+            return _aggregate
+
+        def _map():
+            return mapper.map([thunk() for thunk in thunks])
+
+        return _map
+
+    def _compile_thunk(self, element: Element, creator: Thunk) -> Thunk:
+        strategy = element.strategy
+        if type(strategy) is SingletonProvideStrategy:
+            if self.observers:
+                return self._observed_singleton(element, creator)
+            state = self.global_state
+
+            def _singleton():
+                try:
+                    return state[element]
+                except KeyError:
+                    pass
+                value = state[element] = creator()
+                return value
+
+            return _singleton
+        if type(strategy) is LocalProvideStrategy:
+            return creator
+
+        if self.observers:
+
+            def _observed_provide():
+                self._observe_cache_hit(element)
+                return strategy.provide(self, element)
+
+            return _observed_provide
+
+        def _provide():
+            return strategy.provide(self, element)
+
+        return _provide
+
+    def _observed_singleton(self, element: Element, creator: Thunk) -> Thunk:
+        state = self.global_state
+        observers = self.observers
+
+        def _singleton():
+            try:
+                value = state[element]
+            except KeyError:
+                pass
+            else:
+                for observer in observers:
+                    observer.cache_hit(element, value)
+                return value
+            value = state[element] = creator()
+            return value
+
+        return _singleton
+
+    def eval(self, element: Element):
+        creator = self._creators.get(element)
+        if creator is None:
+            raise ApplicationInstanceStateError(f"Missing element {element}")
+        return creator()
+
+    def provide(self, element: Element):
+        return self.thunks[element]()
+
+
+class CompiledApplicationInstance(RecursiveApplicationInstance):
+    _ctx: CompiledProvideContext
+
+    def value_of(self, element: Element):
+        thunk: Optional[Thunk] = self._ctx.thunks.get(element)
+        if thunk is None:
+            raise ApplicationInstanceElementNotFound(element=element)
+        return thunk()
+
+
+class CompiledApplicationInstanceBuilder(RecursiveApplicationInstanceBuilder):
+    def build(self) -> CompiledApplicationInstance:
+        provide_context = self._observed_provide_context()
+        self._boot(provide_context)
+        return CompiledApplicationInstance(
+            app=self.app,
+            ctx=provide_context,
+            navigator=self._navigator(),
+            bootstrap_executor=self.bootstrap_executor,
+        )
+
+    def _provide_context(self):
+        return CompiledProvideContext(self.app)
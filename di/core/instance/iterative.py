@@ -0,0 +1,201 @@
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from di.core.assignment import ValuesMapper
+from di.core.element import Element
+from di.core.instance.base import ApplicationInstanceStateError
+from di.core.instance.recursive import (
+    RecursiveApplicationInstanceBuilder,
+    RecursiveProvideContext,
+)
+from di.core.provide_strategies import LocalProvideStrategy, SingletonProvideStrategy
+
+_pending = object()
+
+
+class _ElementPlan:
+    __slots__ = "element", "sources", "args", "singleton", "local"
+
+    def __init__(
+        self,
+        element: Element,
+        sources: Sequence[Element],
+        args: Sequence[Tuple[str, ValuesMapper, int]],
+    ):
+        self.element = element
+        self.sources = sources
+        self.args = args
+        strategy_type = type(element.strategy)
+        self.singleton = strategy_type is SingletonProvideStrategy
+        self.local = strategy_type is LocalProvideStrategy
+
+
+class _Step:
+    # creates element from values of earlier steps (slots), or without args
+    # just provides it; skips are singleton steps whose dependencies start
+    # at this step, outermost first, all of them are skipped when cached
+    __slots__ = "plan", "args", "skips"
+
+    def __init__(
+        self,
+        plan: _ElementPlan,
+        args: Optional[Sequence[Tuple[str, ValuesMapper, Sequence[int]]]],
+    ):
+        self.plan = plan
+        self.args = args
+        self.skips: Sequence[int] = ()
+
+
+class _ScheduleFrame:
+    __slots__ = "plan", "sources", "slots", "start"
+
+    def __init__(self, plan: _ElementPlan, start: int):
+        self.plan = plan
+        self.sources: Iterator[Element] = iter(plan.sources)
+        self.slots: List[int] = []
+        self.start = start
+
+
+class IterativeProvideContext(RecursiveProvideContext):
+    def __init__(self, app):
+        super().__init__(app)
+        self._plans: Dict[Element, _ElementPlan] = {}
+        self._schedules: Dict[Element, Sequence[_Step]] = {}
+
+    def eval(self, element: Element):
+        if self.observers:
+            # observed creations are evaluated recursively with events
+            return super().eval(element)
+        return self._run(self._schedule(element), store_root=False)
+
+    def provide(self, element: Element):
+        if self.observers:
+            return super().provide(element)
+        plan = self._plan(element)
+        value = self._shortcut(plan)
+        if value is _pending:
+            value = self._run(self._schedule(element), store_root=True)
+        return value
+
+    def _plan(self, element: Element) -> _ElementPlan:
+        plan = self._plans.get(element)
+        if plan is None:
+            if not self.has(element):
+                raise ApplicationInstanceStateError(f"Missing element {element}")
+            assignments = self._assignments[element]
+            plan = self._plans[element] = _ElementPlan(
+                element=element,
+                sources=[
+                    value.source
+                    for assignment in assignments
+                    for value in assignment.values
+                ],
+                args=[
+                    (
+                        assignment.dependency.arg,
+                        assignment.mapper,
+                        len(assignment.values),
+                    )
+                    for assignment in assignments
+                ],
+            )
+        return plan
+
+    def _schedule(self, element: Element) -> Sequence[_Step]:
+        schedule = self._schedules.get(element)
+        if schedule is None:
+            schedule = self._schedules[element] = self._build_schedule(
+                self._plan(element)
+            )
+        return schedule
+
+    def _build_schedule(self, root: _ElementPlan) -> Sequence[_Step]:
+        # dependencies are ordered before dependents, in order
+        # of recursive creation; local elements get step for every use,
+        # singletons are created by single step and later only provided
+        steps: List[_Step] = []
+        created = set()
+        skips: Dict[int, List[int]] = {}
+        stack = [_ScheduleFrame(root, 0)]
+        while stack:
+            frame = stack[-1]
+            source = next(frame.sources, None)
+            if source is not None:
+                plan = self._plan(source)
+                if plan.local or (plan.singleton and source not in created):
+                    stack.append(_ScheduleFrame(plan, len(steps)))
+                else:
+                    frame.slots.append(len(steps))
+                    steps.append(_Step(plan, None))
+                continue
+            stack.pop()
+            plan = frame.plan
+            index = len(steps)
+            steps.append(_Step(plan, self._step_args(plan, frame.slots)))
+            if not stack:
+                break
+            stack[-1].slots.append(index)
+            if plan.singleton:
+                created.add(plan.element)
+                skips.setdefault(frame.start, []).append(index)
+        for start, indices in skips.items():
+            steps[start].skips = sorted(indices, reverse=True)
+        return steps
+
+    @staticmethod
+    def _step_args(
+        plan: _ElementPlan, slots: Sequence[int]
+    ) -> Sequence[Tuple[str, ValuesMapper, Sequence[int]]]:
+        args = []
+        start = 0
+        for arg, mapper, count in plan.args:
+            end = start + count
+            args.append((arg, mapper, slots[start:end]))
+            start = end
+        return args
+
+    def _shortcut(self, plan: _ElementPlan):
+        if plan.singleton:
+            return self.global_state.get(plan.element, _pending)
+        if plan.local:
+            return _pending
+        return plan.element.strategy.provide(self, plan.element)
+
+    def _run(self, schedule: Sequence[_Step], store_root: bool):
+        state = self.global_state
+        values: List[Any] = [None] * len(schedule)
+        last = len(schedule) - 1
+        index = 0
+        while index <= last:
+            step = schedule[index]
+            skipped = False
+            for skip in step.skips:
+                value = state.get(schedule[skip].plan.element, _pending)
+                if value is not _pending:
+                    values[skip] = value
+                    index = skip + 1
+                    skipped = True
+                    break
+            if skipped:
+                continue
+            plan = step.plan
+            if step.args is None:
+                value = self._shortcut(plan)
+                if value is _pending:
+                    value = plan.element.strategy.provide(self, plan.element)
+            else:
+                value = plan.element.injector(
+                    **{
+                        arg: mapper.map([values[slot] for slot in slots])
+                        for arg, mapper, slots in step.args
+                    }
+                )
+                if plan.singleton and (index < last or store_root):
+                    state[plan.element] = value
+            values[index] = value
+            index += 1
+        return values[last]
+
+
+class IterativeApplicationInstanceBuilder(RecursiveApplicationInstanceBuilder):
+    def _provide_context(self):
+        return IterativeProvideContext(self.app)
@@ -1,16 +1,48 @@
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Type, Union
+import copy
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
 
 from di.core.assignment import Assignment
 from di.core.compose import ComposedApplication
-from di.core.element import Element, ProvideContext
+from di.core.element import Element, ProvideContext, ProvideObserver
 from di.core.instance.base import (
     ApplicationInstance,
     ApplicationInstanceBuilder,
     ApplicationInstanceElementNotFound,
     ApplicationInstanceStateError,
+    BootstrapExecutor,
+    ValuesCacheInfo,
 )
+from di.core.instance.teardown import Finalizer, InstanceTeardown
 from di.core.module import Module, ModuleRelated
 from di.core.navigator import ApplicationNavigator
+from di.core.provide_strategies import (
+    LazySingletonProvideStrategy,
+    ProvideScope,
+    ScopedProvideStrategy,
+    SingletonProvideStrategy,
+)
+from di.utils.cache import LRUCache
+from di.utils.profiling import profile_span
+from di.utils.proxy import LazyProxy, is_lazy_resolved
+
+# strategies which value never changes within provide context
+_cacheable_strategies = SingletonProvideStrategy, LazySingletonProvideStrategy
+# bound of cached values_by_type lookups per instance
+_VALUES_CACHE_SIZE = 1024
+_missing = object()
 
 
 class _ComposedAppInspector:
@@ -36,6 +68,20 @@ class _ComposedAppInspector:
         for injection_plan in self.app.injection_plans:
             yield from injection_plan.assignments
 
+    def fork_safe_elements(self) -> Set[Element]:
+        return {
+            element
+            for module in self.app.application.modules
+            for element in module.fork_safe
+        }
+
+    def finalizers(self) -> Dict[Element, Finalizer]:
+        return {
+            element: finalizer
+            for module in self.app.application.modules
+            for element, finalizer in module.finalizers.items()
+        }
+
     def iterate_bootstrap_elements(self) -> Iterable[Element]:
         for module_step in self.app.bootstrap_steps:
             for step in module_step.steps:
@@ -48,17 +94,91 @@ class RecursiveProvideContext(ProvideContext):
         inspector = _ComposedAppInspector(app)
         self._assignments = inspector.assignments_by_elements()
         self._bootstrap_elements = [*inspector.iterate_bootstrap_elements()]
+        self._fork_safe = inspector.fork_safe_elements()
+        self._finalizers = inspector.finalizers()
+        self.observers: Sequence[ProvideObserver] = ()
+
+    def add_observer(self, observer: ProvideObserver):
+        # new sequence, so forked contexts keep their own observers
+        self.observers = (*self.observers, observer)
 
     def boot(self):
         for element in self._bootstrap_elements:
             self.provide(element)
 
+    @property
+    def bootstrap_elements(self) -> Sequence[Element]:
+        return self._bootstrap_elements
+
+    def fork(self) -> "RecursiveProvideContext":
+        dropped = self._fork_dropped()
+        forked = copy.copy(self)
+        forked.global_state = {
+            element: value
+            for element, value in self.global_state.items()
+            if element not in dropped
+        }
+        return forked
+
+    def _fork_dropped(self) -> Collection[Element]:
+        # values that are not fork safe are dropped together with
+        # all values depending on them (also through local elements),
+        # unresolved lazy proxies would be resolved by this context,
+        # so they are dropped too
+        dependents: Dict[Element, List[Element]] = {}
+        for element, assignments in self._assignments.items():
+            for assignment in assignments:
+                for value in assignment.values:
+                    dependents.setdefault(value.source, []).append(element)
+        to_visit = [
+            element
+            for element, value in self.global_state.items()
+            if element not in self._fork_safe
+            or (type(value) is LazyProxy and not is_lazy_resolved(value))
+        ]
+        visited = set(to_visit)
+        while to_visit:
+            element = to_visit.pop()
+            for dependent in dependents.get(element, ()):
+                if dependent not in visited:
+                    visited.add(dependent)
+                    to_visit.append(dependent)
+        return visited
+
     def eval(self, element: Element):
         if not self.has(element):
             raise ApplicationInstanceStateError(f"Missing element {element}")
+        if self.observers:
+            return self._observed_eval(element)
         kwargs = self._args_values(element)
         return element.injector(**kwargs)
 
+    def _observed_eval(self, element: Element):
+        observers = self.observers
+        for observer in observers:
+            observer.before_create(element)
+        try:
+            value = element.injector(**self._args_values(element))
+        except Exception as error:
+            for observer in observers:
+                observer.error(element, error)
+            raise
+        for observer in observers:
+            observer.after_create(element, value)
+        return value
+
+    def _observe_cache_hit(self, element: Element):
+        strategy = element.strategy
+        if type(strategy) in _cacheable_strategies:
+            value = self.global_state.get(element, _missing)
+        elif type(strategy) is ScopedProvideStrategy and strategy.active:
+            value = strategy.state().get(element, _missing)
+        else:
+            return
+        if value is not _missing:
+            for observer in self.observers:
+                observer.cache_hit(element, value)
+
     def _args_values(self, element: Element) -> Dict[str, Any]:
         return {
             assignment.dependency.arg: assignment.mapper.map(
@@ -68,40 +188,176 @@ class RecursiveProvideContext(ProvideContext):
         }
 
     def provide(self, element: Element):
+        if self.observers:
+            self._observe_cache_hit(element)
         return element.strategy.provide(self, element)
 
     def has(self, element: Element):
         return element in self._assignments
 
+    def dependencies_of(self, element: Element) -> Iterable[Element]:
+        for assignment in self._assignments.get(element, ()):
+            for value in assignment.values:
+                yield value.source
+
+    def teardown(
+        self, timeout: Optional[float] = None, max_workers: Optional[int] = None
+    ) -> InstanceTeardown:
+        return InstanceTeardown(
+            state=self.global_state,
+            dependencies=self.dependencies_of,
+            finalizers=self._finalizers,
+            timeout=timeout,
+            max_workers=max_workers,
+        )
+
+
+def _boot(
+    app: ComposedApplication,
+    ctx: RecursiveProvideContext,
+    bootstrap_executor: Optional[BootstrapExecutor],
+):
+    with profile_span("bootstrap", "bootstrap", elements=len(ctx.bootstrap_elements)):
+        if bootstrap_executor is None:
+            ctx.boot()
+        else:
+            bootstrap_executor.boot(app, ctx)
+
 
 class RecursiveApplicationInstance(ApplicationInstance):
-    def __init__(self, app: ComposedApplication, ctx: RecursiveProvideContext):
-        self._navigator = ApplicationNavigator(app.application)
+    def __init__(
+        self,
+        app: ComposedApplication,
+        ctx: RecursiveProvideContext,
+        navigator: Optional[ApplicationNavigator] = None,
+        bootstrap_executor: Optional[BootstrapExecutor] = None,
+    ):
+        self._app = app
+        self._navigator = navigator or ApplicationNavigator(app.application)
         self._ctx = ctx
+        self._bootstrap_executor = bootstrap_executor
+        self._init_values_cache()
+
+    def _init_values_cache(self):
+        self._values_cache = LRUCache(maxsize=_VALUES_CACHE_SIZE)
+        self._values_hits = 0
+        self._values_misses = 0
+        self._values_bypassed = 0
 
     def values_by_type(
         self,
         type_: Type,
         module: Optional[Union[Module, ModuleRelated, str]] = None,
         strict: bool = True,
-    ) -> Iterable[Any]:
+    ) -> List[Any]:
+        # new list is returned on every path, so callers may modify it
+        key: Optional[Tuple] = (type_, module, strict)
+        try:
+            # observed instances resolve every lookup, so all events are seen
+            values = None if self._ctx.observers else self._values_cache.get(key)
+        except TypeError:
+            # unhashable lookup - can not be cached
+            key, values = None, None
+        if values is not None:
+            self._values_hits += 1
+            return [*values]
         elements = self._navigator.by_type(type_=type_, module=module, strict=strict)
-        return [self.value_of(element) for element in elements]
+        if key is None or self._ctx.observers or not self._cacheable(elements):
+            self._values_bypassed += 1
+            return [self.value_of(element) for element in elements]
+        # singleton values never change, so resolved lookup is reused
+        values = tuple(self.value_of(element) for element in elements)
+        self._values_cache.put(key, values)
+        self._values_misses += 1
+        return [*values]
+
+    def _cacheable(self, elements: Iterable[Element]) -> bool:
+        ctx = self._ctx
+        return all(
+            type(element.strategy) in _cacheable_strategies and ctx.has(element)
+            for element in elements
+        )
+
+    def values_cache_info(self) -> ValuesCacheInfo:
+        return ValuesCacheInfo(
+            hits=self._values_hits,
+            misses=self._values_misses,
+            bypassed=self._values_bypassed,
+            currsize=len(self._values_cache),
+        )
+
+    def clear_values_cache(self):
+        self._init_values_cache()
 
     def value_of(self, element: Element):
         if not self._ctx.has(element):
             raise ApplicationInstanceElementNotFound(element=element)
         return self._ctx.provide(element)
 
+    def add_observer(self, observer: ProvideObserver):
+        self._ctx.add_observer(observer)
+
+    def scope(self, name: str = "request") -> ProvideScope:
+        return ProvideScope(name, observers=self._ctx.observers)
+
+    def close(self, timeout: Optional[float] = None, max_workers: Optional[int] = None):
+        try:
+            self._ctx.teardown(timeout=timeout, max_workers=max_workers).close()
+        finally:
+            self.clear_values_cache()
+
+    async def aclose(self, timeout: Optional[float] = None):
+        try:
+            await self._ctx.teardown(timeout=timeout).aclose()
+        finally:
+            self.clear_values_cache()
+
+    def fork(self) -> "RecursiveApplicationInstance":
+        forked = copy.copy(self)
+        forked._ctx = self._ctx.fork()
+        forked._init_values_cache()
+        # forked instance is bootstrapped the same way as this one
+        _boot(self._app, forked._ctx, self._bootstrap_executor)
+        return forked
+
 
 class RecursiveApplicationInstanceBuilder(ApplicationInstanceBuilder):
-    def __init__(self, app: ComposedApplication):
+    def __init__(
+        self,
+        app: ComposedApplication,
+        bootstrap_executor: Optional[BootstrapExecutor] = None,
+        eager_type_index: bool = False,
+        observers: Sequence[ProvideObserver] = (),
+    ):
         self.app = app
+        self.bootstrap_executor = bootstrap_executor
+        self.eager_type_index = eager_type_index
+        self.observers = observers
 
     def build(self) -> RecursiveApplicationInstance:
+        provide_context = self._observed_provide_context()
+        self._boot(provide_context)
+        return RecursiveApplicationInstance(
+            app=self.app,
+            ctx=provide_context,
+            navigator=self._navigator(),
+            bootstrap_executor=self.bootstrap_executor,
+        )
+
+    def _navigator(self) -> ApplicationNavigator:
+        return ApplicationNavigator(
+            self.app.application, eager_type_index=self.eager_type_index
+        )
+
+    def _boot(self, provide_context: RecursiveProvideContext):
+        _boot(self.app, provide_context, self.bootstrap_executor)
+
+    def _observed_provide_context(self) -> RecursiveProvideContext:
+        # observers are attached before bootstrap, so they see all creations
         provide_context = self._provide_context()
-        provide_context.boot()
-        return RecursiveApplicationInstance(app=self.app, ctx=provide_context)
+        for observer in self.observers:
+            provide_context.add_observer(observer)
+        return provide_context
 
     def _provide_context(self):
         return RecursiveProvideContext(self.app)
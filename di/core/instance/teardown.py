@@ -0,0 +1,285 @@
+import asyncio
+import inspect
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Set,
+)
+
+from di.core.element import Element
+from di.core.injectors import ValueInjector
+from di.core.instance.base import (
+    ApplicationInstanceCloseError,
+    ApplicationInstanceStateError,
+)
+from di.utils.proxy import LazyProxy, is_lazy_resolved, lazy_target
+
+Finalizer = Callable[[Any], Any]
+# how often queued finalizers are checked for start, in seconds
+_POLL_INTERVAL = 0.01
+
+
+def teardown_stages(
+    elements: Iterable[Element],
+    dependencies: Callable[[Element], Iterable[Element]],
+) -> List[List[Element]]:
+    # element is closed in stage after all elements depending on it,
+    # elements of one stage do not depend on each other
+    levels: Dict[Element, int] = {}
+    for element in elements:
+        _level(element, dependencies, levels)
+    by_level: Dict[int, List[Element]] = {}
+    for element in elements:
+        by_level.setdefault(levels[element], []).append(element)
+    return [by_level[level] for level in sorted(by_level, reverse=True)]
+
+
+def _level(
+    root: Element,
+    dependencies: Callable[[Element], Iterable[Element]],
+    levels: Dict[Element, int],
+):
+    stack = [(root, iter(dependencies(root)))]
+    while stack:
+        element, pending = stack[-1]
+        for dependency in pending:
+            if dependency not in levels:
+                stack.append((dependency, iter(dependencies(dependency))))
+                break
+        else:
+            stack.pop()
+            levels[element] = 1 + max(
+                (levels[dependency] for dependency in dependencies(element)),
+                default=-1,
+            )
+
+
+def _sync_close(value: Any) -> Optional[Callable[[], Any]]:
+    # context manager protocol is not used - values were never entered
+    close = getattr(value, "close", None)
+    return close if callable(close) else None
+
+
+def _async_close(value: Any) -> Optional[Callable[[], Any]]:
+    aclose = getattr(value, "aclose", None)
+    return aclose if callable(aclose) else None
+
+
+def _timeout_error(element: Element) -> TimeoutError:
+    return TimeoutError(f"Closing {element} timed out, it is left running")
+
+
+class InstanceTeardown:
+    def __init__(
+        self,
+        state: MutableMapping[Element, Any],
+        dependencies: Callable[[Element], Iterable[Element]],
+        finalizers: Mapping[Element, Finalizer],
+        timeout: Optional[float] = None,
+        max_workers: Optional[int] = None,
+    ):
+        self.state = state
+        self.dependencies = dependencies
+        self.finalizers = finalizers
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.values = self._closed_values()
+        self.stages = teardown_stages([*self.values], dependencies)
+
+    def _closed_values(self) -> Dict[Element, Any]:
+        # provided values are owned by caller, not created lazy proxies
+        # were never used - both are left as they are
+        values = {}
+        for element, value in [*self.state.items()]:
+            if type(element.injector) is ValueInjector:
+                continue
+            if type(value) is LazyProxy:
+                if not is_lazy_resolved(value):
+                    continue
+                value = lazy_target(value)
+            values[element] = value
+        return values
+
+    def _closable(
+        self,
+        stage: Sequence[Element],
+        running: Set[Element],
+        errors: Dict[Element, BaseException],
+    ) -> List[Element]:
+        # dependencies of timed out elements still in use are not closed
+        blocked: Set[Element] = set()
+        to_visit = [*running]
+        while to_visit:
+            for dependency in self.dependencies(to_visit.pop()):
+                if dependency not in blocked:
+                    blocked.add(dependency)
+                    to_visit.append(dependency)
+        closable = []
+        for element in stage:
+            if element in blocked:
+                errors[element] = ApplicationInstanceStateError(
+                    f"Element {element} not closed, its dependent is still closing"
+                )
+            else:
+                closable.append(element)
+        return closable
+
+    def close(self):
+        errors: Dict[Element, BaseException] = {}
+        running: Set[Element] = set()
+        for stage in self.stages:
+            closable = self._closable(stage, running, errors)
+            if closable:
+                self._close_stage(closable, running, errors)
+        if errors:
+            raise ApplicationInstanceCloseError(errors)
+
+    def _close_stage(
+        self,
+        stage: Sequence[Element],
+        running: Set[Element],
+        errors: Dict[Element, BaseException],
+    ):
+        workers = min(self.max_workers or len(stage), len(stage))
+        pool = ThreadPoolExecutor(max_workers=workers)
+        started: Dict[Element, float] = {}
+        try:
+            futures = {
+                element: pool.submit(self._finalize, element, started)
+                for element in stage
+            }
+            pending = {**futures}
+            while pending:
+                wait_time = self._check_timeouts(pending, started, running, errors)
+                blocked = sum(
+                    not futures[element].done()
+                    for element in running.intersection(stage)
+                )
+                if blocked >= workers:
+                    # all workers are blocked, queued finalizers are not started
+                    for element, future in [*pending.items()]:
+                        if future.cancel():
+                            errors[element] = _timeout_error(element)
+                            del pending[element]
+                    continue
+                done, _ = wait(
+                    pending.values(), timeout=wait_time, return_when=FIRST_COMPLETED
+                )
+                for element, future in [*pending.items()]:
+                    if future in done:
+                        del pending[element]
+                        if future.exception() is not None:
+                            errors[element] = future.exception()
+                        self.state.pop(element, None)
+        finally:
+            # threads of timed out finalizers are not waited for
+            pool.shutdown(wait=False)
+
+    def _check_timeouts(
+        self,
+        pending: Dict[Element, Future],
+        started: Dict[Element, float],
+        running: Set[Element],
+        errors: Dict[Element, BaseException],
+    ) -> Optional[float]:
+        # timeout of every element counts from start of its finalizer,
+        # returns time to wait for next result or timeout
+        if self.timeout is None:
+            return None
+        now = time.monotonic()
+        deadlines = []
+        for element, future in [*pending.items()]:
+            if element not in started:
+                if future.running():
+                    started.setdefault(element, now)
+                else:
+                    deadlines.append(now + _POLL_INTERVAL)
+                    continue
+            deadline = started[element] + self.timeout
+            if deadline <= now and not future.done():
+                errors[element] = _timeout_error(element)
+                running.add(element)
+                del pending[element]
+            else:
+                deadlines.append(deadline)
+        return max(0.0, min(deadlines, default=now) - now)
+
+    def _finalize(self, element: Element, started: Dict[Element, float]):
+        started[element] = time.monotonic()
+        value = self.values[element]
+        finalizer = self.finalizers.get(element)
+        if finalizer is None:
+            finalizer = _sync_close(value) or _async_close(value)
+            if finalizer is None:
+                return
+            result = finalizer()
+        else:
+            result = finalizer(value)
+        # close methods may be coroutine functions too
+        if inspect.isawaitable(result):
+            asyncio.run(_awaited(result))
+
+    async def aclose(self):
+        errors: Dict[Element, BaseException] = {}
+        running: Set[Element] = set()
+        for stage in self.stages:
+            closable = self._closable(stage, running, errors)
+            if not closable:
+                continue
+            # every blocking finalizer gets own thread, so it starts at once
+            # and its timeout does not include time spent in queue
+            pool = ThreadPoolExecutor(max_workers=len(closable))
+            try:
+                results = await asyncio.gather(
+                    *(
+                        asyncio.wait_for(self._afinalize(element, pool), self.timeout)
+                        for element in closable
+                    ),
+                    return_exceptions=True,
+                )
+            finally:
+                pool.shutdown(wait=False)
+            for element, result in zip(closable, results):
+                if isinstance(result, asyncio.TimeoutError):
+                    errors[element] = _timeout_error(element)
+                    running.add(element)
+                    continue
+                if isinstance(result, BaseException):
+                    errors[element] = result
+                self.state.pop(element, None)
+        if errors:
+            raise ApplicationInstanceCloseError(errors)
+
+    async def _afinalize(self, element: Element, pool: ThreadPoolExecutor):
+        value = self.values[element]
+        finalizer = self.finalizers.get(element)
+        if finalizer is not None:
+            call: Optional[Callable[[], Any]] = partial(finalizer, value)
+        else:
+            call = _async_close(value) or _sync_close(value)
+            if call is None:
+                return
+            if inspect.iscoroutinefunction(call):
+                await call()
+                return
+        # blocking finalizers run in executor, so they can time out
+        # without stopping event loop
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(pool, call)
+        if inspect.isawaitable(result):
+            await result
+
+
+async def _awaited(awaitable: Awaitable):
+    return await awaitable
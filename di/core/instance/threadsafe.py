@@ -0,0 +1,63 @@
+from threading import Lock
+from typing import Dict
+
+from di.core.compose import ComposedApplication
+from di.core.element import Element
+from di.core.instance.recursive import (
+    RecursiveApplicationInstanceBuilder,
+    RecursiveProvideContext,
+)
+from di.core.provide_strategies import SingletonProvideStrategy
+
+
+class ElementLocks:
+    __slots__ = ("_locks",)
+
+    def __init__(self):
+        self._locks: Dict[Element, Lock] = {}
+
+    def lock(self, element: Element) -> Lock:
+        lock = self._locks.get(element)
+        if lock is None:
+            # setdefault is atomic, so racing threads receive the same lock
+            lock = self._locks.setdefault(element, Lock())
+        return lock
+
+
+class ThreadSafeProvideContext(RecursiveProvideContext):
+    def __init__(self, app: ComposedApplication):
+        super().__init__(app)
+        self.locks = ElementLocks()
+
+    def fork(self) -> "ThreadSafeProvideContext":
+        forked = super().fork()
+        # locks may be held by threads not existing in forked process
+        forked.locks = ElementLocks()
+        return forked
+
+    def provide(self, element: Element):
+        if type(element.strategy) is not SingletonProvideStrategy:
+            return super().provide(element)
+        state = self.global_state
+        try:
+            value = state[element]
+        except KeyError:
+            pass
+        else:
+            if self.observers:
+                self._observe_cache_hit(element)
+            return value
+        # locks are taken along dependency edges of acyclic graph,
+        # so threads can not wait for each other in a cycle
+        with self.locks.lock(element):
+            try:
+                return state[element]
+            except KeyError:
+                pass
+            value = state[element] = self.eval(element)
+            return value
+
+
+class ThreadSafeApplicationInstanceBuilder(RecursiveApplicationInstanceBuilder):
+    def _provide_context(self):
+        return ThreadSafeProvideContext(self.app)
@@ -0,0 +1,245 @@
+import json
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from di.core.compose import ComposedApplication
+from di.core.element import Element
+from di.core.injectors import FactoryInjector
+from di.core.instance.recursive import (
+    RecursiveApplicationInstance,
+    RecursiveApplicationInstanceBuilder,
+    RecursiveProvideContext,
+)
+
+
+def _qualified_name(obj) -> Optional[str]:
+    qualname = getattr(obj, "__qualname__", None)
+    if not qualname:
+        return None
+    module_name = getattr(obj, "__module__", None)
+    return f"{module_name}.{qualname}" if module_name else qualname
+
+
+def element_name(element: Element) -> str:
+    if element.label:
+        return element.label
+    injector = element.injector
+    if isinstance(injector, FactoryInjector):
+        name = _qualified_name(injector.factory)
+    else:
+        name = _qualified_name(element.value().type)
+    return name or repr(injector)
+
+
+@dataclass
+class ElementTiming:
+    name: str
+    calls: int
+    wall: float
+    cpu: float
+    self_wall: float
+    self_cpu: float
+
+
+@dataclass
+class ConstructionReport:
+    # times are in seconds, self times exclude time of creating dependencies
+    elements: Sequence[ElementTiming]
+    critical_path: Sequence[ElementTiming]
+    critical_path_wall: float
+    bootstrap_wall: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def format_table(self) -> str:
+        header = (
+            f"{'element':<48}{'calls':>6}{'wall ms':>10}{'self ms':>10}"
+            f"{'cpu ms':>10}{'self cpu':>10}"
+        )
+        lines = [header, "-" * len(header)]
+        for timing in self.elements:
+            lines.append(
+                f"{timing.name[-48:]:<48}{timing.calls:>6}"
+                f"{timing.wall * 1e3:>10.2f}{timing.self_wall * 1e3:>10.2f}"
+                f"{timing.cpu * 1e3:>10.2f}{timing.self_cpu * 1e3:>10.2f}"
+            )
+        lines.append("")
+        lines.append(
+            f"bootstrap {self.bootstrap_wall * 1e3:.2f} ms, "
+            f"critical path {self.critical_path_wall * 1e3:.2f} ms:"
+        )
+        lines.extend(
+            f"  {timing.name} ({timing.self_wall / timing.calls * 1e3:.2f} ms)"
+            for timing in self.critical_path
+        )
+        return "\n".join(lines)
+
+
+class _Times:
+    __slots__ = "calls", "wall", "cpu", "self_wall", "self_cpu"
+
+    def __init__(self):
+        self.calls = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.self_wall = 0.0
+        self.self_cpu = 0.0
+
+
+class TimedProvideContext(RecursiveProvideContext):
+    def __init__(self, app: ComposedApplication):
+        super().__init__(app)
+        self._reset_times()
+
+    def _reset_times(self):
+        self.times: Dict[Element, _Times] = {}
+        self._times_lock = threading.Lock()
+        # nested evaluations are tracked per thread for parallel bootstrap
+        self._frames = threading.local()
+
+    def fork(self) -> "TimedProvideContext":
+        forked = super().fork()
+        forked._reset_times()
+        return forked
+
+    def eval(self, element: Element):
+        frames: List[List[float]] = getattr(self._frames, "stack", None)
+        if frames is None:
+            frames = self._frames.stack = []
+        nested = [0.0, 0.0]
+        frames.append(nested)
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            return super().eval(element)
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.thread_time() - cpu_start
+            frames.pop()
+            if frames:
+                frames[-1][0] += wall
+                frames[-1][1] += cpu
+            self._record(element, wall, cpu, wall - nested[0], cpu - nested[1])
+
+    def _record(
+        self,
+        element: Element,
+        wall: float,
+        cpu: float,
+        self_wall: float,
+        self_cpu: float,
+    ):
+        with self._times_lock:
+            times = self.times.get(element)
+            if times is None:
+                times = self.times[element] = _Times()
+            times.calls += 1
+            times.wall += wall
+            times.cpu += cpu
+            times.self_wall += self_wall
+            times.self_cpu += self_cpu
+
+
+def construction_report(
+    times: Dict[Element, _Times],
+    dependencies: Callable[[Element], Iterable[Element]],
+    roots: Iterable[Element] = (),
+    bootstrap_wall: float = 0.0,
+) -> ConstructionReport:
+    timings = {
+        element: ElementTiming(
+            name=element_name(element),
+            calls=entry.calls,
+            wall=entry.wall,
+            cpu=entry.cpu,
+            self_wall=entry.self_wall,
+            self_cpu=entry.self_cpu,
+        )
+        for element, entry in times.items()
+    }
+    path = _critical_path(timings, dependencies, [*roots] or [*timings])
+    return ConstructionReport(
+        elements=sorted(timings.values(), key=lambda t: t.self_wall, reverse=True),
+        critical_path=[timings[element] for element in path],
+        critical_path_wall=sum(timings[e].self_wall / timings[e].calls for e in path),
+        bootstrap_wall=bootstrap_wall,
+    )
+
+
+def _critical_path(
+    timings: Dict[Element, ElementTiming],
+    dependencies: Callable[[Element], Iterable[Element]],
+    roots: Sequence[Element],
+) -> List[Element]:
+    # longest chain of dependent constructions, its length bounds startup
+    # time even if independent elements were created concurrently
+    costs: Dict[Element, float] = {}
+    following: Dict[Element, Optional[Element]] = {}
+
+    def _visit(root: Element):
+        stack = [(root, iter(dependencies(root)))]
+        while stack:
+            element, pending = stack[-1]
+            for dependency in pending:
+                if dependency not in costs:
+                    stack.append((dependency, iter(dependencies(dependency))))
+                    break
+            else:
+                stack.pop()
+                timing = timings.get(element)
+                own = timing.self_wall / timing.calls if timing else 0.0
+                slowest = max(
+                    dependencies(element), key=costs.__getitem__, default=None
+                )
+                costs[element] = own + (costs[slowest] if slowest is not None else 0)
+                following[element] = slowest
+
+    for root in roots:
+        if root not in costs:
+            _visit(root)
+    element = max(roots, key=costs.__getitem__, default=None)
+    path = []
+    while element is not None:
+        if element in timings:
+            path.append(element)
+        element = following[element]
+    return path
+
+
+class TimedApplicationInstance(RecursiveApplicationInstance):
+    _ctx: TimedProvideContext
+
+    def __init__(self, *args, bootstrap_wall: float = 0.0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.bootstrap_wall = bootstrap_wall
+
+    def timing_report(self) -> ConstructionReport:
+        return construction_report(
+            self._ctx.times,
+            self._ctx.dependencies_of,
+            roots=self._ctx.bootstrap_elements,
+            bootstrap_wall=self.bootstrap_wall,
+        )
+
+
+class TimedApplicationInstanceBuilder(RecursiveApplicationInstanceBuilder):
+    def build(self) -> TimedApplicationInstance:
+        provide_context = self._observed_provide_context()
+        start = time.perf_counter()
+        self._boot(provide_context)
+        return TimedApplicationInstance(
+            app=self.app,
+            ctx=provide_context,
+            navigator=self._navigator(),
+            bootstrap_executor=self.bootstrap_executor,
+            bootstrap_wall=time.perf_counter() - start,
+        )
+
+    def _provide_context(self):
+        return TimedProvideContext(self.app)
@@ -2,6 +2,7 @@ from di.core.module.base import (
     AbstractModuleElementConsistencyCheck,
     AbstractModuleImportSolver,
     Module,
+    ModuleElementConflict,
     ModuleElementConsistencyError,
     ModuleImportGraph,
     ModuleImportGraphEdge,
@@ -16,6 +17,7 @@ __all__ = [
     "AbstractModuleElementConsistencyCheck",
     "AbstractModuleImportSolver",
     "Module",
+    "ModuleElementConflict",
     "ModuleElementConsistencyError",
     "ModuleImportGraph",
     "ModuleImportGraphEdge",
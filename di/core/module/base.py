@@ -1,8 +1,22 @@
 from dataclasses import dataclass, field
-from typing import Collection, Iterable, Optional, Sequence, Set
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Optional,
+    Sequence,
+    Set,
+)
 
 from di.core.element import Element
 from di.utils.graph import DirectionalGraph, DirectionalGraphEdge
+from di.utils.versioned import versioned, versioned_property
+
+# sets which mutations invalidate cached element collections
+_VERSIONED_FIELDS = frozenset({"elements", "imports", "exports"})
 
 
 @dataclass
@@ -12,10 +26,24 @@ class Module:
     bootstrap: Set[Element] = field(default_factory=set)
     imports: Set["Module"] = field(default_factory=set)
     exports: Set[Element] = field(default_factory=set)
-
-    @property
-    def imported_elements(self) -> Set[Element]:
-        return {*self.iterate_imported_elements()}
+    fork_safe: Set[Element] = field(default_factory=set)
+    finalizers: Dict[Element, Callable[[Any], Any]] = field(default_factory=dict)
+
+    def __setattr__(self, name: str, value: Any):
+        if name in _VERSIONED_FIELDS:
+            value = versioned(value)
+        super().__setattr__(name, value)
+
+    # cached until imports or exports of imported modules change;
+    # immutable, so cached value is shared (set copy was returned before)
+    @versioned_property.depending_on(
+        lambda module: [
+            module.imports,
+            *(imported.exports for imported in module.imports),
+        ]
+    )
+    def imported_elements(self) -> FrozenSet[Element]:
+        return frozenset(self.iterate_imported_elements())
 
     def iterate_imported_elements(self) -> Iterable[Element]:
         for module in self.imports:
@@ -66,8 +94,22 @@ class AbstractModuleImportSolver:
         raise NotImplementedError
 
 
+@dataclass
+class ModuleElementConflict:
+    element: Element
+    modules: Sequence[Module]
+
+
 class ModuleElementConsistencyError(Exception):
-    pass
+    def __init__(
+        self,
+        msg: str,
+        problems: Sequence[str] = (),
+        conflicts: Sequence[ModuleElementConflict] = (),
+    ):
+        super().__init__(msg)
+        self.problems = problems
+        self.conflicts = conflicts
 
 
 class AbstractModuleElementConsistencyCheck:
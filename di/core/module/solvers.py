@@ -1,10 +1,11 @@
-import itertools
-from typing import Collection, Sequence
+from typing import Collection, Dict, Iterable, List, Sequence
 
+from di.core.element import Element
 from di.core.module.base import (
     AbstractModuleElementConsistencyCheck,
     AbstractModuleImportSolver,
     Module,
+    ModuleElementConflict,
     ModuleElementConsistencyError,
     ModuleImportGraph,
     ModuleImportGraphEdge,
@@ -14,7 +15,7 @@ from di.core.module.base import (
 from di.utils.graph import (
     DirectionalGraph,
     DirectionalGraphIteratorError,
-    DirectionalGraphTopologyIterator,
+    DirectionalGraphKahnIterator,
 )
 
 
@@ -43,40 +44,52 @@ class ModuleImportSolver(AbstractModuleImportSolver):
     @staticmethod
     def _steps(graph: ModuleImportGraph) -> Sequence[Collection[Module]]:
         try:
-            return [*DirectionalGraphTopologyIterator(graph)]
+            return [*DirectionalGraphKahnIterator(graph)]
         except DirectionalGraphIteratorError:
             raise ModuleImportSolverError("Module cyclic import problem")
 
 
 class ModuleElementConsistencyCheck(AbstractModuleElementConsistencyCheck):
     def check(self, modules: Collection[Module]):
+        problems: List[str] = []
         for module in modules:
-            self._check_module_exports(module)
-            self._check_module_bootstrap(module)
-        self._check_duplicates(modules)
-
-    @classmethod
-    def _check_module_exports(cls, module: Module):
-        all_elements = {*module.elements, *module.imported_elements}
-        if not module.exports.issubset(all_elements):
-            difference = module.exports - all_elements
+            problems.extend(self._module_problems(module))
+        conflicts = self._duplicates(modules)
+        problems.extend(
+            f"Modules {conflict.modules} use the same element {conflict.element}"
+            for conflict in conflicts
+        )
+        if problems:
             raise ModuleElementConsistencyError(
-                f"Module {module} exports non accessible elements: {difference}"
+                "\n".join(problems), problems=problems, conflicts=conflicts
             )
 
     @classmethod
-    def _check_module_bootstrap(cls, module: Module):
+    def _module_problems(cls, module: Module) -> Iterable[str]:
+        not_accessible = module.exports - module.elements - module.imported_elements
+        if not_accessible:
+            yield f"Module {module} exports non accessible elements: {not_accessible}"
         if not module.bootstrap.issubset(module.elements):
             difference = module.bootstrap - module.elements
-            raise ModuleElementConsistencyError(
-                f"Module {module} bootstraps not owned elements: {difference}"
+            yield f"Module {module} bootstraps not owned elements: {difference}"
+        if not module.fork_safe.issubset(module.elements):
+            difference = module.fork_safe - module.elements
+            yield (
+                f"Module {module} marks not owned elements as fork safe: {difference}"
             )
+        if not module.finalizers.keys() <= module.elements:
+            difference = module.finalizers.keys() - module.elements
+            yield f"Module {module} finalizes not owned elements: {difference}"
 
     @classmethod
-    def _check_duplicates(cls, modules: Collection[Module]):
-        for a, b in itertools.combinations(modules, 2):
-            if not a.elements.isdisjoint(b.elements):
-                common = a.elements & b.elements
-                raise ModuleElementConsistencyError(
-                    f"Module {a} and {b} uses the same elements: {common}"
-                )
+    def _duplicates(cls, modules: Collection[Module]) -> List[ModuleElementConflict]:
+        # single element to owner modules index instead of comparing module pairs
+        owners: Dict[Element, List[Module]] = {}
+        for module in modules:
+            for element in module.elements:
+                owners.setdefault(element, []).append(module)
+        return [
+            ModuleElementConflict(element=element, modules=element_owners)
+            for element, element_owners in owners.items()
+            if len(element_owners) > 1
+        ]
@@ -1,3 +1,4 @@
+from bisect import bisect_left
 from collections import defaultdict
 from typing import (
     Callable,
@@ -6,6 +7,7 @@ from typing import (
     Iterable,
     List,
     Optional,
+    Sequence,
     Tuple,
     Type,
     Union,
@@ -92,10 +94,69 @@ class _NavigatorTypeElementMap:
         return map_
 
 
+class _NavigatorTypeIndex:
+    # single index shared by all modules - elements are numbered module
+    # by module, so elements of a module form contiguous range of numbers
+    # and module lookup is a slice of application wide lookup
+    def __init__(self, modules: Collection[Module]):
+        elements: List[Element] = []
+        self._ranges: Dict[Module, Tuple[int, int]] = {}
+        for module in modules:
+            start = len(elements)
+            elements.extend(module.elements)
+            self._ranges[module] = start, len(elements)
+        self._maps = {
+            True: self._make_index(_NavigatorTypeElementMap._iterate_type, elements),
+            False: self._make_index(
+                _NavigatorTypeElementMap._iterate_subtypes, elements
+            ),
+        }
+
+    def has_module(self, module: Module) -> bool:
+        return module in self._ranges
+
+    def lookup(
+        self, type_: Type, module: Optional[Module], strict: bool
+    ) -> Collection[Element]:
+        entry = self._maps[strict].get(type_)
+        if entry is not None:
+            elements, numbers = entry
+            if module is None:
+                return elements
+            start, end = self._ranges[module]
+            first = bisect_left(numbers, start)
+            last = bisect_left(numbers, end, first)
+            if first != last:
+                return elements[first:last]
+        raise LookupError(f"Element compatible with {type_} not found")
+
+    @classmethod
+    def _make_index(
+        cls,
+        iterator: Callable[[Element], Iterable[Type]],
+        elements: Sequence[Element],
+    ) -> Dict[Type, Tuple[List[Element], List[int]]]:
+        index: Dict[Type, Tuple[List[Element], List[int]]] = {}
+        for number, element in enumerate(elements):
+            for sub_type in iterator(element):
+                entry = index.get(sub_type)
+                if entry is None:
+                    entry = index[sub_type] = [], []
+                entry[0].append(element)
+                entry[1].append(number)
+        return index
+
+
 class ApplicationNavigator(ApplicationRelated):
-    def __init__(self, app: Application):
+    def __init__(self, app: Application, eager_type_index: bool = False):
         self.app = app
         self._type_maps: Dict[Tuple, _NavigatorTypeElementMap] = {}
+        self._type_index: Optional[_NavigatorTypeIndex] = None
+        if eager_type_index:
+            self.build_type_index()
+
+    def build_type_index(self):
+        self._type_index = _NavigatorTypeIndex(self.app.modules)
 
     def by_type(
         self,
@@ -105,6 +166,9 @@ class ApplicationNavigator(ApplicationRelated):
     ) -> Collection[Element]:
         if module:
             module = self.get_module(module)
+        type_index = self._type_index
+        if type_index is not None and (not module or type_index.has_module(module)):
+            return type_index.lookup(type_, module=module, strict=strict)
         type_map = self._get_type_map(module=module, strict=strict)
         return type_map.lookup(type_)
 
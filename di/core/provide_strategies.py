@@ -1,6 +1,17 @@
-from typing import Any
+from contextvars import ContextVar, Token
+from threading import Lock
+from typing import Any, Dict, List, Mapping, Sequence
 
-from di.core.element import Element, ProvideContext, ProvideStrategy
+from di.core.element import Element, ProvideContext, ProvideObserver, ProvideStrategy
+from di.utils.proxy import LazyProxy
+
+ScopeState = Dict[Element, Any]
+
+_scopes: ContextVar[Mapping[str, ScopeState]] = ContextVar("di_scopes", default={})
+
+
+class ProvideScopeError(Exception):
+    pass
 
 
 class SingletonProvideStrategy(ProvideStrategy):
@@ -11,6 +22,95 @@ class SingletonProvideStrategy(ProvideStrategy):
         return state[element]
 
 
+class LazySingletonProvideStrategy(ProvideStrategy):
+    # singleton value is a proxy, element is created on its first use
+    def __init__(self):
+        self._lock = Lock()
+
+    def provide(self, context: ProvideContext, element: Element) -> Any:
+        state = context.global_state
+        try:
+            return state[element]
+        except KeyError:
+            pass
+        with self._lock:
+            if element not in state:
+                state[element] = LazyProxy(
+                    lambda: context.eval(element), self._proxy_type(element)
+                )
+        return state[element]
+
+    @staticmethod
+    def _proxy_type(element: Element):
+        result = element.value()
+        type_ = result and result.type
+        return type_ if isinstance(type_, type) else None
+
+
 class LocalProvideStrategy(ProvideStrategy):
     def provide(self, context: ProvideContext, element: Element) -> Any:
         return context.eval(element)
+
+
+class ScopedProvideStrategy(ProvideStrategy):
+    def __init__(self, scope: str = "request"):
+        self.scope = scope
+
+    def provide(self, context: ProvideContext, element: Element) -> Any:
+        state = self.state()
+        if element not in state:
+            state[element] = context.eval(element)
+        return state[element]
+
+    @property
+    def active(self) -> bool:
+        return self.scope in _scopes.get()
+
+    def state(self) -> ScopeState:
+        state = _scopes.get().get(self.scope)
+        if state is None:
+            raise ProvideScopeError(f"Scope {self.scope!r} is not active")
+        return state
+
+
+class PendingScopeValue:
+    # scope state entry of value still being created asynchronously
+    __slots__ = ("future",)
+
+    def __init__(self, future: Any):
+        self.future = future
+
+
+class ProvideScope:
+    def __init__(
+        self, name: str = "request", observers: Sequence[ProvideObserver] = ()
+    ):
+        self.name = name
+        self.observers = observers
+        self._tokens: List[Token] = []
+
+    @property
+    def active(self) -> bool:
+        return self.name in _scopes.get()
+
+    def __enter__(self) -> "ProvideScope":
+        scopes = _scopes.get()
+        self._tokens.append(_scopes.set({**scopes, self.name: {}}))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.observers:
+            values = {
+                element: value
+                for element, value in _scopes.get()[self.name].items()
+                if type(value) is not PendingScopeValue
+            }
+            for observer in self.observers:
+                observer.scope_exit(self.name, values)
+        _scopes.reset(self._tokens.pop())
+
+    async def __aenter__(self) -> "ProvideScope":
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.__exit__(exc_type, exc_val, exc_tb)
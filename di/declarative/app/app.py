@@ -1,9 +1,38 @@
-from typing import Iterable
+import os
+from contextlib import nullcontext
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
 
 from di.core.app import Application, ApplicationRelated
-from di.core.compose import ApplicationComposer, ComposedApplication
+from di.core.compose import (
+    AbstractApplicationComposer,
+    ApplicationComposer,
+    ComposedApplication,
+    StoredApplicationComposer,
+)
+from di.core.element import ProvideObserver
 from di.core.injection import InjectionSolver
-from di.core.instance import ApplicationInstance, RecursiveApplicationInstanceBuilder
+from di.core.instance import (
+    ApplicationInstance,
+    ApplicationInstanceBuilder,
+    AsyncApplicationInstance,
+    AsyncRecursiveApplicationInstanceBuilder,
+    BootstrapExecutor,
+    CompiledApplicationInstanceBuilder,
+    IterativeApplicationInstanceBuilder,
+    RecursiveApplicationInstanceBuilder,
+    ThreadSafeApplicationInstanceBuilder,
+    TimedApplicationInstanceBuilder,
+)
 from di.core.module import ModuleElementConsistencyCheck, ModuleImportSolver
 from di.declarative.aggregation import AggRegistry, IsAggregationType
 from di.declarative.app.globals import GlobalRegistry
@@ -12,6 +41,17 @@ from di.declarative.module import (
     RecursiveModuleAssemblySolver,
     StrictModuleAssemblySolver,
 )
+from di.utils.profiling import Profiler, profile_span
+
+InstanceEngine = Callable[..., ApplicationInstanceBuilder]
+
+INSTANCE_ENGINES: Mapping[str, InstanceEngine] = {
+    "recursive": RecursiveApplicationInstanceBuilder,
+    "compiled": CompiledApplicationInstanceBuilder,
+    "iterative": IterativeApplicationInstanceBuilder,
+    "thread_safe": ThreadSafeApplicationInstanceBuilder,
+    "timed": TimedApplicationInstanceBuilder,
+}
 
 
 class DeclarativeApp(ApplicationRelated):
@@ -19,9 +59,13 @@ class DeclarativeApp(ApplicationRelated):
         self,
         *modules: ModuleAssembly,
         agg_checks: Iterable[IsAggregationType] = (),
-        follow_imports: bool = True
+        follow_imports: bool = True,
+        composed_path: Optional[Union[str, os.PathLike]] = None,
+        profiler: Optional[Profiler] = None,
     ):
         self.app = Application()
+        self.composed_path = composed_path
+        self.profiler = profiler
 
         if follow_imports:
             self._solver = RecursiveModuleAssemblySolver()
@@ -34,20 +78,31 @@ class DeclarativeApp(ApplicationRelated):
 
         self._init()
 
+    def _profiled(self) -> ContextManager:
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.activate()
+
     def _init(self):
-        for module in self._modules:
-            self._process(module)
-        self._global_registry.all_update(self.app.modules)
+        with self._profiled(), profile_span("assemble", "assemble"):
+            for module in self._modules:
+                self._process(module)
+            self._global_registry.all_update(self.app.modules)
 
     def _process(self, asm: ModuleAssembly):
         app_modules = self.app.modules
-        to_add = self._solver.solve(app_modules, asm)
+        with profile_span("assemble", "assemble", module=asm.module.name) as span:
+            to_add = self._solver.solve(app_modules, asm)
+            span.set(modules=len(to_add))
         for _next in to_add:
             self._add(_next)
 
     def _add(self, asm: ModuleAssembly):
         module = asm.module
         self.app.modules.add(module)
+        if self.profiler is not None:
+            for span in asm.declaration_spans:
+                self.profiler.sink.record(span)
 
         properties = asm.properties
         if properties.global_:
@@ -55,15 +110,57 @@ class DeclarativeApp(ApplicationRelated):
         self._agg_registry.add_module(module, properties.module_agg)
         self._agg_registry.include_elements(properties.element_agg.items())
 
-    def build_instance(self) -> ApplicationInstance:
-        composed = self.build_composed()
-        return RecursiveApplicationInstanceBuilder(composed).build()
+    def build_instance(
+        self,
+        engine: Union[str, InstanceEngine] = "recursive",
+        bootstrap_executor: Optional[BootstrapExecutor] = None,
+        eager_type_index: bool = False,
+        observers: Sequence[ProvideObserver] = (),
+    ) -> ApplicationInstance:
+        builder_factory = self._engine(engine)
+        with self._profiled(), profile_span("build_instance", "build"):
+            composed = self.build_composed()
+            # only options in use are passed, so custom engines may skip them
+            options: Dict[str, Any] = {}
+            if bootstrap_executor is not None:
+                options["bootstrap_executor"] = bootstrap_executor
+            if eager_type_index:
+                options["eager_type_index"] = eager_type_index
+            if observers:
+                options["observers"] = observers
+            return builder_factory(composed, **options).build()
+
+    async def build_instance_async(
+        self,
+        eager_type_index: bool = False,
+        observers: Sequence[ProvideObserver] = (),
+    ) -> AsyncApplicationInstance:
+        with self._profiled(), profile_span("build_instance", "build"):
+            composed = self.build_composed()
+            builder = AsyncRecursiveApplicationInstanceBuilder(
+                composed, eager_type_index=eager_type_index, observers=observers
+            )
+            return await builder.build()
+
+    @staticmethod
+    def _engine(engine: Union[str, InstanceEngine]) -> InstanceEngine:
+        if not isinstance(engine, str):
+            return engine
+        if engine not in INSTANCE_ENGINES:
+            raise ValueError(f"Unknown instance engine {engine!r}")
+        return INSTANCE_ENGINES[engine]
 
     def build_composed(self) -> ComposedApplication:
+        with self._profiled(), profile_span("build_composed", "build"):
+            return self._build_composed()
+
+    def _build_composed(self) -> ComposedApplication:
         agg_selector = self._agg_registry.build_selector()
-        composer = ApplicationComposer(
+        composer: AbstractApplicationComposer = ApplicationComposer(
             InjectionSolver(factory_selector=agg_selector),
             ModuleImportSolver(),
             ModuleElementConsistencyCheck(),
         )
+        if self.composed_path:
+            composer = StoredApplicationComposer(composer, self.composed_path)
         return composer.compose(self.app)
@@ -1,8 +1,13 @@
 from dataclasses import dataclass
-from typing import Collection, Iterator, Optional
+from typing import Any, Callable, Collection, Iterator, Optional
 
 from di.core.element import Element, Injector
-from di.core.provide_strategies import LocalProvideStrategy, SingletonProvideStrategy
+from di.core.provide_strategies import (
+    LazySingletonProvideStrategy,
+    LocalProvideStrategy,
+    ScopedProvideStrategy,
+    SingletonProvideStrategy,
+)
 from di.declarative.aggregation import IsAggregationType
 
 
@@ -12,6 +17,8 @@ class ModuleElement:
     export: bool = True
     bootstrap: bool = False
     agg_checks: Collection[IsAggregationType] = ()
+    fork_safe: bool = False
+    finalizer: Optional[Callable[[Any], Any]] = None
 
     @classmethod
     def create(
@@ -22,8 +29,18 @@ class ModuleElement:
         export: bool = True,
         bootstrap: bool = False,
         agg_checks: Collection[IsAggregationType] = (),
+        scope: Optional[str] = None,
+        fork_safe: bool = False,
+        lazy: bool = False,
+        finalizer: Optional[Callable[[Any], Any]] = None,
     ) -> "ModuleElement":
-        if singleton:
+        if lazy and (scope or not singleton):
+            raise ValueError("Only singleton elements can be lazy")
+        if lazy:
+            strategy = LazySingletonProvideStrategy()
+        elif scope:
+            strategy = ScopedProvideStrategy(scope)
+        elif singleton:
             strategy = SingletonProvideStrategy()
         else:
             strategy = LocalProvideStrategy()
@@ -36,6 +53,8 @@ class ModuleElement:
             export=export,
             bootstrap=bootstrap,
             agg_checks=agg_checks,
+            fork_safe=fork_safe,
+            finalizer=finalizer,
         )
 
 
@@ -1,4 +1,5 @@
 import inspect
+from contextlib import nullcontext
 from dataclasses import dataclass
 from typing import Any, Callable, Collection, Iterator, Optional, Type, Union
 
@@ -6,11 +7,13 @@ from di.core.injectors import FactoryInjector, ValueInjector
 from di.declarative.aggregation import IsAggregationType
 from di.declarative.element.base import ModuleElement, ModuleElementIterable
 from di.declarative.element.filters import FactoryFilterSets, VariableFilterSets
+from di.utils.inspection import FactoryInspectionCache
 from di.utils.inspection.module_factories import FactoryFilter, ModuleFactoriesInspector
 from di.utils.inspection.module_variables import (
     ModuleVariablesInspector,
     VariableFilter,
 )
+from di.utils.profiling import profile_span
 
 
 def _python_modules(python_modules: Collection[Any]) -> Iterator[Any]:
@@ -24,6 +27,13 @@ def _factory_name(factory) -> Optional[str]:
     return getattr(factory, "__name__", None)
 
 
+def _inspection_batch(inspection_cache: Optional[FactoryInspectionCache]):
+    # cache files are written once per declaration, not per factory
+    if inspection_cache is None:
+        return nullcontext()
+    return inspection_cache.batch()
+
+
 @dataclass
 class _ScanFactories(ModuleElementIterable):
     python_modules: Collection[Any]
@@ -32,19 +42,39 @@ class _ScanFactories(ModuleElementIterable):
     export: bool
     bootstrap: bool
     agg_checks: Collection[IsAggregationType]
+    inspection_cache: Optional[FactoryInspectionCache]
+    scope: Optional[str]
+    fork_safe: bool
+    lazy: bool
+    finalizer: Optional[Callable[[Any], Any]]
 
     def __iter__(self) -> Iterator[ModuleElement]:
+        with _inspection_batch(self.inspection_cache):
+            yield from self._iterate()
+
+    def _iterate(self) -> Iterator[ModuleElement]:
         for python_module in self.python_modules:
             for filters in self.filter_sets:
                 inspector = ModuleFactoriesInspector(filters=filters)
-                for name, factory in inspector.filtered_factories(python_module):
+                with profile_span(
+                    "scan", "scan", python_module=python_module.__name__
+                ) as span:
+                    factories = [*inspector.filtered_factories(python_module)]
+                    span.set(factories=len(factories))
+                for name, factory in factories:
                     yield ModuleElement.create(
-                        injector=FactoryInjector(factory),
+                        injector=FactoryInjector(
+                            factory, inspection_cache=self.inspection_cache
+                        ),
                         singleton=self.singleton,
                         label=_factory_name(factory),
                         export=self.export,
                         bootstrap=self.bootstrap,
                         agg_checks=self.agg_checks,
+                        scope=self.scope,
+                        fork_safe=self.fork_safe,
+                        lazy=self.lazy,
+                        finalizer=self.finalizer,
                     )
 
 
@@ -55,6 +85,11 @@ def scan_factories(
     export: bool = True,
     bootstrap: bool = False,
     agg_checks: Collection[IsAggregationType] = (),
+    inspection_cache: Optional[FactoryInspectionCache] = None,
+    scope: Optional[str] = None,
+    fork_safe: bool = False,
+    lazy: bool = False,
+    finalizer: Optional[Callable[[Any], Any]] = None,
 ) -> ModuleElementIterable:
     return _ScanFactories(
         python_modules=[*_python_modules(python_modules)],
@@ -63,6 +98,11 @@ def scan_factories(
         export=export,
         bootstrap=bootstrap,
         agg_checks=agg_checks,
+        inspection_cache=inspection_cache,
+        scope=scope,
+        fork_safe=fork_safe,
+        lazy=lazy,
+        finalizer=finalizer,
     )
 
 
@@ -73,16 +113,31 @@ class _AddFactories(ModuleElementIterable):
     export: bool
     bootstrap: bool
     agg_checks: Collection[IsAggregationType]
+    inspection_cache: Optional[FactoryInspectionCache]
+    scope: Optional[str]
+    fork_safe: bool
+    lazy: bool
+    finalizer: Optional[Callable[[Any], Any]]
 
     def __iter__(self) -> Iterator[ModuleElement]:
+        with _inspection_batch(self.inspection_cache):
+            yield from self._iterate()
+
+    def _iterate(self) -> Iterator[ModuleElement]:
         for factory in self.factories:
             yield ModuleElement.create(
-                injector=FactoryInjector(factory),
+                injector=FactoryInjector(
+                    factory, inspection_cache=self.inspection_cache
+                ),
                 singleton=self.singleton,
                 label=_factory_name(factory),
                 export=self.export,
                 bootstrap=self.bootstrap,
                 agg_checks=self.agg_checks,
+                scope=self.scope,
+                fork_safe=self.fork_safe,
+                lazy=self.lazy,
+                finalizer=self.finalizer,
             )
 
 
@@ -92,6 +147,11 @@ def add_factories(
     export: bool = True,
     bootstrap: bool = False,
     agg_checks: Collection[IsAggregationType] = (),
+    inspection_cache: Optional[FactoryInspectionCache] = None,
+    scope: Optional[str] = None,
+    fork_safe: bool = False,
+    lazy: bool = False,
+    finalizer: Optional[Callable[[Any], Any]] = None,
 ) -> ModuleElementIterable:
     return _AddFactories(
         factories=factories,
@@ -99,6 +159,11 @@ def add_factories(
         export=export,
         bootstrap=bootstrap,
         agg_checks=agg_checks,
+        inspection_cache=inspection_cache,
+        scope=scope,
+        fork_safe=fork_safe,
+        lazy=lazy,
+        finalizer=finalizer,
     )
 
 
@@ -117,6 +182,7 @@ class _ScanValues(ModuleElementIterable):
                         injector=ValueInjector(var.value),
                         label=var.name,
                         export=self.export,
+                        fork_safe=True,
                     )
 
 
@@ -142,6 +208,7 @@ class _AddValues(ModuleElementIterable):
             yield ModuleElement.create(
                 injector=ValueInjector(value),
                 export=self.export,
+                fork_safe=True,
             )
 
 
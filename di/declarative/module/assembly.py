@@ -1,11 +1,12 @@
 from collections import defaultdict
 from dataclasses import dataclass, field
 from types import MappingProxyType
-from typing import Collection, DefaultDict, Iterable, List, Mapping
+from typing import Collection, DefaultDict, Iterable, List, Mapping, Sequence
 
 from di.core.element import Element
 from di.core.module import Module, ModuleRelated
 from di.declarative.aggregation import IsAggregationType
+from di.utils.profiling import Span
 
 
 @dataclass
@@ -28,6 +29,8 @@ class MutableModuleProperties(ModuleProperties):
 
 class ModuleAssembly(ModuleRelated):
     forward_imports: List["ModuleImport"]
+    # spans of declaration made without active profiler
+    declaration_spans: Sequence[Span] = ()
 
     def __init__(
         self,
@@ -10,6 +10,12 @@ from di.declarative.module.imports import (
     ModuleImportType,
     convert_module_imports,
 )
+from di.utils.profiling import (
+    MemoryProfilerSink,
+    Profiler,
+    active_profiler,
+    profile_span,
+)
 
 
 class DeclarativeModule(ModuleAssembly):
@@ -30,7 +36,22 @@ class DeclarativeModule(ModuleAssembly):
             ),
         )
         self._imports(*imports)
-        self._include(*iterables)
+        if active_profiler() is not None:
+            self._declare(name, iterables)
+            return
+        # modules are scanned when declared, often before application
+        # profiler is active, so spans are kept for profiled application
+        sink = MemoryProfilerSink()
+        with Profiler(sink).activate():
+            self._declare(name, iterables)
+        self.declaration_spans = sink.spans
+
+    def _declare(
+        self, name: Optional[str], iterables: Iterable[Iterable[ModuleElement]]
+    ):
+        with profile_span("include", "scan", module=name) as span:
+            self._include(*iterables)
+            span.set(elements=len(self.module.elements))
 
     def _imports(self, *imports: ModuleImportType, reexport: bool = False):
         self.forward_imports.extend(convert_module_imports(imports, reexport=reexport))
@@ -40,6 +61,8 @@ class DeclarativeModule(ModuleAssembly):
         elements = self.module.elements
         exports = self.module.exports
         bootstrap = self.module.bootstrap
+        fork_safe = self.module.fork_safe
+        finalizers = self.module.finalizers
 
         for iterable in iterables:
             for module_element in iterable:
@@ -49,5 +72,9 @@ class DeclarativeModule(ModuleAssembly):
                     exports.add(element)
                 if module_element.bootstrap:
                     bootstrap.add(element)
+                if module_element.fork_safe:
+                    fork_safe.add(element)
+                if module_element.finalizer:
+                    finalizers[element] = module_element.finalizer
                 if module_element.agg_checks:
                     properties.add_element_agg(element, module_element.agg_checks)
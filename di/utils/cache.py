@@ -0,0 +1,85 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Callable, Hashable, Optional
+
+_missing = object()
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class LRUCache:
+    __slots__ = "maxsize", "hits", "misses", "_entries", "_lock"
+
+    def __init__(self, maxsize: Optional[int] = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        try:
+            with self._lock:
+                value = self._entries.get(key, _missing)
+                if value is not _missing:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                self.misses += 1
+        except TypeError:
+            # unhashable key - can not be cached
+            return compute()
+        value = compute()
+        with self._lock:
+            self._entries[key] = value
+            if self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        # raises TypeError for unhashable keys
+        with self._lock:
+            value = self._entries.get(key, _missing)
+            if value is _missing:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            maxsize=self.maxsize,
+            currsize=len(self._entries),
+        )
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+__all__ = [
+    "CacheInfo",
+    "LRUCache",
+]
@@ -1,4 +1,5 @@
-from typing import Dict, Generic, Iterable, Set, TypeVar
+from collections import defaultdict
+from typing import Dict, Generic, Iterable, List, Set, TypeVar
 
 GraphNodeType = TypeVar("GraphNodeType")
 
@@ -68,3 +69,38 @@ class DirectionalGraphTopologyIterator(Generic[GraphNodeType, GraphEdgeType]):
         self.visited.update(step)
         self.to_visit.difference_update(step)
         return step
+
+
+class DirectionalGraphKahnIterator(Generic[GraphNodeType, GraphEdgeType]):
+    __slots__ = "target_sources", "pending", "remaining", "step"
+
+    def __init__(self, graph: DirectionalGraph[GraphNodeType, GraphEdgeType]):
+        source_targets = graph.source_targets()
+        target_sources: Dict[GraphNodeType, List[GraphNodeType]] = defaultdict(list)
+        for source, targets in source_targets.items():
+            for target in targets:
+                target_sources[target].append(source)
+        self.target_sources = target_sources
+        self.pending = {node: len(targets) for node, targets in source_targets.items()}
+        self.remaining = len(self.pending)
+        self.step = {node for node, count in self.pending.items() if not count}
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Set[GraphNodeType]:
+        if not self.remaining:
+            raise StopIteration
+        step = self.step
+        if not step:
+            raise DirectionalGraphIteratorError("Cyclic connection in graph")
+        pending = self.pending
+        next_step = set()
+        for node in step:
+            for source in self.target_sources.get(node, ()):
+                pending[source] -= 1
+                if not pending[source]:
+                    next_step.add(source)
+        self.remaining -= len(step)
+        self.step = next_step
+        return step
@@ -1,9 +1,11 @@
 from di.utils.inspection.factory import FactoryInspection
+from di.utils.inspection.factory_cache import FactoryInspectionCache
 from di.utils.inspection.typing import (
     aggregated_type,
     aggregation_type_factory,
     is_base_type,
     is_compatible_type,
+    typing_cache,
 )
 
 __all__ = [
@@ -11,5 +13,7 @@ __all__ = [
     "is_compatible_type",
     "aggregated_type",
     "aggregation_type_factory",
+    "typing_cache",
     "FactoryInspection",
+    "FactoryInspectionCache",
 ]
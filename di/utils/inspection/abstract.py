@@ -1,11 +1,18 @@
 import dis
 import inspect
 import re
-from types import DynamicClassAttribute
+from types import CodeType, DynamicClassAttribute
 from typing import Callable, Iterable, Set, Type
 
+from di.utils.cache import LRUCache
 from di.utils.inspection.typing import BUILTIN_TYPES
 
+_NOT_IMPLEMENTED_NAMES = frozenset(("NotImplementedError", "NotImplemented"))
+_LOAD_NAME_OPS = frozenset(("LOAD_GLOBAL", "LOAD_NAME"))
+# instructions breaking `raise NotImplementedError(...)` expression,
+# e.g. `except NotImplementedError:` clause or assignment
+_EXPRESSION_BREAK_OPS = ("POP_", "STORE_", "JUMP", "COMPARE_OP", "CHECK_EXC_MATCH")
+
 
 class AbstractInspector:
     @classmethod
@@ -73,7 +80,7 @@ class AbstractInspector:
             return False
         try:
             for instruction in dis.get_instructions(obj):
-                if instruction.opname == "RAISE_VARARGS" and instruction.arg == 1:
+                if instruction.opname == "RAISE_VARARGS" and instruction.arg in (1, 2):
                     return True
         except TypeError:
             pass
@@ -110,3 +117,48 @@ class AbstractInspector:
             if clazz in BUILTIN_TYPES:
                 continue
             yield clazz
+
+
+class BytecodeAbstractInspector(AbstractInspector):
+    code_cache = LRUCache(maxsize=8192)
+
+    @classmethod
+    def is_abstract_routine(cls, obj: Callable):
+        if not inspect.isroutine(obj):
+            raise TypeError(f"{obj!r} is not a routine")
+        code = getattr(getattr(obj, "__func__", obj), "__code__", None)
+        if not isinstance(code, CodeType):
+            # can not determine - probably native or builtin code
+            return False
+        return cls.code_cache.get_or_compute(
+            code, lambda: cls._is_abstract_bytecode(code)
+        )
+
+    @classmethod
+    def _is_abstract_bytecode(cls, code: CodeType) -> bool:
+        # nested functions are checked too, like lines of source
+        if cls._raises_not_implemented(code):
+            return True
+        return any(
+            cls._is_abstract_bytecode(const)
+            for const in code.co_consts
+            if isinstance(const, CodeType)
+        )
+
+    @classmethod
+    def _raises_not_implemented(cls, code: CodeType) -> bool:
+        if _NOT_IMPLEMENTED_NAMES.isdisjoint(code.co_names):
+            return False
+        loaded = False
+        for instruction in dis.get_instructions(code):
+            opname = instruction.opname
+            if opname in _LOAD_NAME_OPS:
+                if instruction.argval in _NOT_IMPLEMENTED_NAMES:
+                    loaded = True
+            elif opname.startswith(_EXPRESSION_BREAK_OPS):
+                loaded = False
+            elif opname == "RAISE_VARARGS" and loaded:
+                # `raise ...` or `raise ... from cause`, bare `raise` has no arg
+                if instruction.arg in (1, 2):
+                    return True
+        return False
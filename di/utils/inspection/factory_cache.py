@@ -0,0 +1,322 @@
+import hashlib
+import importlib
+import json
+import os
+import sys
+import tempfile
+import typing
+from contextlib import contextmanager
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterator,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    Union,
+)
+
+from di.utils.compat import cached_property
+from di.utils.inspection.factory import FactoryInspection
+
+_FORMAT_VERSION = 1
+_NoneType = type(None)
+_STABLE_MODULES = {"builtins", "typing"}
+
+ModuleStamp = Optional[Tuple[str, int, int]]
+
+
+class FactoryInspectionCacheError(Exception):
+    pass
+
+
+def _module_stamp(module_name: str) -> ModuleStamp:
+    if module_name in _STABLE_MODULES:
+        return None
+    module = sys.modules.get(module_name)
+    path = getattr(module, "__file__", None)
+    if not path:
+        raise FactoryInspectionCacheError(f"Module {module_name} has no source file")
+    try:
+        return _file_stamp(os.path.abspath(path))
+    except OSError as error:
+        # e.g. modules imported from zip archives
+        raise FactoryInspectionCacheError(f"Module {module_name} source: {error}")
+
+
+def _file_stamp(path: str) -> Tuple[str, int, int]:
+    stat = os.stat(path)
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+def _is_valid_stamp(stamp: ModuleStamp) -> bool:
+    if stamp is None:
+        return True
+    path, mtime, size = stamp
+    try:
+        return tuple(_file_stamp(path)) == (path, mtime, size)
+    except OSError:
+        return False
+
+
+def _resolve_reference(module_name: str, qualname: str):
+    obj = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+class _TypeEncoder:
+    def __init__(self):
+        self.modules: Dict[str, ModuleStamp] = {}
+
+    def encode(self, type_) -> Any:
+        if type_ is None or type_ is _NoneType:
+            return {"none": True}
+        if type_ is Ellipsis:
+            return {"ellipsis": True}
+        origin = getattr(type_, "__origin__", None)
+        if origin is not None:
+            return self._encode_generic(type_, origin)
+        if getattr(type_, "_name", None) and type_.__module__ == "typing":
+            return {"typing": type_._name}
+        return self._encode_reference(type_)
+
+    def _encode_generic(self, type_, origin) -> Any:
+        if getattr(type_, "_special", False):
+            return {"typing": type_._name}
+        args = [self.encode(arg) for arg in getattr(type_, "__args__", ())]
+        if origin is Union:
+            return {"union": args}
+        name = getattr(type_, "_name", None)
+        if name and type_.__module__ == "typing":
+            return {"typing": name, "args": args}
+        return {"origin": self._encode_reference(origin), "args": args}
+
+    def _encode_reference(self, obj) -> Any:
+        module_name = getattr(obj, "__module__", None)
+        qualname = getattr(obj, "__qualname__", None) or getattr(obj, "__name__", None)
+        if not module_name or not qualname or "<" in qualname:
+            raise FactoryInspectionCacheError(f"{obj!r} is not importable")
+        if module_name not in self.modules:
+            self.modules[module_name] = _module_stamp(module_name)
+        return {"ref": [module_name, qualname]}
+
+
+def _decode_type(data: Any):
+    if "none" in data:
+        return _NoneType
+    if "ellipsis" in data:
+        return Ellipsis
+    if "ref" in data:
+        return _resolve_reference(*data["ref"])
+    if "union" in data:
+        args = tuple(_decode_type(arg) for arg in data["union"])
+        return Union[args]
+    if "typing" in data:
+        alias = getattr(typing, data["typing"])
+    else:
+        alias = _decode_type(data["origin"])
+    if "args" not in data:
+        return alias
+    args = tuple(_decode_type(arg) for arg in data["args"])
+    return alias[args if len(args) != 1 else args[0]]
+
+
+class StoredFactoryInspection:
+    def __init__(self, factory: Callable, entry: Dict[str, Any]):
+        self._factory = factory
+        self._entry = entry
+
+    @cached_property
+    def optional_args(self) -> Collection[str]:
+        return {*self._entry["optional_args"]}
+
+    @cached_property
+    def args(self) -> Sequence[str]:
+        return [*self._entry["args"]]
+
+    @cached_property
+    def args_annotations(self):
+        return {
+            key: value_type
+            for key, value_type in self.annotations.items()
+            if key != "return"
+        }
+
+    @cached_property
+    def return_type(self) -> Optional[Type[Any]]:
+        if isinstance(self._factory, type):
+            return self._factory
+        return self.annotations.get("return")
+
+    @cached_property
+    def annotations(self) -> Dict[str, Type[Any]]:
+        return {
+            key: _decode_type(value)
+            for key, value in self._entry["annotations"].items()
+        }
+
+
+class FactoryInspectionCache:
+    def __init__(self, directory: Optional[Union[str, os.PathLike]] = None):
+        self.directory = Path(directory) if directory else self.default_directory()
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._dirty: Set[str] = set()
+        self._batch_depth = 0
+
+    @staticmethod
+    def default_directory() -> Path:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join("~", ".cache")
+        return Path(base).expanduser() / "python-di" / "inspection"
+
+    def inspect(self, factory: Callable):
+        try:
+            source, qualname = self._locate(factory)
+        except FactoryInspectionCacheError:
+            return FactoryInspection(factory)
+        entry = self._load_entry(source, qualname)
+        if entry is not None:
+            return StoredFactoryInspection(factory, entry)
+        inspection = FactoryInspection(factory)
+        self._store(factory, source, qualname, inspection)
+        return inspection
+
+    @staticmethod
+    def _locate(factory: Callable) -> Tuple[str, str]:
+        module_name = getattr(factory, "__module__", None)
+        qualname = getattr(factory, "__qualname__", None)
+        if not module_name or not qualname or "<" in qualname:
+            raise FactoryInspectionCacheError(f"{factory!r} is not importable")
+        try:
+            resolved = _resolve_reference(module_name, qualname)
+        except (ImportError, AttributeError):
+            raise FactoryInspectionCacheError(f"{factory!r} is not importable")
+        if resolved is not factory:
+            raise FactoryInspectionCacheError(f"{factory!r} is shadowed")
+        stamp = _module_stamp(module_name)
+        if stamp is None:
+            raise FactoryInspectionCacheError(f"{factory!r} has no source file")
+        return stamp[0], qualname
+
+    def _load_entry(self, source: str, qualname: str) -> Optional[Dict[str, Any]]:
+        entry = self._read(source)["entries"].get(qualname)
+        if entry is None:
+            return None
+        if not all(_is_valid_stamp(stamp) for stamp in entry["modules"].values()):
+            return None
+        return entry
+
+    def _store(
+        self,
+        factory: Callable,
+        source: str,
+        qualname: str,
+        inspection: FactoryInspection,
+    ):
+        try:
+            entry = self._entry(factory, inspection)
+        except (FactoryInspectionCacheError, OSError):
+            return
+        self._read(source)["entries"][qualname] = entry
+        self._dirty.add(source)
+        if not self._batch_depth:
+            self.flush()
+
+    @contextmanager
+    def batch(self) -> Iterator["FactoryInspectionCache"]:
+        # stored entries are written once, when outermost batch ends
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+
+    def flush(self):
+        dirty, self._dirty = self._dirty, set()
+        for source in sorted(dirty):
+            self._write(source, self._files[source])
+
+    @staticmethod
+    def _entry(factory: Callable, inspection: FactoryInspection) -> Dict[str, Any]:
+        encoder = _TypeEncoder()
+        target = factory.__init__ if isinstance(factory, type) else factory
+        encoder.modules[factory.__module__] = _module_stamp(factory.__module__)
+        target_module = getattr(target, "__module__", None)
+        if target_module:
+            encoder.modules[target_module] = _module_stamp(target_module)
+        annotations = {
+            key: encoder.encode(value) for key, value in inspection.annotations.items()
+        }
+        for key, value in annotations.items():
+            try:
+                decoded = _decode_type(value)
+            except (ImportError, AttributeError, TypeError, KeyError):
+                decoded = None
+            if decoded != inspection.annotations[key]:
+                raise FactoryInspectionCacheError(
+                    f"Annotation {key} of {factory!r} can not be stored"
+                )
+        return {
+            "args": [*inspection.args],
+            "optional_args": sorted(inspection.optional_args),
+            "annotations": annotations,
+            "modules": encoder.modules,
+        }
+
+    def _path(self, source: str) -> Path:
+        digest = hashlib.sha1(source.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def _read(self, source: str) -> Dict[str, Any]:
+        if source in self._files:
+            return self._files[source]
+        data = self._empty()
+        try:
+            with open(self._path(source), "r", encoding="utf-8") as fp:
+                loaded = json.load(fp)
+            if loaded.get("version") == _FORMAT_VERSION:
+                data = loaded
+        except (OSError, ValueError, AttributeError):
+            pass
+        self._files[source] = data
+        return data
+
+    def _write(self, source: str, data: Dict[str, Any]):
+        path = self._path(source)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fp:
+                json.dump(data, fp)
+            os.replace(tmp_path, str(path))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
+    @staticmethod
+    def _empty() -> Dict[str, Any]:
+        return {"version": _FORMAT_VERSION, "entries": {}}
+
+    def clear(self):
+        self._files.clear()
+        self._dirty.clear()
+        for path in self.directory.glob("*.json"):
+            path.unlink()
+
+
+__all__ = [
+    "FactoryInspectionCache",
+    "FactoryInspectionCacheError",
+    "StoredFactoryInspection",
+]
@@ -2,7 +2,7 @@ import dataclasses
 from types import ModuleType
 from typing import Collection, Iterable, Type, Union
 
-from di.utils.inspection.abstract import AbstractInspector
+from di.utils.inspection.abstract import AbstractInspector, BytecodeAbstractInspector
 from di.utils.inspection.module_factories.base import FactoryFilter, FactoryItem
 
 
@@ -47,14 +47,15 @@ class PublicFactoryFilter(FactoryFilter):
 
 
 class NonAbstractFactoryFilter(FactoryFilter):
-    def __init__(self, duck_typing: bool = True):
+    def __init__(self, duck_typing: bool = True, bytecode: bool = False):
         self.duck_typing = duck_typing
+        self.inspector = BytecodeAbstractInspector if bytecode else AbstractInspector
 
     def filter(
         self, module: ModuleType, items: Iterable[FactoryItem]
     ) -> Iterable[FactoryItem]:
         for name, obj in items:
-            if not AbstractInspector.is_abstract(obj, duck_typing=self.duck_typing):
+            if not self.inspector.is_abstract(obj, duck_typing=self.duck_typing):
                 yield name, obj
 
 
@@ -3,6 +3,7 @@ from abc import ABCMeta
 from collections import abc
 from typing import (
     Any,
+    Callable,
     FrozenSet,
     Iterable,
     Mapping,
@@ -14,6 +15,8 @@ from typing import (
     Union,
 )
 
+from di.utils.cache import LRUCache
+
 
 def _builtins_values():
     try:
@@ -38,7 +41,28 @@ COLLECTION_ABC_TYPES = {
 BASE_TYPES = {*BUILTIN_TYPES, *COLLECTION_ABC_TYPES}
 
 
+typing_cache = LRUCache(maxsize=4096)
+
+
+def _type_key(type_):
+    # `Union` equality ignores arguments order, but query results may not,
+    # so order of arguments is kept on every nesting level
+    args = getattr(type_, "__args__", None)
+    if not isinstance(args, tuple):
+        return type_
+    return type_, tuple(_type_key(arg) for arg in args)
+
+
+def _cached(query: Callable, *types):
+    key = (query, *(_type_key(type_) for type_ in types))
+    return typing_cache.get_or_compute(key, lambda: query(*types))
+
+
 def is_base_type(type_):
+    return _cached(_is_base_type, type_)
+
+
+def _is_base_type(type_):
     for sub_type in _walk_types(type_):
         if sub_type not in BASE_TYPES:
             return False
@@ -46,7 +70,7 @@ def is_base_type(type_):
 
 
 def _walk_types(type_: Type[Any]) -> Iterable[Type[Any]]:
-    type_ = _flatten_new_type(type_)
+    type_ = flatten_new_type(type_)
     origin = getattr(type_, "__origin__", None)
     if origin:
         yield origin
@@ -60,10 +84,14 @@ def _walk_types(type_: Type[Any]) -> Iterable[Type[Any]]:
 
 
 def is_compatible_type(proposal: Optional, model: Optional) -> bool:
+    return _cached(_is_compatible_type, proposal, model)
+
+
+def _is_compatible_type(proposal: Optional, model: Optional) -> bool:
     if not proposal or not model:
         return False
-    proposal = _flatten_new_type(proposal)
-    model = _flatten_new_type(model)
+    proposal = flatten_new_type(proposal)
+    model = flatten_new_type(model)
     if isinstance(proposal, type) and isinstance(model, type):
         return issubclass(proposal, model)
     proposal_origin = getattr(proposal, "__origin__", None)
@@ -99,6 +127,10 @@ def is_compatible_type(proposal: Optional, model: Optional) -> bool:
 
 
 def aggregated_type(type_: Optional):
+    return _cached(_aggregated_type, type_)
+
+
+def _aggregated_type(type_: Optional):
     types = tuple(_aggregated_types(type_))
     if not types:
         return None
@@ -116,14 +148,22 @@ def _aggregated_types(type_: Optional):
                 yield arg_type
 
 
-def flatten_union(type_: Optional):
+def flatten_union(type_: Optional) -> Tuple:
+    return _cached(_flatten_union, type_)
+
+
+def _flatten_union(type_: Optional) -> Tuple:
+    return tuple(_iterate_union(type_))
+
+
+def _iterate_union(type_: Optional):
     if not type_:
         return
-    type_ = _flatten_new_type(type_)
+    type_ = flatten_new_type(type_)
     origin = getattr(type_, "__origin__", None)
     if origin is Union:
         for arg_type in type_.__args__:
-            yield from flatten_union(arg_type)
+            yield from _iterate_union(arg_type)
     else:
         yield type_
 
@@ -148,7 +188,7 @@ def aggregation_type_factory(type_):
 def unwrap_optional(type_: Optional):
     if not type_:
         return
-    type_ = _flatten_new_type(type_)
+    type_ = flatten_new_type(type_)
     origin = getattr(type_, "__origin__", None)
     if origin is Union:
         args = [arg for arg in type_.__args__ if arg is not _NoneType]
@@ -157,8 +197,8 @@ def unwrap_optional(type_: Optional):
     return type_
 
 
-def _flatten_new_type(type_):
+def flatten_new_type(type_):
     supertype = getattr(type_, "__supertype__", None)
     if supertype is not None:
-        return _flatten_new_type(supertype)
+        return flatten_new_type(supertype)
     return type_
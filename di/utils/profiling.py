@@ -0,0 +1,159 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+
+@dataclass
+class Span:
+    name: str
+    category: str
+    # perf counter based times in seconds
+    start: float
+    end: float = 0.0
+    thread_id: int = 0
+    args: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    def set(self, **args: Any):
+        self.args.update(args)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def set(self, **args: Any):
+        pass
+
+
+# span given by profile_span when no profiler is active
+null_span = _NullSpan()
+
+
+class ProfilerSink:
+    def record(self, span: Span):
+        raise NotImplementedError
+
+
+class MemoryProfilerSink(ProfilerSink):
+    def __init__(self):
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def record(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+
+    def by_category(self, category: str) -> List[Span]:
+        return [span for span in self.spans if span.category == category]
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        return chrome_trace(self.spans)
+
+
+class Profiler:
+    def __init__(self, sink: ProfilerSink):
+        self.sink = sink
+
+    @contextmanager
+    def span(self, name: str, category: str, **args: Any) -> Iterator[Span]:
+        span = Span(
+            name=name,
+            category=category,
+            start=time.perf_counter(),
+            thread_id=threading.get_ident(),
+            args=args,
+        )
+        try:
+            yield span
+        finally:
+            span.end = time.perf_counter()
+            self.sink.record(span)
+
+    @contextmanager
+    def activate(self) -> Iterator["Profiler"]:
+        token = _profiler.set(self)
+        try:
+            yield self
+        finally:
+            _profiler.reset(token)
+
+
+_profiler: ContextVar[Optional[Profiler]] = ContextVar("di_profiler", default=None)
+
+
+@contextmanager
+def _null_context() -> Iterator[_NullSpan]:
+    yield null_span
+
+
+def active_profiler() -> Optional[Profiler]:
+    return _profiler.get()
+
+
+def profile_span(name: str, category: str, **args: Any):
+    # spans are recorded only within active profiler
+    profiler = _profiler.get()
+    if profiler is None:
+        return _null_context()
+    return profiler.span(name, category, **args)
+
+
+@contextmanager
+def profile(sink: Optional[ProfilerSink] = None) -> Iterator[ProfilerSink]:
+    sink = sink or MemoryProfilerSink()
+    with Profiler(sink).activate():
+        yield sink
+
+
+def chrome_trace(spans: Iterable[Span]) -> Dict[str, Any]:
+    # trace event format, complete events with microsecond timestamps
+    pid = os.getpid()
+    return {
+        "traceEvents": [
+            {
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": span.start * 1e6,
+                "dur": span.duration * 1e6,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": {key: _trace_arg(value) for key, value in span.args.items()},
+            }
+            for span in sorted(spans, key=lambda span: span.start)
+        ],
+        "displayTimeUnit": "ms",
+    }
+
+
+def _trace_arg(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+def write_chrome_trace(spans: Iterable[Span], path: Union[str, os.PathLike]):
+    with open(path, "w", encoding="utf-8") as fp:
+        json.dump(chrome_trace(spans), fp)
+
+
+__all__ = [
+    "MemoryProfilerSink",
+    "Profiler",
+    "ProfilerSink",
+    "Span",
+    "active_profiler",
+    "chrome_trace",
+    "null_span",
+    "profile",
+    "profile_span",
+    "write_chrome_trace",
+]
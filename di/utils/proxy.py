@@ -0,0 +1,228 @@
+import math
+import operator
+import os
+from threading import Lock
+from typing import Any, Callable, Optional
+
+_unresolved = object()
+_get = object.__getattribute__
+_set = object.__setattr__
+
+
+def _forward(name: str) -> Callable:
+    def _method(self, *args, **kwargs):
+        return getattr(_target(self), name)(*args, **kwargs)
+
+    _method.__name__ = name
+    return _method
+
+
+def _target(proxy: "LazyProxy") -> Any:
+    target = _get(proxy, "_target")
+    if target is not _unresolved:
+        return target
+    with _get(proxy, "_lock"):
+        target = _get(proxy, "_target")
+        if target is _unresolved:
+            target = _get(proxy, "_factory")()
+            _set(proxy, "_target", target)
+            _set(proxy, "_factory", None)
+    return target
+
+
+class LazyProxy:
+    # transparent proxy calling factory on first use;
+    # isinstance checks use declared type without calling factory,
+    # any other use (including hashing and equality, so also putting
+    # proxy in sets or dict keys) creates target
+    __slots__ = "_factory", "_type", "_lock", "_target", "__weakref__"
+
+    def __init__(self, factory: Callable[[], Any], type_: Optional[type] = None):
+        _set(self, "_factory", factory)
+        _set(self, "_type", type_)
+        _set(self, "_lock", Lock())
+        _set(self, "_target", _unresolved)
+
+    @property  # type: ignore
+    def __class__(self):
+        type_ = _get(self, "_type")
+        if type_ is not None:
+            return type_
+        return type(_target(self))
+
+    def __getattr__(self, name: str):
+        return getattr(_target(self), name)
+
+    def __setattr__(self, name: str, value: Any):
+        setattr(_target(self), name, value)
+
+    def __delattr__(self, name: str):
+        delattr(_target(self), name)
+
+    def __dir__(self):
+        return dir(_target(self))
+
+    def __repr__(self):
+        return repr(_target(self))
+
+    def __str__(self):
+        return str(_target(self))
+
+    def __bytes__(self):
+        return bytes(_target(self))
+
+    def __format__(self, format_spec: str):
+        return format(_target(self), format_spec)
+
+    def __bool__(self):
+        return bool(_target(self))
+
+    def __hash__(self):
+        return hash(_target(self))
+
+    def __index__(self):
+        return operator.index(_target(self))
+
+    def __int__(self):
+        return int(_target(self))
+
+    def __float__(self):
+        return float(_target(self))
+
+    def __complex__(self):
+        return complex(_target(self))
+
+    def __round__(self, *args):
+        return round(_target(self), *args)
+
+    def __trunc__(self):
+        return math.trunc(_target(self))
+
+    def __floor__(self):
+        return math.floor(_target(self))
+
+    def __ceil__(self):
+        return math.ceil(_target(self))
+
+    def __fspath__(self):
+        return os.fspath(_target(self))
+
+    def __pow__(self, other, *modulo):
+        return pow(_target(self), other, *modulo)
+
+    def __rpow__(self, other):
+        return pow(other, _target(self))
+
+    def __reversed__(self):
+        return reversed(_target(self))
+
+    def __await__(self):
+        return _target(self).__await__()
+
+    __call__ = _forward("__call__")
+    __len__ = _forward("__len__")
+    __length_hint__ = _forward("__length_hint__")
+    __iter__ = _forward("__iter__")
+    __next__ = _forward("__next__")
+    __contains__ = _forward("__contains__")
+    __getitem__ = _forward("__getitem__")
+    __setitem__ = _forward("__setitem__")
+    __delitem__ = _forward("__delitem__")
+    __enter__ = _forward("__enter__")
+    __exit__ = _forward("__exit__")
+    __aiter__ = _forward("__aiter__")
+    __anext__ = _forward("__anext__")
+    __aenter__ = _forward("__aenter__")
+    __aexit__ = _forward("__aexit__")
+
+
+def _unary(function: Callable[[Any], Any]) -> Callable:
+    def _method(self):
+        return function(_target(self))
+
+    return _method
+
+
+def _binary(function: Callable[[Any, Any], Any]) -> Callable:
+    def _method(self, other):
+        return function(_target(self), other)
+
+    return _method
+
+
+def _reflected(function: Callable[[Any, Any], Any]) -> Callable:
+    def _method(self, other):
+        return function(other, _target(self))
+
+    return _method
+
+
+# operators are applied to target, so fallback to reflected
+# operations of other operand works as for target itself
+for _name, _function in [
+    ("neg", operator.neg),
+    ("pos", operator.pos),
+    ("abs", operator.abs),
+    ("invert", operator.invert),
+]:
+    setattr(LazyProxy, f"__{_name}__", _unary(_function))
+
+for _name, _function in [
+    ("lt", operator.lt),
+    ("le", operator.le),
+    ("eq", operator.eq),
+    ("ne", operator.ne),
+    ("gt", operator.gt),
+    ("ge", operator.ge),
+]:
+    setattr(LazyProxy, f"__{_name}__", _binary(_function))
+
+for _name, _function in [
+    ("add", operator.add),
+    ("sub", operator.sub),
+    ("mul", operator.mul),
+    ("matmul", operator.matmul),
+    ("truediv", operator.truediv),
+    ("floordiv", operator.floordiv),
+    ("mod", operator.mod),
+    ("divmod", divmod),
+    ("lshift", operator.lshift),
+    ("rshift", operator.rshift),
+    ("and", operator.and_),
+    ("xor", operator.xor),
+    ("or", operator.or_),
+]:
+    setattr(LazyProxy, f"__{_name}__", _binary(_function))
+    setattr(LazyProxy, f"__r{_name}__", _reflected(_function))
+
+for _name, _function in [
+    ("add", operator.iadd),
+    ("sub", operator.isub),
+    ("mul", operator.imul),
+    ("matmul", operator.imatmul),
+    ("truediv", operator.itruediv),
+    ("floordiv", operator.ifloordiv),
+    ("mod", operator.imod),
+    ("pow", operator.ipow),
+    ("lshift", operator.ilshift),
+    ("rshift", operator.irshift),
+    ("and", operator.iand),
+    ("xor", operator.ixor),
+    ("or", operator.ior),
+]:
+    setattr(LazyProxy, f"__i{_name}__", _binary(_function))
+
+
+def is_lazy_resolved(proxy: LazyProxy) -> bool:
+    return _get(proxy, "_target") is not _unresolved
+
+
+def lazy_target(proxy: LazyProxy) -> Any:
+    return _target(proxy)
+
+
+__all__ = [
+    "LazyProxy",
+    "is_lazy_resolved",
+    "lazy_target",
+]
@@ -0,0 +1,125 @@
+import itertools
+from typing import Any, Callable, Generic, Iterable, Optional, Set, TypeVar
+
+T = TypeVar("T")
+
+# every mutation stamps versioned set with next global version,
+# so newer stamp is greater than any stamp issued before;
+# next() on itertools.count is atomic in CPython
+_versions = itertools.count(1)
+_version = 0
+
+
+def current_version() -> int:
+    return _version
+
+
+def _next_version() -> int:
+    global _version
+    _version = next(_versions)
+    return _version
+
+
+def _mutating(name: str) -> Callable:
+    method = getattr(set, name)
+
+    def _mutate(self, *args):
+        try:
+            return method(self, *args)
+        finally:
+            self.version = _next_version()
+
+    _mutate.__name__ = name
+    return _mutate
+
+
+class VersionedSet(Set[T]):
+    __slots__ = ("version",)
+
+    add = _mutating("add")
+    discard = _mutating("discard")
+    remove = _mutating("remove")
+    pop = _mutating("pop")
+    clear = _mutating("clear")
+    update = _mutating("update")
+    difference_update = _mutating("difference_update")
+    intersection_update = _mutating("intersection_update")
+    symmetric_difference_update = _mutating("symmetric_difference_update")
+    __ior__ = _mutating("__ior__")
+    __iand__ = _mutating("__iand__")
+    __isub__ = _mutating("__isub__")
+    __ixor__ = _mutating("__ixor__")
+
+    def __init__(self, iterable: Iterable[T] = ()):
+        set.__init__(self, iterable)
+        self.version = _next_version()
+
+
+def versioned(value: Any) -> VersionedSet:
+    if isinstance(value, VersionedSet):
+        # set assigned again gets newer version than set it replaces
+        value.version = _next_version()
+        return value
+    return VersionedSet(value)
+
+
+def version_of(values: Iterable[Any]) -> Optional[int]:
+    # mutation of any set stamps it with version greater than all others,
+    # so latest version of sets changes whenever any of them changes;
+    # None for sets which are not versioned
+    latest = 0
+    for value in values:
+        if not isinstance(value, VersionedSet):
+            return None
+        if value.version > latest:
+            latest = value.version
+    return latest
+
+
+def _instance_sets(instance: Any) -> Iterable[VersionedSet]:
+    return [
+        value for value in vars(instance).values() if isinstance(value, VersionedSet)
+    ]
+
+
+class versioned_property(Generic[T]):
+    # cached property recomputed after mutation of versioned sets it depends
+    # on, by default versioned sets held by instance
+    def __init__(
+        self,
+        func: Callable[[Any], T],
+        dependencies: Optional[Callable[[Any], Iterable[Any]]] = None,
+    ):
+        self.func = func
+        self.dependencies = dependencies or _instance_sets
+        self.attr_name = f"_{func.__name__}_versioned"
+
+    @classmethod
+    def depending_on(
+        cls, dependencies: Callable[[Any], Iterable[Any]]
+    ) -> Callable[[Callable[[Any], T]], "versioned_property[T]"]:
+        def _decorate(func: Callable[[Any], T]) -> "versioned_property[T]":
+            return cls(func, dependencies)
+
+        return _decorate
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        cache = instance.__dict__
+        entry = cache.get(self.attr_name)
+        version = version_of(self.dependencies(instance))
+        if entry is not None and version is not None and entry[0] == version:
+            return entry[1]
+        value = self.func(instance)
+        cache[self.attr_name] = version, value
+        return value
+
+
+__all__ = [
+    "VersionedSet",
+    "current_version",
+    "version_of",
+    "versioned",
+    "versioned_property",
+]
@@ -1,7 +1,9 @@
-from typing import Iterable, List
+from abc import ABC
+from typing import Iterable, List, NewType, Optional, Union
 
 from di.core.assignment import (
     DirectMatcher,
+    IndexedValues,
     TypeAggregationMatcher,
     TypeIterableMatcher,
     TypeMatcher,
@@ -115,3 +117,53 @@ def test_aggregation_matcher():
     assert [*aggregation_matcher.iterate(d, {v1, v2})] == [v1]
     d.source = v1.source = v2.source = _e()
     assert [*aggregation_matcher.iterate(d, {v1, v2})] == []
+
+
+class Registered(ABC):
+    pass
+
+
+Registered.register(Y)
+
+XAlias = NewType("XAlias", X)
+
+
+def test_type_matcher_indexed_values():
+    type_matcher = TypeMatcher()
+    aggregation_matcher = TypeAggregationMatcher()
+
+    values = {
+        Value(source=_e(), type=type_)
+        for type_ in [X, X1, Y, int, XAlias, Optional[X1], List[X]]
+    }
+    indexed = IndexedValues(values)
+    for type_ in [X, X1, Y, Registered, XAlias, Union[X, Y], Optional[X], int]:
+        d = Dependency(source=_e(), arg="test", type=type_)
+        expected = {*type_matcher.iterate(d, values)}
+        assert {*type_matcher.iterate(d, indexed)} == expected
+
+        # noinspection PyTypeChecker
+        d = Dependency(source=_e(), arg="test", type=List[type_])
+        expected = {*aggregation_matcher.iterate(d, values)}
+        assert {*aggregation_matcher.iterate(d, indexed)} == expected
+
+    d = Dependency(source=_e(), arg="test", type=X)
+    assert {value.type for value in type_matcher.iterate(d, indexed)} == {
+        X,
+        X1,
+        XAlias,
+    }
+    d = Dependency(source=_e(), arg="test", type=Registered)
+    assert {value.type for value in type_matcher.iterate(d, indexed)} == {Y}
+
+
+def test_type_matcher_indexed_values_order():
+    type_matcher = TypeMatcher()
+    ordered = [
+        Value(source=_e(), type=type_)
+        for type_ in [X1, Union[X1, X], X, XAlias, X1, Optional[X1]]
+    ]
+    indexed = IndexedValues(ordered)
+    d = Dependency(source=_e(), arg="test", type=X)
+    # indexed and not indexed values are matched in order they were given
+    assert [*type_matcher.iterate(d, indexed)] == [*type_matcher.iterate(d, ordered)]
@@ -1,18 +1,51 @@
 import itertools
+import json
+from concurrent.futures import Executor, Future
+from concurrent.futures.process import BrokenProcessPool
 from typing import Mapping
 
 import pytest
 
+from di.core.app import Application
+from di.core.assignment import (
+    AggregationAssignmentFactory,
+    AssignmentFactory,
+    AssignmentFactorySelector,
+    DirectAssignmentFactory,
+)
 from di.core.compose import (
+    AbstractApplicationComposer,
     ApplicationComposer,
     ApplicationComposerConsistencyError,
     ApplicationComposerModuleAssignmentError,
     ApplicationComposerModuleCyclicDependencyError,
     ApplicationComposerUnresolvedImportError,
+    ComposedApplication,
+    ComposedApplicationLoadError,
+    ComposedApplicationSerializationError,
+    IncrementalApplicationComposer,
+    ParallelApplicationComposer,
+    StoredApplicationComposer,
+    dump_composed,
+    element_key,
+    load_composed,
 )
+from di.core.element import Dependency, Element
 from di.core.injection import InjectionPlan, InjectionSolver
+from di.core.injectors import FactoryInjector
+from di.core.instance import RecursiveApplicationInstanceBuilder
 from di.core.module import Module, ModuleElementConsistencyCheck, ModuleImportSolver
-from tests.di.core.conftest import AppGenerator
+from di.core.provide_strategies import SingletonProvideStrategy
+from tests.di.core.conftest import (
+    B1,
+    C1,
+    C2,
+    X2,
+    AppGenerator,
+    X,
+    YAgg,
+    _create_elements,
+)
 
 
 @pytest.fixture
@@ -88,3 +121,308 @@ def test_bootstrap_sequence(app_generator: AppGenerator, composer: ApplicationCo
         for step in module_step.steps:
             examined_sequence.extend(step)
     assert expected_sequence == examined_sequence
+
+
+def _composed_keys(composed: ComposedApplication):
+    def _keys(elements):
+        return sorted(element_key(element) for element in elements)
+
+    return {
+        "import_steps": [
+            sorted(module.name for module in step)
+            for step in composed.import_plan.steps
+        ],
+        "import_edges": sorted(
+            (edge.source.name, edge.target.name)
+            for edge in composed.import_plan.graph.edges
+        ),
+        "injection_plans": [
+            (
+                plan.module.name,
+                sorted(
+                    (
+                        element_key(assignment.dependency.source),
+                        assignment.dependency.arg,
+                        type(assignment.mapper).__name__,
+                        [element_key(value.source) for value in assignment.values],
+                    )
+                    for assignment in plan.assignments
+                ),
+                [_keys(stage) for stage in plan.stages],
+                sorted(
+                    (element_key(edge.source), element_key(edge.target))
+                    for edge in plan.graph.edges
+                ),
+            )
+            for plan in composed.injection_plans
+        ],
+        "bootstrap_steps": [
+            (step.module.name, [_keys(stage) for stage in step.steps])
+            for step in composed.bootstrap_steps
+        ],
+    }
+
+
+def test_compose_serialization(composer: ApplicationComposer):
+    composed = composer.compose(AppGenerator().bootstrap_app)
+    data = json.loads(json.dumps(dump_composed(composed)))
+
+    # application rebuilt with new elements, like in another process
+    application = AppGenerator().bootstrap_app
+    loaded = load_composed(application, data)
+
+    assert loaded.application is application
+    assert _composed_keys(loaded) == _composed_keys(composed)
+    instance = RecursiveApplicationInstanceBuilder(loaded).build()
+    (c2e,) = [e for e in application.elements if e.injector.factory is C2]
+    assert isinstance(instance.value_of(c2e), C2)
+
+
+def test_compose_serialization_invalid(composer: ApplicationComposer):
+    composed = composer.compose(AppGenerator().bootstrap_app)
+    data = dump_composed(composed)
+
+    with pytest.raises(ComposedApplicationLoadError):
+        load_composed(AppGenerator().valid_app, data)
+    with pytest.raises(ComposedApplicationLoadError):
+        load_composed(AppGenerator().bootstrap_app, {**data, "fingerprint": ""})
+    with pytest.raises(ComposedApplicationLoadError):
+        load_composed(AppGenerator().bootstrap_app, {**data, "version": 0})
+    with pytest.raises(ComposedApplicationLoadError):
+        load_composed(AppGenerator().bootstrap_app, {**data, "injection_plans": 1})
+
+    elements = [
+        Element(injector=FactoryInjector(X), strategy=SingletonProvideStrategy())
+        for _ in range(2)
+    ]
+    ambiguous = Application(modules={Module(elements={*elements})})
+    with pytest.raises(ComposedApplicationSerializationError):
+        dump_composed(composer.compose(ambiguous))
+
+
+class _CountingComposer(AbstractApplicationComposer):
+    def __init__(self, composer: ApplicationComposer):
+        self.composer = composer
+        self.calls = 0
+
+    def compose(self, application: Application) -> ComposedApplication:
+        self.calls += 1
+        return self.composer.compose(application)
+
+
+def test_compose_stored(composer: ApplicationComposer, tmp_path):
+    counting = _CountingComposer(composer)
+    errors = []
+    stored = StoredApplicationComposer(
+        counting, tmp_path / "composed.json", on_error=errors.append
+    )
+
+    composed = stored.compose(AppGenerator().bootstrap_app)
+    assert counting.calls == 1
+    assert len(errors) == 1
+    assert (tmp_path / "composed.json").exists()
+
+    loaded = stored.compose(AppGenerator().bootstrap_app)
+    assert counting.calls == 1
+    assert len(errors) == 1
+    assert _composed_keys(loaded) == _composed_keys(composed)
+
+    stored.compose(AppGenerator().valid_app)
+    assert counting.calls == 2
+    assert len(errors) == 2
+
+
+@pytest.fixture
+def incremental_composer() -> IncrementalApplicationComposer:
+    return IncrementalApplicationComposer(
+        InjectionSolver(),
+        ModuleImportSolver(),
+        ModuleElementConsistencyCheck(),
+    )
+
+
+def test_compose_incremental(
+    incremental_composer: IncrementalApplicationComposer,
+    composer: ApplicationComposer,
+):
+    gen = AppGenerator()
+    previous = incremental_composer.compose(gen.valid_app)
+    previous_plans = {plan.module: plan for plan in previous.injection_plans}
+
+    # module B is reloaded with new elements
+    (old_b1,) = gen.b_elements
+    b_reloaded = Module(name="B", imports={gen.a_module})
+    b_reloaded.elements = {*_create_elements(B1)}
+    b_reloaded.exports = {*b_reloaded.elements}
+    gen.c_module.imports = {gen.a_module, b_reloaded}
+    application = Application(modules={gen.a_module, b_reloaded, gen.c_module})
+    result = incremental_composer.recompose(previous, application)
+
+    assert result.solved == {b_reloaded, gen.c_module}
+    plans = {plan.module: plan for plan in result.composed.injection_plans}
+    assert plans[gen.a_module] is previous_plans[gen.a_module]
+    assert plans[gen.c_module] is not previous_plans[gen.c_module]
+    assert result.rebuild == {*b_reloaded.elements, *gen.c_module.elements}
+    assert result.removed == {old_b1}
+    assert _composed_keys(result.composed) == _composed_keys(
+        composer.compose(application)
+    )
+
+
+def test_compose_incremental_changed(
+    incremental_composer: IncrementalApplicationComposer,
+):
+    gen = AppGenerator()
+    previous = incremental_composer.compose(gen.valid_app)
+    previous_plans = {plan.module: plan for plan in previous.injection_plans}
+
+    result = incremental_composer.recompose(previous, changed=[gen.a_module])
+    assert result.solved == {gen.a_module}
+    assert result.rebuild == set()
+    assert result.removed == set()
+    for plan in result.composed.injection_plans:
+        assert (plan is previous_plans[plan.module]) == (
+            plan.module is not gen.a_module
+        )
+
+    # module C gets new element, nothing depends on it
+    (c1,) = _create_elements(C1)
+    (old_c1,) = [e for e in gen.c_module.elements if e.injector.factory is C1]
+    gen.c_module.elements = {*gen.c_module.elements - {old_c1}, c1}
+    gen.c_module.exports = {*gen.c_module.elements}
+    result = incremental_composer.recompose(previous, changed=[gen.c_module])
+    assert result.solved == {gen.c_module}
+    c2 = [e for e in gen.c_module.elements if e.injector.factory is C2]
+    assert result.rebuild == {c1, *c2}
+    assert result.removed == {old_c1}
+
+
+class _AggregationSelector(AssignmentFactorySelector):
+    def __init__(self):
+        self._direct = DirectAssignmentFactory()
+        self._agg = AggregationAssignmentFactory()
+
+    def select(self, dependency: Dependency) -> AssignmentFactory:
+        if dependency.source.value().type is YAgg:
+            return self._agg
+        return self._direct
+
+
+def _parallel_composer(min_step_size: int = 1) -> ParallelApplicationComposer:
+    return ParallelApplicationComposer(
+        InjectionSolver(factory_selector=_AggregationSelector()),
+        ModuleImportSolver(),
+        ModuleElementConsistencyCheck(),
+        max_workers=2,
+        min_step_size=min_step_size,
+    )
+
+
+def _plans_signature(composed: ComposedApplication):
+    return [
+        (
+            plan.module,
+            [
+                (
+                    assignment.dependency.source,
+                    assignment.dependency.arg,
+                    type(assignment.mapper),
+                    getattr(assignment.mapper, "iterate_args", None),
+                    [value.source for value in assignment.values],
+                )
+                for assignment in plan.assignments
+            ],
+            [{*stage} for stage in plan.stages],
+            {(edge.source, edge.target) for edge in plan.graph.edges},
+        )
+        for plan in composed.injection_plans
+    ]
+
+
+def _wide_app(modules: int) -> Application:
+    base = Module(name="base", elements={*_create_elements(X)})
+    base.exports = {*base.elements}
+    application = Application(modules={base})
+    for index in range(modules):
+        module = Module(
+            name=f"wide{index}",
+            imports={base},
+            elements={*_create_elements(X2, X2, YAgg)},
+        )
+        application.modules.add(module)
+    return application
+
+
+def test_compose_parallel():
+    serial = ApplicationComposer(
+        InjectionSolver(factory_selector=_AggregationSelector()),
+        ModuleImportSolver(),
+        ModuleElementConsistencyCheck(),
+    )
+    wide = _wide_app(8)
+    for application in [AppGenerator().bootstrap_app, wide]:
+        composed = _parallel_composer().compose(application)
+        expected = serial.compose(application)
+        assert _plans_signature(composed) == _plans_signature(expected)
+        assert composed.import_plan.steps == expected.import_plan.steps
+        assert [(step.module, [*step.steps]) for step in composed.bootstrap_steps] == [
+            (step.module, [*step.steps]) for step in expected.bootstrap_steps
+        ]
+
+
+def test_compose_parallel_errors():
+    gen = AppGenerator()
+    composer = _parallel_composer()
+    with pytest.raises(ApplicationComposerModuleAssignmentError) as exc_info:
+        composer.compose(gen.missing_assignment_app)
+    assert exc_info.value.module is gen.a_ma_module
+    assert exc_info.value.dependency.source in gen.a_ma_module.elements
+    with pytest.raises(ApplicationComposerModuleCyclicDependencyError):
+        composer.compose(gen.cyclic_dependency_app)
+
+
+def test_compose_parallel_not_picklable():
+    class _Local:
+        pass
+
+    class _LocalUser:
+        def __init__(self, local: _Local):
+            self.local = local
+
+    application = _wide_app(2)
+    module = Module(name="local", elements={*_create_elements(_Local, _LocalUser)})
+    application.modules.add(module)
+
+    composed = _parallel_composer().compose(application)
+    (plan,) = [plan for plan in composed.injection_plans if plan.module is module]
+    (assignment,) = plan.assignments
+    assert assignment.dependency.type is _Local
+
+
+class _BrokenExecutor(Executor):
+    def __init__(self, max_workers=None, fail_on_submit: bool = False):
+        self.fail_on_submit = fail_on_submit
+
+    def submit(self, fn, *args, **kwargs):
+        if self.fail_on_submit:
+            raise BrokenProcessPool("pool is broken")
+        future: Future = Future()
+        future.set_exception(ModuleNotFoundError("not importable in worker"))
+        return future
+
+
+@pytest.mark.parametrize("fail_on_submit", [False, True])
+def test_compose_parallel_worker_failure(fail_on_submit: bool):
+    composer = _parallel_composer()
+    composer.executor_factory = lambda max_workers: _BrokenExecutor(
+        max_workers, fail_on_submit
+    )
+    serial = ApplicationComposer(
+        InjectionSolver(factory_selector=_AggregationSelector()),
+        ModuleImportSolver(),
+        ModuleElementConsistencyCheck(),
+    )
+    application = _wide_app(3)
+    assert _plans_signature(composer.compose(application)) == _plans_signature(
+        serial.compose(application)
+    )
@@ -1,16 +1,72 @@
+import asyncio
+import json
+import sys
+import threading
+import time
+import traceback
+from typing import Any, Iterable, List, Optional, Type
+
 import pytest
 
+from di.core.app import Application
+from di.core.assignment import (
+    AggregationAssignmentFactory,
+    AssignmentFactory,
+    AssignmentFactorySelector,
+    DirectAssignmentFactory,
+)
 from di.core.compose import ApplicationComposer, ComposedApplication
-from di.core.element import Element
+from di.core.element import (
+    Dependency,
+    Element,
+    InjectionResult,
+    Injector,
+    InjectorDependency,
+    ProvideContext,
+    ProvideObserver,
+    ProvideStrategy,
+)
 from di.core.injection import InjectionSolver
+from di.core.injectors import FactoryInjector
 from di.core.instance import (
+    ApplicationInstance,
+    ApplicationInstanceBootstrapError,
+    ApplicationInstanceBuilder,
+    ApplicationInstanceCloseError,
     ApplicationInstanceElementNotFound,
-    RecursiveApplicationInstance,
+    ApplicationInstanceStateError,
+    AsyncRecursiveApplicationInstanceBuilder,
+    CompiledApplicationInstanceBuilder,
+    IterativeApplicationInstanceBuilder,
     RecursiveApplicationInstanceBuilder,
     RecursiveProvideContext,
+    ThreadPoolBootstrapExecutor,
+    ThreadSafeApplicationInstanceBuilder,
+    ThreadSafeProvideContext,
+    TimedApplicationInstanceBuilder,
+    ValuesCacheInfo,
+    bootstrap_stages,
+    element_name,
+    teardown_stages,
 )
-from di.core.module import ModuleElementConsistencyCheck, ModuleImportSolver
-from tests.di.core.conftest import AppGenerator
+from di.core.module import Module, ModuleElementConsistencyCheck, ModuleImportSolver
+from di.core.provide_strategies import (
+    LazySingletonProvideStrategy,
+    LocalProvideStrategy,
+    ProvideScopeError,
+    ScopedProvideStrategy,
+    SingletonProvideStrategy,
+)
+from di.utils.proxy import is_lazy_resolved
+from tests.di.core.conftest import X2, AppGenerator, X, Y, YAgg
+
+_builders = [
+    RecursiveApplicationInstanceBuilder,
+    CompiledApplicationInstanceBuilder,
+    IterativeApplicationInstanceBuilder,
+    ThreadSafeApplicationInstanceBuilder,
+    TimedApplicationInstanceBuilder,
+]
 
 
 @pytest.fixture
@@ -29,13 +85,14 @@ def composed(
     return composer.compose(app_generator.valid_app)
 
 
-def _build_instance(composed: ComposedApplication) -> RecursiveApplicationInstance:
-    return RecursiveApplicationInstanceBuilder(composed).build()
-
-
-def test_instance(composed: ComposedApplication, app_generator: AppGenerator):
+@pytest.mark.parametrize("builder", _builders)
+def test_instance(
+    composed: ComposedApplication,
+    app_generator: AppGenerator,
+    builder: Type[ApplicationInstanceBuilder],
+):
     gen = app_generator
-    instance = _build_instance(composed)
+    instance = builder(composed).build()
 
     a1e, a2e = gen.a_elements
     (b1e,) = gen.b_elements
@@ -51,9 +108,14 @@ def test_instance(composed: ComposedApplication, app_generator: AppGenerator):
     assert a2.a1 is a1
 
 
-def test_instance_not_found(composed: ComposedApplication, app_generator: AppGenerator):
+@pytest.mark.parametrize("builder", _builders)
+def test_instance_not_found(
+    composed: ComposedApplication,
+    app_generator: AppGenerator,
+    builder: Type[ApplicationInstanceBuilder],
+):
     gen = app_generator
-    instance = _build_instance(composed)
+    instance = builder(composed).build()
 
     bce = gen.b_cd_elements[-1]
     with pytest.raises(ApplicationInstanceElementNotFound):
@@ -88,3 +150,1253 @@ def test_instance_bootstrap(app_generator: AppGenerator, composer: ApplicationCo
             expected_sequence.extend(step)
     produced_sequence = _RecursiveProvideContext.primary_sequence
     assert expected_sequence == produced_sequence
+
+
+class _AggregationSelector(AssignmentFactorySelector):
+    def __init__(self):
+        self._direct = DirectAssignmentFactory()
+        self._agg = AggregationAssignmentFactory()
+
+    def select(self, dependency: Dependency) -> AssignmentFactory:
+        if dependency.source.value().type is YAgg:
+            return self._agg
+        return self._direct
+
+
+class _CountingStrategy(ProvideStrategy):
+    def __init__(self):
+        self.calls = 0
+
+    def provide(self, context: ProvideContext, element: Element) -> Any:
+        self.calls += 1
+        return context.eval(element)
+
+
+def _mixed_app():
+    counting = _CountingStrategy()
+    x, x2, y_agg, y, unknown = [
+        Element(injector=FactoryInjector(factory), strategy=strategy)
+        for factory, strategy in [
+            (X, SingletonProvideStrategy()),
+            (X2, LocalProvideStrategy()),
+            (YAgg, LocalProvideStrategy()),
+            (Y, counting),
+            (X, SingletonProvideStrategy()),
+        ]
+    ]
+    base = Module(name="base", elements={x}, exports={x})
+    plugins = Module(name="plugins", elements={x2}, exports={x2})
+    agg = Module(name="agg", elements={y_agg}, imports={base, plugins})
+    main = Module(name="main", elements={y}, imports={base})
+    app = Application(modules={base, plugins, agg, main})
+    composer = ApplicationComposer(
+        InjectionSolver(factory_selector=_AggregationSelector()),
+        ModuleImportSolver(),
+        ModuleElementConsistencyCheck(),
+    )
+    return composer.compose(app), (x, x2, y_agg, y, unknown), counting
+
+
+@pytest.mark.parametrize("builder", _builders)
+def test_instance_strategies(builder: Type[ApplicationInstanceBuilder]):
+    composed, (x, x2, y_agg, y, unknown), counting = _mixed_app()
+    instance: ApplicationInstance = builder(composed).build()
+
+    assert instance.value_of(x) is instance.value_of(x)
+    assert instance.value_of(x2) is not instance.value_of(x2)
+    agg1 = instance.value_of(y_agg)
+    agg2 = instance.value_of(y_agg)
+    assert agg1 is not agg2
+    assert isinstance(agg1.x, list) and len(agg1.x) == 2
+    assert {type(item) for item in agg1.x} == {X, X2}
+    assert instance.value_of(x) in agg1.x
+
+    y1 = instance.value_of(y)
+    y2 = instance.value_of(y)
+    assert y1 is not y2
+    assert counting.calls == 2
+    assert y1.x is instance.value_of(x)
+    with pytest.raises(ApplicationInstanceElementNotFound):
+        instance.value_of(unknown)
+
+
+@pytest.mark.parametrize("builder", _builders)
+def test_instance_values_cache(builder: Type[ApplicationInstanceBuilder]):
+    composed, (x, x2, y_agg, y, unknown), counting = _mixed_app()
+    instance = builder(composed).build()
+
+    # singleton only lookup is resolved once and reused
+    values = instance.values_by_type(X)
+    assert values == [instance.value_of(x)]
+    # cached lookup result is copied, so it may be modified by caller
+    values.append(None)
+    assert instance.values_by_type(X) == [instance.value_of(x)]
+    assert instance.values_by_type(X, module="base") == values[:1]
+
+    # lookups touching other strategies are always resolved
+    (first,) = instance.values_by_type(Y)
+    (second,) = instance.values_by_type(Y)
+    assert first is not second
+    assert counting.calls == 2
+    x_values = instance.values_by_type(X, strict=False)
+    assert isinstance(x_values, list) and len(x_values) == 2
+
+    assert instance.values_cache_info() == ValuesCacheInfo(
+        hits=1, misses=2, bypassed=3, currsize=2
+    )
+    assert isinstance(instance.values_by_type(Y), list)
+    forked = instance.fork()
+    assert forked.values_cache_info().currsize == 0
+    instance.clear_values_cache()
+    assert instance.values_cache_info() == ValuesCacheInfo(0, 0, 0, 0)
+
+
+class _LevelInjector(Injector):
+    def __init__(self, type_: type, previous: Optional[type]):
+        self._type = type_
+        self._previous = previous
+
+    def dependencies(self) -> Iterable[InjectorDependency]:
+        if self._previous:
+            return [InjectorDependency(arg="previous", type=self._previous)]
+        return []
+
+    def result(self) -> Optional[InjectionResult]:
+        return InjectionResult(type=self._type)
+
+    def __call__(self, previous=None):
+        value = self._type()
+        value.previous = previous
+        return value
+
+
+def _deep_app(depth: int, singleton: bool):
+    previous = None
+    elements = []
+    for level in range(depth):
+        type_ = type(f"Level{level}", (), {})
+        strategy = SingletonProvideStrategy() if singleton else LocalProvideStrategy()
+        injector = _LevelInjector(type_, previous)
+        elements.append(Element(injector=injector, strategy=strategy))
+        previous = type_
+    module = Module(elements={*elements}, exports={*elements})
+    composer = ApplicationComposer(
+        InjectionSolver(),
+        ModuleImportSolver(),
+        ModuleElementConsistencyCheck(),
+    )
+    return composer.compose(Application(modules={module})), elements
+
+
+@pytest.mark.parametrize(
+    "builder", [IterativeApplicationInstanceBuilder, CompiledApplicationInstanceBuilder]
+)
+@pytest.mark.parametrize("singleton", [True, False])
+def test_instance_iterative_deep(
+    builder: Type[ApplicationInstanceBuilder], singleton: bool
+):
+    depth = sys.getrecursionlimit() * 2
+    composed, elements = _deep_app(depth, singleton=singleton)
+
+    instance = RecursiveApplicationInstanceBuilder(composed).build()
+    with pytest.raises(RecursionError):
+        instance.value_of(elements[-1])
+
+    # compiled engine provides elements deeper than recursion limit allows
+    # by iterative engine
+    instance = builder(composed).build()
+    value = instance.value_of(elements[-1])
+    for level in reversed(range(depth)):
+        assert type(value).__name__ == f"Level{level}"
+        value = value.previous
+    assert value is None
+    assert (instance.value_of(elements[0]) is instance.value_of(elements[0])) == (
+        singleton
+    )
+
+
+class _FailingLevelInjector(_LevelInjector):
+    def __call__(self, previous=None):
+        raise RuntimeError("level failed")
+
+
+def test_instance_compiled_traceback():
+    composed, elements = _deep_app(2, singleton=True)
+    elements[1].injector.__class__ = _FailingLevelInjector
+    instance = CompiledApplicationInstanceBuilder(composed).build()
+    with pytest.raises(RuntimeError) as exc_info:
+        instance.value_of(elements[1])
+    # generated call source is available to traceback
+    formatted = "".join(traceback.format_tb(exc_info.tb))
+    assert "<di compiled call" in formatted
+    assert "return call(previous=thunk0())" in formatted
+
+
+def test_bootstrap_stages(app_generator: AppGenerator, composer: ApplicationComposer):
+    composed = composer.compose(app_generator.bootstrap_app)
+    dependencies = {
+        assignment.dependency.source: {value.source for value in assignment.values}
+        for injection_plan in composed.injection_plans
+        for assignment in injection_plan.assignments
+    }
+    created = set()
+    for stage in bootstrap_stages(composed):
+        for element in stage:
+            singletons = {
+                dependency
+                for dependency in dependencies.get(element, ())
+                if isinstance(dependency.strategy, SingletonProvideStrategy)
+            }
+            assert singletons <= created
+        created.update(stage)
+    bootstrap = {
+        element
+        for module_step in composed.bootstrap_steps
+        for step in module_step.steps
+        for element in step
+    }
+    assert bootstrap <= created
+
+
+class _SleepInjector(Injector):
+    def __init__(self, type_: type, dependency: Optional[type], delay: float):
+        self._type = type_
+        self._dependency = dependency
+        self._delay = delay
+        self.calls = 0
+        self.threads = set()
+
+    def dependencies(self) -> Iterable[InjectorDependency]:
+        if self._dependency:
+            return [InjectorDependency(arg="dependency", type=self._dependency)]
+        return []
+
+    def result(self) -> Optional[InjectionResult]:
+        return InjectionResult(type=self._type)
+
+    def __call__(self, dependency=None):
+        self.calls += 1
+        self.threads.add(threading.get_ident())
+        time.sleep(self._delay)
+        if self._type is _Failing:
+            raise ValueError("bootstrap failure")
+        return self._type()
+
+
+class _Shared:
+    pass
+
+
+class _Link:
+    pass
+
+
+class _Failing:
+    pass
+
+
+def _parallel_app(count: int, delay: float, failing: int = 0):
+    shared = Element(
+        injector=_SleepInjector(_Shared, None, delay),
+        strategy=SingletonProvideStrategy(),
+    )
+    link = Element(
+        injector=_SleepInjector(_Link, _Shared, 0.0), strategy=LocalProvideStrategy()
+    )
+    bootstrap = [
+        Element(
+            injector=_SleepInjector(type(f"Boot{index}", (), {}), _Link, delay),
+            strategy=SingletonProvideStrategy(),
+        )
+        for index in range(count)
+    ]
+    bootstrap.extend(
+        Element(
+            injector=_SleepInjector(_Failing, _Link, 0.0),
+            strategy=SingletonProvideStrategy(),
+        )
+        for _ in range(failing)
+    )
+    module = Module(
+        elements={shared, link, *bootstrap},
+        exports={shared, link},
+        bootstrap={*bootstrap},
+    )
+    composer = ApplicationComposer(
+        InjectionSolver(),
+        ModuleImportSolver(),
+        ModuleElementConsistencyCheck(),
+    )
+    return composer.compose(Application(modules={module})), shared, bootstrap
+
+
+@pytest.mark.parametrize("builder", _builders)
+def test_instance_parallel_bootstrap(builder):
+    count, delay = 8, 0.1
+    composed, shared, bootstrap = _parallel_app(count, delay)
+    executor = ThreadPoolBootstrapExecutor(max_workers=count)
+
+    start = time.perf_counter()
+    instance = builder(composed, bootstrap_executor=executor).build()
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < count * delay / 2
+    assert shared.injector.calls == 1
+    assert len({*(thread for e in bootstrap for thread in e.injector.threads)}) > 1
+    for element in bootstrap:
+        assert element.injector.calls == 1
+        assert instance.value_of(element) is instance.value_of(element)
+    assert shared.injector.calls == 1
+
+
+@pytest.mark.parametrize("builder", _builders)
+def test_instance_fork_parallel_bootstrap(builder):
+    count, delay = 8, 0.1
+    composed, shared, bootstrap = _parallel_app(count, delay)
+    executor = ThreadPoolBootstrapExecutor(max_workers=count)
+    instance = builder(composed, bootstrap_executor=executor).build()
+    for element in bootstrap:
+        element.injector.threads = set()
+
+    # no value is fork safe, so forked instance bootstraps all of them again
+    start = time.perf_counter()
+    forked = instance.fork()
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < count * delay / 2
+    assert len({*(thread for e in bootstrap for thread in e.injector.threads)}) > 1
+    for element in bootstrap:
+        assert element.injector.calls == 2
+        assert forked.value_of(element) is not instance.value_of(element)
+    assert shared.injector.calls == 2
+
+
+@pytest.mark.parametrize("builder", _builders)
+def test_instance_parallel_bootstrap_errors(builder):
+    composed, shared, bootstrap = _parallel_app(count=2, delay=0.0, failing=2)
+    executor = ThreadPoolBootstrapExecutor(max_workers=2)
+
+    with pytest.raises(ApplicationInstanceBootstrapError) as exc_info:
+        builder(composed, bootstrap_executor=executor).build()
+
+    failing = {e for e in bootstrap if e.injector.result().type is _Failing}
+    assert set(exc_info.value.errors) == failing
+    for error in exc_info.value.errors.values():
+        assert isinstance(error, ValueError)
+    assert shared.injector.calls == 1
+
+
+def test_instance_async_strategies():
+    composed, (x, x2, y_agg, y, unknown), counting = _mixed_app()
+
+    async def _check():
+        instance = await AsyncRecursiveApplicationInstanceBuilder(composed).build()
+        assert await instance.value_of(x) is await instance.value_of(x)
+        assert await instance.value_of(x2) is not await instance.value_of(x2)
+        agg = await instance.value_of(y_agg)
+        assert {type(item) for item in agg.x} == {X, X2}
+        assert await instance.value_of(x) in agg.x
+        y1, y2 = await asyncio.gather(instance.value_of(y), instance.value_of(y))
+        assert y1 is not y2
+        assert counting.calls == 2
+        assert y1.x is await instance.value_of(x)
+        (x_value,) = await instance.values_by_type(X, strict=True)
+        assert x_value is y1.x
+        with pytest.raises(ApplicationInstanceElementNotFound):
+            await instance.value_of(unknown)
+
+    asyncio.run(_check())
+
+
+class _AsyncSleepInjector(_SleepInjector):
+    def __call__(self, dependency=None):
+        return self._create()
+
+    async def _create(self):
+        self.calls += 1
+        await asyncio.sleep(self._delay)
+        if self._type is _Failing:
+            raise ValueError("bootstrap failure")
+        return self._type()
+
+
+def _async_app(delay: float, failing: int = 0):
+    def _element(type_, dependency, delay_, strategy):
+        injector = _AsyncSleepInjector(type_, dependency, delay_)
+        return Element(injector=injector, strategy=strategy)
+
+    shared = _element(_Shared, None, delay, SingletonProvideStrategy())
+    link = _element(_Link, _Shared, delay, LocalProvideStrategy())
+    bootstrap = [
+        _element(type(f"Boot{index}", (), {}), _Link, delay, SingletonProvideStrategy())
+        for index in range(4)
+    ]
+    bootstrap.extend(
+        _element(_Failing, _Shared, 0.0, SingletonProvideStrategy())
+        for _ in range(failing)
+    )
+    module = Module(
+        elements={shared, link, *bootstrap},
+        exports={shared, link},
+        bootstrap={*bootstrap},
+    )
+    composer = ApplicationComposer(
+        InjectionSolver(),
+        ModuleImportSolver(),
+        ModuleElementConsistencyCheck(),
+    )
+    return composer.compose(Application(modules={module})), shared, link, bootstrap
+
+
+def test_instance_async_bootstrap():
+    delay = 0.1
+    composed, shared, link, bootstrap = _async_app(delay)
+
+    async def _check():
+        start = time.perf_counter()
+        instance = await AsyncRecursiveApplicationInstanceBuilder(composed).build()
+        elapsed = time.perf_counter() - start
+        # slowest chain is shared -> link -> bootstrap element
+        assert elapsed < 5 * delay
+        assert shared.injector.calls == 1
+        assert link.injector.calls == len(bootstrap)
+        for element in bootstrap:
+            value = await instance.value_of(element)
+            assert value is await instance.value_of(element)
+            assert not asyncio.iscoroutine(value)
+
+    asyncio.run(_check())
+
+
+def test_instance_async_bootstrap_errors():
+    composed, shared, link, bootstrap = _async_app(delay=0.0, failing=2)
+
+    with pytest.raises(ApplicationInstanceBootstrapError) as exc_info:
+        asyncio.run(AsyncRecursiveApplicationInstanceBuilder(composed).build())
+
+    failing = {e for e in bootstrap if e.injector.result().type is _Failing}
+    assert set(exc_info.value.errors) == failing
+    assert shared.injector.calls == 1
+
+
+class _Session:
+    def __init__(self, x: X):
+        self.x = x
+
+
+class _Unit:
+    def __init__(self, session: _Session):
+        self.session = session
+
+
+class _Handler:
+    def __init__(self, unit: _Unit, session: _Session):
+        self.unit = unit
+        self.session = session
+
+
+def _scoped_app():
+    x, session, unit, handler = [
+        Element(injector=FactoryInjector(factory), strategy=strategy)
+        for factory, strategy in [
+            (X, SingletonProvideStrategy()),
+            (_Session, ScopedProvideStrategy()),
+            (_Unit, LocalProvideStrategy()),
+            (_Handler, LocalProvideStrategy()),
+        ]
+    ]
+    module = Module(elements={x, session, unit, handler})
+    composer = ApplicationComposer(
+        InjectionSolver(),
+        ModuleImportSolver(),
+        ModuleElementConsistencyCheck(),
+    )
+    return composer.compose(Application(modules={module})), session, handler
+
+
+@pytest.mark.parametrize("builder", _builders)
+def test_instance_scope(builder: Type[ApplicationInstanceBuilder]):
+    composed, session, handler = _scoped_app()
+    instance = builder(composed).build()
+
+    with pytest.raises(ProvideScopeError):
+        instance.value_of(handler)
+
+    with instance.scope():
+        handler1 = instance.value_of(handler)
+        handler2 = instance.value_of(handler)
+        assert handler1 is not handler2
+        assert handler1.session is handler1.unit.session
+        assert handler1.session is handler2.session
+        assert handler1.session is instance.value_of(session)
+    with instance.scope():
+        assert instance.value_of(handler).session is not handler1.session
+        assert instance.value_of(handler).session.x is handler1.session.x
+
+
+def test_instance_async_scope():
+    composed, session, handler = _scoped_app()
+
+    async def _request(instance):
+        async with instance.scope():
+            handler1, handler2 = await asyncio.gather(
+                instance.value_of(handler), instance.value_of(handler)
+            )
+            assert handler1 is not handler2
+            assert handler1.session is handler2.session
+            assert handler1.session is handler1.unit.session
+            return handler1.session
+
+    async def _main():
+        instance = await AsyncRecursiveApplicationInstanceBuilder(composed).build()
+        with pytest.raises(ProvideScopeError):
+            await instance.value_of(handler)
+        return await asyncio.gather(*(_request(instance) for _ in range(3)))
+
+    sessions = asyncio.run(_main())
+    assert len({id(session) for session in sessions}) == 3
+
+
+class _Pool:
+    def __init__(self, x: X):
+        self.x = x
+
+
+class _PoolClient:
+    def __init__(self, pool: _Pool):
+        self.pool = pool
+
+
+def test_instance_thread_safe_singletons():
+    threads = 64
+    calls = []
+
+    def _create_pool(x: X) -> _Pool:
+        calls.append(x)
+        time.sleep(0.01)
+        return _Pool(x)
+
+    x, pool, client = [
+        Element(injector=FactoryInjector(factory), strategy=strategy)
+        for factory, strategy in [
+            (X, SingletonProvideStrategy()),
+            (_create_pool, SingletonProvideStrategy()),
+            (_PoolClient, LocalProvideStrategy()),
+        ]
+    ]
+    module = Module(elements={x, pool, client})
+    composer = ApplicationComposer(
+        InjectionSolver(),
+        ModuleImportSolver(),
+        ModuleElementConsistencyCheck(),
+    )
+    composed = composer.compose(Application(modules={module}))
+    instance = ThreadSafeApplicationInstanceBuilder(composed).build()
+
+    barrier = threading.Barrier(threads)
+    results = [None] * threads
+
+    def _resolve(index: int):
+        barrier.wait()
+        results[index] = instance.value_of(client)
+
+    workers = [
+        threading.Thread(target=_resolve, args=(index,)) for index in range(threads)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert len(calls) == 1
+    assert len({id(result) for result in results}) == threads
+    assert len({id(result.pool) for result in results}) == 1
+    assert results[0].pool.x is instance.value_of(x)
+
+    # built singletons are read without taking element lock
+    ctx: ThreadSafeProvideContext = instance._ctx
+    with ctx.locks.lock(pool):
+        reader = threading.Thread(target=instance.value_of, args=(pool,))
+        reader.start()
+        reader.join(timeout=5)
+        assert not reader.is_alive()
+
+
+class _Socket:
+    pass
+
+
+class _Worker:
+    def __init__(self, socket: _Socket):
+        self.socket = socket
+
+
+class _Client:
+    def __init__(self, worker: _Worker, x: X):
+        self.worker = worker
+        self.x = x
+
+
+def _fork_app():
+    x, y, socket, worker, client = [
+        Element(injector=FactoryInjector(factory), strategy=strategy)
+        for factory, strategy in [
+            (X, SingletonProvideStrategy()),
+            (Y, SingletonProvideStrategy()),
+            (_Socket, SingletonProvideStrategy()),
+            (_Worker, LocalProvideStrategy()),
+            (_Client, SingletonProvideStrategy()),
+        ]
+    ]
+    module = Module(
+        elements={x, y, socket, worker, client},
+        bootstrap={y, client},
+        fork_safe={x, y, worker, client},
+    )
+    composer = ApplicationComposer(
+        InjectionSolver(),
+        ModuleImportSolver(),
+        ModuleElementConsistencyCheck(),
+    )
+    return composer.compose(Application(modules={module})), (x, y, socket, client)
+
+
+@pytest.mark.parametrize("builder", _builders)
+def test_instance_fork(builder: Type[ApplicationInstanceBuilder]):
+    composed, (x, y, socket, client) = _fork_app()
+    instance = builder(composed).build()
+    values = {element: instance.value_of(element) for element in (x, y, socket)}
+    client_value = instance.value_of(client)
+    assert client_value.worker.socket is values[socket]
+
+    forked = instance.fork()
+
+    # fork safe values are reused
+    assert forked.value_of(x) is values[x]
+    assert forked.value_of(y) is values[y]
+    # values depending on not fork safe socket are rebuilt
+    forked_client = forked.value_of(client)
+    assert forked.value_of(socket) is not values[socket]
+    assert forked_client is not client_value
+    assert forked_client.worker.socket is forked.value_of(socket)
+    assert forked_client.x is values[x]
+    # original instance is left untouched
+    assert instance.value_of(socket) is values[socket]
+    assert instance.value_of(client) is client_value
+
+
+@pytest.mark.parametrize("builder", _builders)
+def test_instance_eager_type_index(
+    composed: ComposedApplication,
+    app_generator: AppGenerator,
+    builder: Type[ApplicationInstanceBuilder],
+):
+    instance = builder(composed, eager_type_index=True).build()
+    for element in app_generator.c_elements:
+        type_ = element.value().type
+        (value,) = instance.values_by_type(type_, module=app_generator.c_module)
+        assert value is instance.value_of(element)
+
+
+class _Heavy:
+    created = 0
+
+    def __init__(self, x: X):
+        _Heavy.created += 1
+        self.x = x
+
+
+class _HeavyUser:
+    def __init__(self, heavy: _Heavy):
+        self.heavy = heavy
+
+
+@pytest.mark.parametrize("builder", _builders)
+def test_instance_lazy(builder: Type[ApplicationInstanceBuilder]):
+    x, heavy, user = [
+        Element(injector=FactoryInjector(factory), strategy=strategy)
+        for factory, strategy in [
+            (X, SingletonProvideStrategy()),
+            (_Heavy, LazySingletonProvideStrategy()),
+            (_HeavyUser, SingletonProvideStrategy()),
+        ]
+    ]
+    module = Module(elements={x, heavy, user}, bootstrap={user})
+    composed = ApplicationComposer(
+        InjectionSolver(),
+        ModuleImportSolver(),
+        ModuleElementConsistencyCheck(),
+    ).compose(Application(modules={module}))
+    _Heavy.created = 0
+    instance = builder(composed).build()
+
+    proxy = instance.value_of(user).heavy
+    assert proxy is instance.value_of(heavy)
+    assert isinstance(proxy, _Heavy)
+    assert _Heavy.created == 0
+    assert proxy.x is instance.value_of(x)
+    assert _Heavy.created == 1
+
+
+@pytest.mark.parametrize("builder", _builders)
+def test_instance_fork_lazy(builder: Type[ApplicationInstanceBuilder]):
+    x, heavy, user = [
+        Element(injector=FactoryInjector(factory), strategy=strategy)
+        for factory, strategy in [
+            (X, SingletonProvideStrategy()),
+            (_Heavy, LazySingletonProvideStrategy()),
+            (_HeavyUser, SingletonProvideStrategy()),
+        ]
+    ]
+    module = Module(
+        elements={x, heavy, user}, bootstrap={user}, fork_safe={heavy, user}
+    )
+    composed = ApplicationComposer(
+        InjectionSolver(),
+        ModuleImportSolver(),
+        ModuleElementConsistencyCheck(),
+    ).compose(Application(modules={module}))
+    _Heavy.created = 0
+    instance = builder(composed).build()
+    proxy = instance.value_of(user).heavy
+
+    forked = instance.fork()
+
+    # not resolved proxy is rebuilt, so it is resolved by forked instance
+    forked_user = forked.value_of(user)
+    assert forked_user.heavy is not proxy
+    assert forked_user.heavy.x is forked.value_of(x)
+    assert _Heavy.created == 1
+    assert is_lazy_resolved(forked_user.heavy)
+    assert not is_lazy_resolved(proxy)
+
+
+def test_instance_async_lazy_warns():
+    x, heavy, user = [
+        Element(injector=FactoryInjector(factory), strategy=strategy)
+        for factory, strategy in [
+            (X, SingletonProvideStrategy()),
+            (_Heavy, LazySingletonProvideStrategy()),
+            (_HeavyUser, SingletonProvideStrategy()),
+        ]
+    ]
+    module = Module(elements={x, heavy, user}, bootstrap={user})
+    composed = ApplicationComposer(
+        InjectionSolver(),
+        ModuleImportSolver(),
+        ModuleElementConsistencyCheck(),
+    ).compose(Application(modules={module}))
+    _Heavy.created = 0
+    with pytest.warns(RuntimeWarning, match="eagerly"):
+        builder = AsyncRecursiveApplicationInstanceBuilder(composed)
+
+    async def _user():
+        instance = await builder.build()
+        return await instance.value_of(user)
+
+    # created as plain singleton, not as proxy
+    assert type(asyncio.run(_user()).heavy) is _Heavy
+    assert _Heavy.created == 1
+
+
+_closed = []
+
+
+class _ClosingPool:
+    def close(self):
+        time.sleep(0.2)
+        _closed.append(type(self))
+
+
+class _ClosingCache:
+    def close(self):
+        time.sleep(0.2)
+        _closed.append(type(self))
+
+
+class _ClosingRepository:
+    def __init__(self, pool: _ClosingPool, cache: _ClosingCache):
+        self.pool = pool
+
+    def close(self):
+        _closed.append(type(self))
+
+
+class _ClosingApi:
+    def __init__(self, repository: _ClosingRepository):
+        self.repository = repository
+
+
+class _Stuck:
+    def close(self):
+        time.sleep(1)
+
+
+def _closing_app(finalizer, stuck: bool = False):
+    factories = [_ClosingPool, _ClosingCache, _ClosingRepository, _ClosingApi] + (
+        [_Stuck] if stuck else []
+    )
+    elements = [
+        Element(injector=FactoryInjector(factory), strategy=SingletonProvideStrategy())
+        for factory in factories
+    ]
+    module = Module(
+        elements={*elements},
+        bootstrap={*elements},
+        finalizers={elements[3]: finalizer},
+    )
+    composed = ApplicationComposer(
+        InjectionSolver(),
+        ModuleImportSolver(),
+        ModuleElementConsistencyCheck(),
+    ).compose(Application(modules={module}))
+    return composed, elements
+
+
+def test_teardown_stages():
+    composed, (pool, cache, repository, api) = _closing_app(None)
+    ctx = RecursiveProvideContext(composed)
+    stages = teardown_stages([pool, cache, repository, api], ctx.dependencies_of)
+    assert [{*stage} for stage in stages] == [{api}, {repository}, {pool, cache}]
+    assert teardown_stages([cache, api], ctx.dependencies_of) == [[api], [cache]]
+
+
+@pytest.mark.parametrize("builder", _builders)
+def test_instance_close(builder: Type[ApplicationInstanceBuilder]):
+    _closed.clear()
+    composed, elements = _closing_app(lambda api: _closed.append(type(api)))
+    instance = builder(composed).build()
+    pool = instance.value_of(elements[0])
+
+    start = time.perf_counter()
+    instance.close()
+    elapsed = time.perf_counter() - start
+
+    # dependents are closed first, independent elements concurrently
+    assert _closed[:2] == [_ClosingApi, _ClosingRepository]
+    assert {*_closed[2:]} == {_ClosingPool, _ClosingCache}
+    assert elapsed < 0.35
+    # closed singletons are created again on next use
+    assert instance.value_of(elements[0]) is not pool
+    _closed.clear()
+    instance.close()
+    assert _closed == [_ClosingPool]
+
+
+def test_instance_close_errors():
+    _closed.clear()
+
+    def _failing(api):
+        raise ValueError("failed")
+
+    composed, elements = _closing_app(_failing, stuck=True)
+    instance = RecursiveApplicationInstanceBuilder(composed).build()
+    with pytest.raises(ApplicationInstanceCloseError) as exc_info:
+        instance.close(timeout=0.5)
+
+    errors = exc_info.value.errors
+    assert {*errors} == {elements[3], elements[4]}
+    assert isinstance(errors[elements[3]], ValueError)
+    assert isinstance(errors[elements[4]], TimeoutError)
+    assert {*_closed} == {_ClosingRepository, _ClosingPool, _ClosingCache}
+    # timed out element is still closing, so it is left in instance
+    assert instance._ctx.global_state.keys() == {elements[4]}
+
+
+class _SlowClose:
+    def close(self):
+        time.sleep(0.3)
+
+
+class _OtherSlowClose(_SlowClose):
+    pass
+
+
+class _StuckUser:
+    def __init__(self, pool: _ClosingPool):
+        self.pool = pool
+
+    def close(self):
+        time.sleep(1)
+
+
+class _Entered:
+    exited = False
+
+    def __exit__(self, *args):
+        _Entered.exited = True
+
+
+class _SyncAclose:
+    closed = False
+
+    def aclose(self):
+        _SyncAclose.closed = True
+
+
+def _close_app(*factories):
+    elements = [
+        Element(injector=FactoryInjector(factory), strategy=SingletonProvideStrategy())
+        for factory in factories
+    ]
+    composed = ApplicationComposer(
+        InjectionSolver(),
+        ModuleImportSolver(),
+        ModuleElementConsistencyCheck(),
+    ).compose(Application(modules={Module(elements={*elements})}))
+    instance = RecursiveApplicationInstanceBuilder(composed).build()
+    for element in elements:
+        instance.value_of(element)
+    return instance, elements
+
+
+def test_instance_close_timeout_per_element():
+    # queued finalizer timeout starts when finalizer starts
+    instance, elements = _close_app(_SlowClose, _OtherSlowClose)
+    instance.close(timeout=0.5, max_workers=1)
+    assert not instance._ctx.global_state
+
+    # finalizers queued behind stuck one are cancelled, not run later
+    instance, (stuck, slow) = _close_app(_Stuck, _SlowClose)
+    with pytest.raises(ApplicationInstanceCloseError) as exc_info:
+        instance.close(timeout=0.2, max_workers=1)
+    assert {*exc_info.value.errors} <= {stuck, slow}
+    assert stuck in instance._ctx.global_state
+
+
+def test_instance_close_timeout_dependencies():
+    _closed.clear()
+    instance, (pool, user) = _close_app(_ClosingPool, _StuckUser)
+    with pytest.raises(ApplicationInstanceCloseError) as exc_info:
+        instance.close(timeout=0.2)
+
+    # pool used by still closing element is not closed
+    errors = exc_info.value.errors
+    assert isinstance(errors[user], TimeoutError)
+    assert isinstance(errors[pool], ApplicationInstanceStateError)
+    assert _closed == []
+    assert instance._ctx.global_state.keys() == {pool, user}
+
+
+def test_instance_close_not_entered():
+    instance, elements = _close_app(_Entered, _SyncAclose)
+    _Entered.exited = _SyncAclose.closed = False
+    instance.close()
+    assert not _Entered.exited
+    assert _SyncAclose.closed
+
+    instance, elements = _close_app(_Entered, _SyncAclose)
+    _Entered.exited = _SyncAclose.closed = False
+    asyncio.run(instance.aclose())
+    assert not _Entered.exited
+    assert _SyncAclose.closed
+
+
+class _CoroutineClient:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        await asyncio.sleep(0)
+        self.closed = True
+
+
+def test_instance_close_coroutine():
+    client = Element(
+        injector=FactoryInjector(_CoroutineClient), strategy=SingletonProvideStrategy()
+    )
+    composed = ApplicationComposer(
+        InjectionSolver(),
+        ModuleImportSolver(),
+        ModuleElementConsistencyCheck(),
+    ).compose(Application(modules={Module(elements={client})}))
+    instance = RecursiveApplicationInstanceBuilder(composed).build()
+
+    value = instance.value_of(client)
+    instance.close()
+    assert value.closed
+
+    value = instance.value_of(client)
+    asyncio.run(instance.aclose())
+    assert value.closed
+
+
+class _AsyncPool:
+    def __init__(self):
+        self.closed = False
+
+    async def aclose(self):
+        await asyncio.sleep(0.2)
+        self.closed = True
+
+
+class _AsyncSession:
+    def __init__(self, pool: _AsyncPool):
+        self.pool = pool
+        self.closed_with_pool = None
+
+    async def aclose(self):
+        await asyncio.sleep(0.2)
+        self.closed_with_pool = self.pool.closed
+
+
+class _AsyncStuck:
+    async def aclose(self):
+        await asyncio.sleep(1)
+
+
+def test_instance_async_close():
+    elements = pool, session, stuck = [
+        Element(injector=FactoryInjector(factory), strategy=SingletonProvideStrategy())
+        for factory in [_AsyncPool, _AsyncSession, _AsyncStuck]
+    ]
+    module = Module(elements={*elements}, bootstrap={*elements})
+    composed = ApplicationComposer(
+        InjectionSolver(),
+        ModuleImportSolver(),
+        ModuleElementConsistencyCheck(),
+    ).compose(Application(modules={module}))
+
+    async def _run():
+        instance = await AsyncRecursiveApplicationInstanceBuilder(composed).build()
+        session_value = await instance.value_of(session)
+        with pytest.raises(ApplicationInstanceCloseError) as exc_info:
+            await instance.aclose(timeout=0.5)
+        assert [*exc_info.value.errors] == [stuck]
+        assert session_value.closed_with_pool is False
+        assert session_value.pool.closed
+
+    asyncio.run(_run())
+
+
+def test_instance_timing_report():
+    composed, shared, bootstrap = _parallel_app(count=2, delay=0.05)
+    instance = TimedApplicationInstanceBuilder(composed).build()
+    report = instance.timing_report()
+
+    timings = {timing.name: timing for timing in report.elements}
+    shared_timing = timings[element_name(shared)]
+    boot_timings = [timings[element_name(element)] for element in bootstrap]
+    assert shared_timing.calls == 1 and 0.05 <= shared_timing.self_wall < 0.1
+    for timing in boot_timings:
+        # own sleep only, creation of shared singleton is excluded
+        assert 0.05 <= timing.self_wall < 0.1
+        assert timing.self_cpu < timing.self_wall
+    assert max(timing.wall for timing in boot_timings) >= 0.1
+
+    # bootstrap element, local link and shared singleton it waited for
+    assert len(report.critical_path) == 3
+    assert report.critical_path[0] in boot_timings
+    assert report.critical_path[-1] is shared_timing
+    assert 0.1 <= report.critical_path_wall < report.bootstrap_wall
+
+    data = json.loads(report.to_json())
+    assert len(data["elements"]) == 4 and len(data["critical_path"]) == 3
+    table = report.format_table()
+    assert "critical path" in table and "_Shared" in table
+
+
+class _RecordingObserver(ProvideObserver):
+    def __init__(self):
+        self.events = []
+
+    def before_create(self, element: Element):
+        self.events.append(("before_create", element))
+
+    def after_create(self, element: Element, value: Any):
+        self.events.append(("after_create", element))
+
+    def cache_hit(self, element: Element, value: Any):
+        self.events.append(("cache_hit", element))
+
+    def error(self, element: Element, error: Exception):
+        self.events.append(("error", element))
+
+    def scope_exit(self, scope: str, values):
+        self.events.append(("scope_exit", scope, len(values)))
+
+
+def _observed_app():
+    x, y, failing, scoped = [
+        Element(injector=injector, strategy=strategy)
+        for injector, strategy in [
+            (FactoryInjector(X), SingletonProvideStrategy()),
+            (FactoryInjector(Y), LocalProvideStrategy()),
+            (_SleepInjector(_Failing, X, 0.0), LocalProvideStrategy()),
+            (FactoryInjector(YAgg), ScopedProvideStrategy()),
+        ]
+    ]
+    module = Module(elements={x, y, failing, scoped})
+    composer = ApplicationComposer(
+        InjectionSolver(factory_selector=_AggregationSelector()),
+        ModuleImportSolver(),
+        ModuleElementConsistencyCheck(),
+    )
+    return composer.compose(Application(modules={module})), (x, y, failing, scoped)
+
+
+@pytest.mark.parametrize("builder", _builders)
+def test_instance_observers(builder: Type[ApplicationInstanceBuilder]):
+    composed, (x, y, failing, scoped) = _observed_app()
+    observer = _RecordingObserver()
+    instance = builder(composed, observers=[observer]).build()
+
+    instance.value_of(y)
+    instance.value_of(x)
+    assert observer.events == [
+        ("before_create", y),
+        ("before_create", x),
+        ("after_create", x),
+        ("after_create", y),
+        ("cache_hit", x),
+    ]
+
+    observer.events.clear()
+    with pytest.raises(ValueError):
+        instance.value_of(failing)
+    assert observer.events == [
+        ("before_create", failing),
+        ("cache_hit", x),
+        ("error", failing),
+    ]
+
+    observer.events.clear()
+    with instance.scope():
+        assert instance.value_of(scoped) is instance.value_of(scoped)
+    assert observer.events == [
+        ("before_create", scoped),
+        ("cache_hit", x),
+        ("after_create", scoped),
+        ("cache_hit", scoped),
+        ("scope_exit", "request", 1),
+    ]
+
+
+@pytest.mark.parametrize("builder", _builders)
+def test_instance_add_observer(builder: Type[ApplicationInstanceBuilder]):
+    composed, (x, y, failing, scoped) = _observed_app()
+    instance = builder(composed).build()
+    value = instance.value_of(x)
+
+    observer = _RecordingObserver()
+    instance.add_observer(observer)
+    assert instance.value_of(x) is value
+    assert [*instance.values_by_type(X)] == [value]
+    assert observer.events == [("cache_hit", x), ("cache_hit", x)]
+
+
+def test_instance_observers_compiled_fast_path():
+    composed, (x, y, failing, scoped) = _observed_app()
+    instance = CompiledApplicationInstanceBuilder(composed).build()
+    # not observed instance calls factories directly
+    assert instance._ctx._creators[x] is X
+
+    instance.add_observer(_RecordingObserver())
+    assert instance._ctx._creators[x] is not X
+
+
+def test_instance_async_observers():
+    composed, (x, y, failing, scoped) = _observed_app()
+    observer = _RecordingObserver()
+
+    async def _run():
+        builder = AsyncRecursiveApplicationInstanceBuilder(
+            composed, observers=[observer]
+        )
+        instance = await builder.build()
+        await instance.value_of(y)
+        await instance.value_of(x)
+        with pytest.raises(ValueError):
+            await instance.value_of(failing)
+
+    asyncio.run(_run())
+    assert observer.events == [
+        ("before_create", y),
+        ("before_create", x),
+        ("after_create", x),
+        ("after_create", y),
+        ("cache_hit", x),
+        ("before_create", failing),
+        ("cache_hit", x),
+        ("error", failing),
+    ]
+
+
+def test_instance_async_scope_observers():
+    composed, (x, y, failing, scoped) = _observed_app()
+    exited = []
+
+    class _ScopeObserver(ProvideObserver):
+        def scope_exit(self, scope: str, values):
+            exited.append(dict(values))
+
+    async def _run():
+        builder = AsyncRecursiveApplicationInstanceBuilder(
+            composed, observers=[_ScopeObserver()]
+        )
+        instance = await builder.build()
+        async with instance.scope():
+            first, second = await asyncio.gather(
+                instance.value_of(scoped), instance.value_of(scoped)
+            )
+            assert first is second
+            assert await instance.value_of(scoped) is first
+        return first
+
+    value = asyncio.run(_run())
+    # observers get created values, not pending creations
+    assert exited == [{scoped: value}]
+
+
+class _Created:
+    types: List[str] = []
+
+    def __init__(self):
+        _Created.types.append(type(self).__name__)
+
+
+class _Part(_Created):
+    pass
+
+
+class _Whole(_Created):
+    def __init__(self, part: _Part):
+        super().__init__()
+        self.part = part
+
+
+class _Assembly(_Created):
+    def __init__(self, whole: _Whole, part: _Part):
+        super().__init__()
+        self.whole = whole
+        self.part = part
+
+
+@pytest.mark.parametrize("builder", _builders)
+def test_instance_schedule(builder: Type[ApplicationInstanceBuilder]):
+    part, whole, assembly = [
+        Element(injector=FactoryInjector(factory), strategy=strategy)
+        for factory, strategy in [
+            (_Part, LocalProvideStrategy()),
+            (_Whole, SingletonProvideStrategy()),
+            (_Assembly, LocalProvideStrategy()),
+        ]
+    ]
+    module = Module(elements={part, whole, assembly})
+    composed = ApplicationComposer(
+        InjectionSolver(),
+        ModuleImportSolver(),
+        ModuleElementConsistencyCheck(),
+    ).compose(Application(modules={module}))
+    instance = builder(composed).build()
+    _Created.types = []
+
+    first = instance.value_of(assembly)
+    # local part is created for every use, singleton with its dependencies once
+    assert _Created.types == ["_Part", "_Whole", "_Part", "_Assembly"]
+    assert first.part is not first.whole.part
+
+    _Created.types = []
+    second = instance.value_of(assembly)
+    assert _Created.types == ["_Part", "_Assembly"]
+    assert second.whole is first.whole
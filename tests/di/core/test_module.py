@@ -1,5 +1,6 @@
 import pytest
 
+from di.core.app import Application
 from di.core.element import Element
 from di.core.module import (
     Module,
@@ -61,6 +62,12 @@ def test_module_consistency_check_internals():
     with pytest.raises(ModuleElementConsistencyError):
         check.check([a, b])
 
+    a = Module(elements={*elements}, fork_safe={*elements})
+    check.check([a])
+    a = Module(elements={*elements[:2]}, fork_safe={*elements})
+    with pytest.raises(ModuleElementConsistencyError):
+        check.check([a])
+
 
 def test_module_consistency_check_duplicates():
     check = ModuleElementConsistencyCheck()
@@ -79,3 +86,93 @@ def test_module_consistency_check_duplicates():
                 Module(elements={*elements[4:]}, exports={*elements[6:]}),
             ]
         )
+
+
+def test_module_consistency_check_all_conflicts():
+    check = ModuleElementConsistencyCheck()
+    elements = [Element(injector=..., strategy=...) for _ in range(6)]
+    a = Module(elements={*elements[:4]})
+    b = Module(elements={*elements[2:]}, bootstrap={elements[0]})
+    c = Module(elements={elements[3]})
+
+    with pytest.raises(ModuleElementConsistencyError) as exc_info:
+        check.check([a, b, c])
+
+    conflicts = {
+        conflict.element: {*map(id, conflict.modules)}
+        for conflict in exc_info.value.conflicts
+    }
+    assert conflicts == {
+        elements[2]: {id(a), id(b)},
+        elements[3]: {id(a), id(b), id(c)},
+    }
+    assert len(exc_info.value.problems) == 3
+
+
+def test_module_consistency_check_many_modules():
+    check = ModuleElementConsistencyCheck()
+    modules = [
+        Module(elements={Element(injector=..., strategy=...) for _ in range(4)})
+        for _ in range(2000)
+    ]
+    check.check(modules)
+
+    modules[-1].elements.add(next(iter(modules[0].elements)))
+    with pytest.raises(ModuleElementConsistencyError) as exc_info:
+        check.check(modules)
+    (conflict,) = exc_info.value.conflicts
+    assert conflict.modules == [modules[0], modules[-1]]
+
+
+def test_module_imported_elements_cache():
+    e1, e2, e3 = [Element(injector=..., strategy=...) for _ in range(3)]
+    a = Module(elements={e1, e2}, exports={e1})
+    b = Module(elements={e3})
+    c = Module(imports={a})
+
+    imported = c.imported_elements
+    assert imported == {e1}
+    assert c.imported_elements is imported
+
+    a.exports.add(e2)
+    assert c.imported_elements == {e1, e2}
+
+    c.imports.add(b)
+    b.exports = {e3}
+    assert c.imported_elements == {e1, e2, e3}
+
+    app = Application(modules={a, b})
+    elements = app.elements
+    assert elements == {e1, e2, e3}
+    assert app.elements is elements
+    app.modules.add(c)
+    c.elements.add(...)
+    assert app.elements == {e1, e2, e3, ...}
+
+    # cache depends only on sets of its own container and its dependencies
+    elements = app.elements
+    imported = c.imported_elements
+    unrelated = Module(elements={e1}, exports={e1})
+    unrelated.exports.add(e2)
+    a.elements.add(...)
+    assert c.imported_elements is imported
+    assert app.elements is not elements
+    elements = app.elements
+    a.bootstrap.add(e1)
+    assert app.elements is elements
+
+    # returned collections are immutable and shared by later accesses,
+    # before they were new mutable copies on every access
+    assert isinstance(app.elements, frozenset)
+    assert isinstance(c.imported_elements, frozenset)
+
+
+def test_module_consistency_check_finalizers():
+    check = ModuleElementConsistencyCheck()
+    owned, other = [Element(injector=..., strategy=...) for _ in range(2)]
+    module = Module(elements={owned}, finalizers={owned: print})
+    check.check([module])
+
+    module.finalizers[other] = print
+    with pytest.raises(ModuleElementConsistencyError):
+        check.check([module])
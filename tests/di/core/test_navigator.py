@@ -0,0 +1,50 @@
+import pytest
+
+from di.core.app import Application
+from di.core.module import Module
+from di.core.navigator import ApplicationNavigator
+from tests.di.core.conftest import X2, AppGenerator, X, Y, YAgg, _create_elements
+
+
+def _app():
+    base = Module(name="base", elements={*_create_elements(X, X2)})
+    other = Module(name="other", elements={*_create_elements(X2, Y)})
+    empty = Module(name="empty")
+    return Application(modules={base, other, empty})
+
+
+def _lookup(navigator: ApplicationNavigator, type_, module, strict: bool):
+    try:
+        return {*navigator.by_type(type_, module=module, strict=strict)}
+    except LookupError:
+        return None
+
+
+@pytest.mark.parametrize("strict", [True, False])
+def test_navigator_eager_type_index(app_generator: AppGenerator, strict: bool):
+    for app in [_app(), app_generator.valid_app]:
+        lazy = ApplicationNavigator(app)
+        eager = ApplicationNavigator(app, eager_type_index=True)
+        types = {object, X, X2, Y, YAgg}
+        types.update(element.value().type for element in app.elements)
+        for module in [None, *app.modules]:
+            for type_ in types:
+                assert _lookup(eager, type_, module, strict) == _lookup(
+                    lazy, type_, module, strict
+                )
+
+
+def test_navigator_eager_type_index_slices():
+    app = _app()
+    navigator = ApplicationNavigator(app, eager_type_index=True)
+    assert len(navigator.by_type(X, strict=False)) == 3
+    assert len(navigator.by_type(X, module="base", strict=False)) == 2
+    assert len(navigator.by_type(X2, module="other")) == 1
+    with pytest.raises(LookupError):
+        navigator.by_type(Y, module="base")
+    with pytest.raises(LookupError):
+        navigator.by_type(X, module="empty", strict=False)
+
+    # modules outside of indexed application are navigated lazily
+    outside = Module(elements={*_create_elements(Y)})
+    assert len(navigator.by_type(Y, module=outside)) == 1
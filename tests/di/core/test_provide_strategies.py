@@ -1,7 +1,18 @@
+import asyncio
 from typing import Any
 
+import pytest
+
 from di.core.element import Element, Injector, ProvideContext
-from di.core.provide_strategies import LocalProvideStrategy, SingletonProvideStrategy
+from di.core.provide_strategies import (
+    LazySingletonProvideStrategy,
+    LocalProvideStrategy,
+    ProvideScope,
+    ProvideScopeError,
+    ScopedProvideStrategy,
+    SingletonProvideStrategy,
+)
+from di.utils.proxy import is_lazy_resolved
 
 
 class SampleContext(ProvideContext):
@@ -31,6 +42,20 @@ def test_singleton_strategy():
     assert value1 is value2
 
 
+def test_lazy_singleton_strategy():
+    strategy = LazySingletonProvideStrategy()
+    context = SampleContext()
+    element = Element(injector=SampleInjector(), strategy=strategy)
+
+    value1 = strategy.provide(context, element)
+    assert context.global_state[element] is value1
+    assert not is_lazy_resolved(value1)
+
+    value2 = strategy.provide(context, element)
+    assert value1 is value2
+    assert value1 == [] and is_lazy_resolved(value1)
+
+
 def test_local_strategy():
     strategy = LocalProvideStrategy()
     context = SampleContext()
@@ -44,3 +69,60 @@ def test_local_strategy():
     assert isinstance(value2, list)
     assert element not in context.global_state
     assert value1 is not value2
+
+
+def test_scoped_strategy():
+    strategy = ScopedProvideStrategy()
+    context = SampleContext()
+    element = Element(injector=SampleInjector(), strategy=strategy)
+
+    with pytest.raises(ProvideScopeError):
+        strategy.provide(context, element)
+
+    with ProvideScope() as scope:
+        assert scope.active
+        value1 = strategy.provide(context, element)
+        assert strategy.provide(context, element) is value1
+        assert element not in context.global_state
+        with ProvideScope():
+            assert strategy.provide(context, element) is not value1
+        assert strategy.provide(context, element) is value1
+
+    assert not scope.active
+    with ProvideScope():
+        assert strategy.provide(context, element) is not value1
+    with pytest.raises(ProvideScopeError):
+        strategy.provide(context, element)
+
+
+def test_scoped_strategy_named():
+    strategy = ScopedProvideStrategy(scope="session")
+    context = SampleContext()
+    element = Element(injector=SampleInjector(), strategy=strategy)
+
+    with ProvideScope("request"):
+        with pytest.raises(ProvideScopeError):
+            strategy.provide(context, element)
+        with ProvideScope("session"):
+            value = strategy.provide(context, element)
+            with ProvideScope("request"):
+                assert strategy.provide(context, element) is value
+
+
+def test_scoped_strategy_tasks():
+    strategy = ScopedProvideStrategy()
+    context = SampleContext()
+    element = Element(injector=SampleInjector(), strategy=strategy)
+
+    async def _request():
+        async with ProvideScope():
+            value = strategy.provide(context, element)
+            await asyncio.sleep(0)
+            assert strategy.provide(context, element) is value
+            return value
+
+    async def _main():
+        return await asyncio.gather(*(_request() for _ in range(4)))
+
+    values = asyncio.run(_main())
+    assert len({id(value) for value in values}) == 4
@@ -1,7 +1,16 @@
 """
 Test file with examples of DI usage.
 """
+import asyncio
+import json
+import os
+import socket
 
+import pytest
+
+from di.core.compose import ApplicationComposerModuleAssignmentError
+from di.core.element import ProvideObserver
+from di.core.instance import ThreadPoolBootstrapExecutor
 from di.declarative import (
     DeclarativeApp,
     DeclarativeModule,
@@ -14,6 +23,7 @@ from di.declarative import (
     scan_values,
     type_check,
 )
+from di.utils.profiling import MemoryProfilerSink, Profiler, profile, write_chrome_trace
 from tests.di.declarative import mod_abstract, mod_config, mod_impl, mod_plugins
 from tests.di.declarative.mod_abstract import AllCombinations, DataProvider
 
@@ -215,3 +225,425 @@ def test_build_globals():
 
     # Check initialized application.
     _check_app_works(all_combinations)
+
+
+@pytest.mark.parametrize(
+    "engine", ["recursive", "compiled", "iterative", "thread_safe"]
+)
+def test_build_engine(engine: str):
+    """
+    Creates application instance using selected resolution engine.
+    All engines provide the same objects, they differ only in performance
+    and (for "iterative" engine) in no recursion limit for deep dependency chains.
+    "thread_safe" engine creates every singleton once when used by many threads.
+    """
+
+    app_def = DeclarativeApp(
+        DeclarativeModule(
+            scan_values(mod_config),
+            scan_factories(mod_abstract, mod_impl, mod_plugins),
+        ),
+        agg_checks=[type_check(DataProvider)],
+    )
+
+    # Build instance using selected engine
+    instance = app_def.build_instance(engine=engine)
+    (all_combinations,) = instance.values_by_type(mod_abstract.AllCombinations)
+
+    # Check initialized application.
+    _check_app_works(all_combinations)
+
+
+def test_build_parallel_bootstrap():
+    """
+    Bootstraps application using thread pool.
+    Independent bootstrap elements of every stage are created concurrently,
+    what speeds up bootstrap of factories doing blocking I/O.
+    """
+
+    app_def = DeclarativeApp(
+        DeclarativeModule(
+            scan_values(mod_config),
+            scan_factories(mod_abstract, mod_impl, mod_plugins, bootstrap=True),
+        ),
+        agg_checks=[type_check(DataProvider)],
+    )
+
+    # Build instance using thread pool bootstrap executor
+    executor = ThreadPoolBootstrapExecutor(max_workers=4)
+    instance = app_def.build_instance(bootstrap_executor=executor)
+    (all_combinations,) = instance.values_by_type(mod_abstract.AllCombinations)
+
+    # Check initialized application.
+    _check_app_works(all_combinations)
+
+
+class _Settings:
+    dsn = "postgresql://localhost"
+
+
+class _AsyncConnection:
+    def __init__(self, dsn: str):
+        self.dsn = dsn
+
+
+async def _connect(settings: _Settings) -> _AsyncConnection:
+    await asyncio.sleep(0)
+    return _AsyncConnection(settings.dsn)
+
+
+class _Repository:
+    def __init__(self, connection: _AsyncConnection):
+        self.connection = connection
+
+
+def test_build_async():
+    """
+    Builds application instance asynchronously.
+    Coroutine factories are awaited, so consumers get their results.
+    Independent elements are created concurrently.
+    """
+
+    app_def = DeclarativeApp(
+        DeclarativeModule(
+            add_values(_Settings()),
+            add_factories(_connect, _Repository, bootstrap=True),
+        ),
+    )
+
+    async def _main():
+        # Build instance in asyncio event loop
+        instance = await app_def.build_instance_async()
+        (repository,) = await instance.values_by_type(_Repository)
+        assert repository.connection.dsn == "postgresql://localhost"
+        (connection,) = await instance.values_by_type(_AsyncConnection)
+        assert connection is repository.connection
+
+    asyncio.run(_main())
+
+
+class _UnitOfWork:
+    def __init__(self, settings: _Settings):
+        self.settings = settings
+
+
+class _OrderService:
+    def __init__(self, unit_of_work: _UnitOfWork):
+        self.unit_of_work = unit_of_work
+
+
+class _PaymentService:
+    def __init__(self, unit_of_work: _UnitOfWork):
+        self.unit_of_work = unit_of_work
+
+
+def test_build_scope():
+    """
+    Shares request scoped objects between all consumers within the scope.
+    Scope state is dropped when the scope exits.
+    """
+
+    app_def = DeclarativeApp(
+        DeclarativeModule(
+            add_values(_Settings()),
+            add_factories(_UnitOfWork, scope="request"),
+            add_factories(_OrderService, _PaymentService, singleton=False),
+        ),
+    )
+    instance = app_def.build_instance()
+
+    # Every request gets own unit of work shared by services
+    with instance.scope("request"):
+        (orders,) = instance.values_by_type(_OrderService)
+        (payments,) = instance.values_by_type(_PaymentService)
+        assert orders.unit_of_work is payments.unit_of_work
+    with instance.scope("request"):
+        (next_orders,) = instance.values_by_type(_OrderService)
+        assert next_orders.unit_of_work is not orders.unit_of_work
+
+
+class _Vocabulary:
+    def __init__(self, settings: _Settings):
+        self.words = frozenset(settings.dsn.split("/"))
+
+
+def _open_socket() -> socket.socket:
+    return socket.socket()
+
+
+class _Listener:
+    def __init__(self, sock: socket.socket, vocabulary: _Vocabulary):
+        self.sock = sock
+        self.vocabulary = vocabulary
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_build_fork():
+    """
+    Builds instance once in master process and forks it in worker processes.
+    Fork safe singletons (and values) built by master are reused by workers,
+    other singletons and all singletons depending on them are rebuilt.
+    """
+
+    app_def = DeclarativeApp(
+        DeclarativeModule(
+            add_values(_Settings()),
+            add_factories(_Vocabulary, fork_safe=True, bootstrap=True),
+            add_factories(_open_socket, _Listener, bootstrap=True),
+        ),
+    )
+
+    # Build instance in master process
+    instance = app_def.build_instance()
+    (vocabulary,) = instance.values_by_type(_Vocabulary)
+    (listener,) = instance.values_by_type(_Listener)
+
+    pid = os.fork()
+    if pid == 0:
+        # Worker process rebuilds only elements that are not fork safe
+        worker_instance = instance.fork()
+        (worker_listener,) = worker_instance.values_by_type(_Listener)
+        works = (
+            worker_listener is not listener
+            and worker_listener.sock is not listener.sock
+            and worker_listener.vocabulary is vocabulary
+        )
+        worker_listener.sock.close()
+        os._exit(0 if works else 1)
+
+    _, status = os.waitpid(pid, 0)
+    listener.sock.close()
+    assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+
+
+def test_build_composed_path(tmp_path):
+    """
+    Stores composed application in a file and reuses it on next start.
+    Stored file is checked against the application modules and sources,
+    so any change triggers composing again.
+    """
+
+    def _app_def(agg_checks=(type_check(DataProvider),)):
+        return DeclarativeApp(
+            DeclarativeModule(
+                scan_values(mod_config),
+                scan_factories(mod_abstract, mod_impl, mod_plugins),
+            ),
+            agg_checks=agg_checks,
+            composed_path=tmp_path / "composed.json",
+        )
+
+    # First start composes application and stores result
+    instance = _app_def().build_instance()
+    (all_combinations,) = instance.values_by_type(mod_abstract.AllCombinations)
+    _check_app_works(all_combinations)
+    assert (tmp_path / "composed.json").exists()
+
+    # Next start loads stored composition
+    instance = _app_def().build_instance()
+    (all_combinations,) = instance.values_by_type(mod_abstract.AllCombinations)
+    _check_app_works(all_combinations)
+
+    # Changed aggregation checks invalidate stored composition,
+    # without them data providers can not be injected
+    with pytest.raises(ApplicationComposerModuleAssignmentError):
+        _app_def(agg_checks=()).build_instance()
+
+
+class _ReportingClient:
+    created = 0
+
+    def __init__(self, settings: _Settings):
+        _ReportingClient.created += 1
+        self.dsn = settings.dsn
+
+    def report(self) -> str:
+        return f"report from {self.dsn}"
+
+
+class _AdminService:
+    def __init__(self, reporting: _ReportingClient):
+        self.reporting = reporting
+
+
+def test_build_lazy():
+    """
+    Injects proxy of rarely used singleton, which is created on first use.
+    """
+
+    app_def = DeclarativeApp(
+        DeclarativeModule(
+            add_values(_Settings()),
+            add_factories(_ReportingClient, lazy=True),
+            add_factories(_AdminService, bootstrap=True),
+        ),
+    )
+    _ReportingClient.created = 0
+    instance = app_def.build_instance()
+    (admin,) = instance.values_by_type(_AdminService)
+
+    # Proxy is typed as the factory result, but nothing is created yet
+    assert isinstance(admin.reporting, _ReportingClient)
+    assert _ReportingClient.created == 0
+
+    # First attribute access creates reporting client
+    assert admin.reporting.report().startswith("report from")
+    assert _ReportingClient.created == 1
+
+
+class _ConnectionPool:
+    def __init__(self, settings: _Settings):
+        self.dsn = settings.dsn
+        self.open = True
+
+    def close(self):
+        self.open = False
+
+
+class _Reporter:
+    def __init__(self, pool: _ConnectionPool):
+        self.pool = pool
+        self.flushed_while_pool_open = None
+
+
+def test_build_close():
+    """
+    Closes singletons on shutdown, dependents before their dependencies.
+    Objects having `close` or `aclose` are closed automatically, other ones
+    may register a finalizer. Context managers are not exited, because
+    instance never entered them.
+    """
+
+    def _flush(reporter: _Reporter):
+        reporter.flushed_while_pool_open = reporter.pool.open
+
+    app_def = DeclarativeApp(
+        DeclarativeModule(
+            add_values(_Settings()),
+            add_factories(_ConnectionPool),
+            add_factories(_Reporter, finalizer=_flush),
+        ),
+    )
+    instance = app_def.build_instance()
+    (reporter,) = instance.values_by_type(_Reporter)
+
+    instance.close(timeout=5)
+    assert reporter.flushed_while_pool_open is True
+    assert reporter.pool.open is False
+
+
+def test_build_timing_report():
+    """
+    Builds instance measuring creation time of every element.
+    Report shows own time of each factory (without its dependencies)
+    and the slowest chain of dependent factories started by bootstrap.
+    """
+
+    app_def = DeclarativeApp(
+        DeclarativeModule(
+            add_values(_Settings()),
+            add_factories(_ConnectionPool),
+            add_factories(_Reporter, bootstrap=True),
+        ),
+    )
+    instance = app_def.build_instance(engine="timed")
+    report = instance.timing_report()
+
+    assert [timing.name for timing in report.critical_path] == [
+        "_Reporter",
+        "_ConnectionPool",
+        f"{__name__}._Settings",
+    ]
+    assert "critical path" in report.format_table()
+    assert json.loads(report.to_json())["bootstrap_wall"] >= 0
+
+
+def test_build_profile(tmp_path):
+    """
+    Profiles build phases: scanning python modules, assembling modules,
+    composing (with per module solving) and bootstrap.
+    Spans can be exported in Chrome trace format and opened in trace viewer.
+    """
+
+    # Modules are scanned when declared, so declare them within profile
+    with profile(MemoryProfilerSink()) as sink:
+        app_def = DeclarativeApp(
+            DeclarativeModule(
+                scan_values(mod_config),
+                scan_factories(mod_abstract, mod_impl, mod_plugins),
+            ),
+            agg_checks=[type_check(DataProvider)],
+        )
+        app_def.build_instance()
+
+    categories = {span.category for span in sink.spans}
+    assert {"scan", "assemble", "compose", "solve", "bootstrap"} <= categories
+    (solve,) = sink.by_category("solve")
+    assert solve.args["elements"] > 0 and solve.args["assignments"] > 0
+    # aggregated dependency gets many injected values
+    assert solve.args["dependencies"] == solve.args["assignments"]
+    assert solve.args["injected_values"] > solve.args["assignments"]
+
+    # Profiler may be also given to application to profile its own phases
+    app_sink = MemoryProfilerSink()
+    app_def = DeclarativeApp(
+        DeclarativeModule(add_values(_Settings())), profiler=Profiler(app_sink)
+    )
+    app_def.build_instance()
+    assert {span.name for span in app_sink.spans} >= {"assemble", "build_instance"}
+
+    # Modules declared before are scanned without profiler, their spans
+    # are recorded when profiled application includes them
+    module = DeclarativeModule(scan_factories(mod_abstract, mod_impl, mod_plugins))
+    app_sink = MemoryProfilerSink()
+    DeclarativeApp(module, profiler=Profiler(app_sink))
+    scans = app_sink.by_category("scan")
+    assert {span.name for span in scans} == {"scan", "include"}
+    assert {span.args.get("python_module") for span in scans} >= {
+        mod_abstract.__name__,
+        mod_impl.__name__,
+        mod_plugins.__name__,
+    }
+
+    write_chrome_trace(sink.spans, tmp_path / "trace.json")
+    trace = json.loads((tmp_path / "trace.json").read_text())
+    assert len(trace["traceEvents"]) == len(sink.spans)
+
+
+class _CreationCounter(ProvideObserver):
+    def __init__(self):
+        self.created = {}
+        self.cache_hits = 0
+
+    def after_create(self, element, value):
+        name = type(value).__name__
+        self.created[name] = self.created.get(name, 0) + 1
+
+    def cache_hit(self, element, value):
+        self.cache_hits += 1
+
+
+def test_build_observers():
+    """
+    Observes element creation, e.g. to export metrics or trace requests.
+    Observers are called only when attached, so instance without them
+    resolves elements as fast as before.
+    """
+
+    app_def = DeclarativeApp(
+        DeclarativeModule(
+            add_values(_Settings()),
+            add_factories(_ConnectionPool),
+            add_factories(_Reporter, singleton=False),
+        ),
+    )
+    counter = _CreationCounter()
+    instance = app_def.build_instance(observers=[counter])
+
+    instance.values_by_type(_Reporter)
+    instance.values_by_type(_Reporter)
+
+    # provided values are reported as created on first use,
+    # pool singleton was created once, then taken from cache
+    assert counter.created == {"_Settings": 1, "_ConnectionPool": 1, "_Reporter": 2}
+    assert counter.cache_hits == 1
@@ -1,9 +1,9 @@
 import inspect
-from typing import Any, Dict
+from typing import Any, Dict, Type
 
 import pytest
 
-from di.utils.inspection.abstract import AbstractInspector
+from di.utils.inspection.abstract import AbstractInspector, BytecodeAbstractInspector
 from tests.di.utils.inspection.module_abstract import (
     CanonicalAbstract,
     DuckAbstract1,
@@ -18,22 +18,26 @@ from tests.di.utils.inspection.module_abstract import (
     normal_fn,
 )
 
+_inspectors = [AbstractInspector, BytecodeAbstractInspector]
 
-def test_abstract_functions():
-    assert not AbstractInspector.is_abstract_function(normal_fn)
-    assert AbstractInspector.is_abstract_function(abstract_fn)
-    assert not AbstractInspector.is_abstract_function(normal_async_fn)
-    assert AbstractInspector.is_abstract_function(abstract_async_fn)
 
+@pytest.mark.parametrize("inspector", _inspectors)
+def test_abstract_functions(inspector: Type[AbstractInspector]):
+    assert not inspector.is_abstract_function(normal_fn)
+    assert inspector.is_abstract_function(abstract_fn)
+    assert not inspector.is_abstract_function(normal_async_fn)
+    assert inspector.is_abstract_function(abstract_async_fn)
 
-def test_abstract_classes():
-    assert not AbstractInspector.is_abstract_class(NormalClass)
-    assert AbstractInspector.is_abstract_class(CanonicalAbstract)
-    assert AbstractInspector.is_abstract_class(DuckAbstract1)
-    assert AbstractInspector.is_abstract_class(DuckAbstract2)
-    assert AbstractInspector.is_abstract_class(DuckAbstract3)
-    assert AbstractInspector.is_abstract_class(DuckAbstract4)
-    assert AbstractInspector.is_abstract_class(DuckAbstract5)
+
+@pytest.mark.parametrize("inspector", _inspectors)
+def test_abstract_classes(inspector: Type[AbstractInspector]):
+    assert not inspector.is_abstract_class(NormalClass)
+    assert inspector.is_abstract_class(CanonicalAbstract)
+    assert inspector.is_abstract_class(DuckAbstract1)
+    assert inspector.is_abstract_class(DuckAbstract2)
+    assert inspector.is_abstract_class(DuckAbstract3)
+    assert inspector.is_abstract_class(DuckAbstract4)
+    assert inspector.is_abstract_class(DuckAbstract5)
 
 
 @pytest.fixture(scope="module")
@@ -46,13 +50,71 @@ def module_globals():
     return _globals
 
 
-def test_abstract_dynamic(module_globals: Dict[str, Any]):
-    assert not AbstractInspector.is_abstract_class(module_globals[NormalClass.__name__])
-    assert AbstractInspector.is_abstract_class(
-        module_globals[CanonicalAbstract.__name__]
-    )
-    assert AbstractInspector.is_abstract_class(module_globals[DuckAbstract1.__name__])
-    assert AbstractInspector.is_abstract_class(module_globals[DuckAbstract2.__name__])
-    assert AbstractInspector.is_abstract_class(module_globals[DuckAbstract3.__name__])
-    assert AbstractInspector.is_abstract_class(module_globals[DuckAbstract4.__name__])
-    assert AbstractInspector.is_abstract_class(module_globals[DuckAbstract5.__name__])
+@pytest.mark.parametrize("inspector", _inspectors)
+def test_abstract_dynamic(
+    module_globals: Dict[str, Any], inspector: Type[AbstractInspector]
+):
+    assert not inspector.is_abstract_class(module_globals[NormalClass.__name__])
+    assert inspector.is_abstract_class(module_globals[CanonicalAbstract.__name__])
+    assert inspector.is_abstract_class(module_globals[DuckAbstract1.__name__])
+    assert inspector.is_abstract_class(module_globals[DuckAbstract2.__name__])
+    assert inspector.is_abstract_class(module_globals[DuckAbstract3.__name__])
+    assert inspector.is_abstract_class(module_globals[DuckAbstract4.__name__])
+    assert inspector.is_abstract_class(module_globals[DuckAbstract5.__name__])
+
+
+def reraising_fn(fn):
+    try:
+        return fn()
+    except NotImplementedError:
+        raise ValueError("Not supported")
+
+
+def conditional_abstract_fn(flag: bool):
+    if flag:
+        raise NotImplementedError
+    return flag
+
+
+def nested_abstract_fn(flag: bool):
+    def _check():
+        if flag:
+            raise NotImplementedError("nested")
+
+    _check()
+    return flag
+
+
+def closure_abstract_fn(flag: bool):
+    def _outer():
+        def _inner():
+            if not flag:
+                raise NotImplementedError
+
+        return _inner
+
+    return _outer()
+
+
+def chained_abstract_fn(value: str):
+    try:
+        return int(value)
+    except ValueError as error:
+        raise NotImplementedError(f"Not supported {value}") from error
+
+
+def chained_reraising_fn(fn):
+    try:
+        return fn()
+    except NotImplementedError as error:
+        raise ValueError("Not supported") from error
+
+
+@pytest.mark.parametrize("inspector", _inspectors)
+def test_abstract_bytecode_patterns(inspector: Type[AbstractInspector]):
+    assert not inspector.is_abstract_function(reraising_fn)
+    assert inspector.is_abstract_function(conditional_abstract_fn)
+    assert inspector.is_abstract_function(nested_abstract_fn)
+    assert inspector.is_abstract_function(closure_abstract_fn)
+    assert inspector.is_abstract_function(chained_abstract_fn)
+    assert not inspector.is_abstract_function(chained_reraising_fn)
@@ -0,0 +1,157 @@
+import importlib
+import os
+import sys
+import zipfile
+from typing import List, Optional, Tuple, Union
+
+import pytest
+
+from di.declarative import add_factories
+from di.utils.inspection import FactoryInspection, FactoryInspectionCache
+from di.utils.inspection.factory_cache import StoredFactoryInspection
+from tests.di.utils.inspection.module_model import DataClass, NormalClass
+
+
+class Service:
+    def __init__(self, model: NormalClass, data: Optional[DataClass] = None):
+        self.model = model
+        self.data = data
+
+
+def service_factory(
+    models: List[NormalClass], pair: Tuple[int, ...], mixed: Union[NormalClass, str]
+) -> Service:
+    return Service(models[0])
+
+
+def shadowed_factory(model: NormalClass) -> Service:
+    return Service(model)
+
+
+_shadowed_factory = shadowed_factory
+
+
+def shadowed_factory(model: NormalClass) -> Service:  # noqa: F811
+    return Service(model)
+
+
+def _same(a, b):
+    assert a.args == b.args
+    assert a.optional_args == b.optional_args
+    assert a.args_annotations == b.args_annotations
+    assert a.return_type == b.return_type
+    assert a.annotations == b.annotations
+
+
+@pytest.mark.parametrize("factory", [Service, service_factory])
+def test_factory_cache_persists(tmp_path, factory):
+    inspection = FactoryInspectionCache(tmp_path).inspect(factory)
+    assert isinstance(inspection, FactoryInspection)
+
+    stored = FactoryInspectionCache(tmp_path).inspect(factory)
+    assert isinstance(stored, StoredFactoryInspection)
+    _same(stored, FactoryInspection(factory))
+
+
+def test_factory_cache_not_storable(tmp_path):
+    def local_factory(model: NormalClass) -> Service:
+        return Service(model)
+
+    for factory in [local_factory, _shadowed_factory]:
+        FactoryInspectionCache(tmp_path).inspect(factory)
+        inspection = FactoryInspectionCache(tmp_path).inspect(factory)
+        assert isinstance(inspection, FactoryInspection)
+
+
+_module_v1 = """
+class Dependency:
+    pass
+
+
+def factory(dependency: Dependency) -> Dependency:
+    return dependency
+"""
+
+_module_v2 = """
+class Dependency:
+    pass
+
+
+def factory(dependency: Dependency, extra: int = 0) -> Dependency:
+    return dependency
+"""
+
+
+def test_factory_cache_stale(tmp_path):
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    source = source_dir / "di_cache_stale_module.py"
+    source.write_text(_module_v1)
+    cache_dir = tmp_path / "cache"
+
+    sys.path.insert(0, str(source_dir))
+    try:
+        module = importlib.import_module("di_cache_stale_module")
+        FactoryInspectionCache(cache_dir).inspect(module.factory)
+        stored = FactoryInspectionCache(cache_dir).inspect(module.factory)
+        assert isinstance(stored, StoredFactoryInspection)
+        assert stored.args == ["dependency"]
+
+        source.write_text(_module_v2)
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        module = importlib.reload(module)
+        inspection = FactoryInspectionCache(cache_dir).inspect(module.factory)
+        assert isinstance(inspection, FactoryInspection)
+        assert inspection.args == ["dependency", "extra"]
+        assert inspection.optional_args == {"extra"}
+    finally:
+        sys.path.remove(str(source_dir))
+        sys.modules.pop("di_cache_stale_module", None)
+
+
+def test_factory_cache_zip_module(tmp_path):
+    archive = tmp_path / "modules.zip"
+    with zipfile.ZipFile(archive, "w") as zip_file:
+        zip_file.writestr("di_cache_zip_module.py", _module_v1)
+
+    sys.path.insert(0, str(archive))
+    try:
+        module = importlib.import_module("di_cache_zip_module")
+        inspection = FactoryInspectionCache(tmp_path / "cache").inspect(module.factory)
+        assert isinstance(inspection, FactoryInspection)
+        assert inspection.args == ["dependency"]
+    finally:
+        sys.path.remove(str(archive))
+        sys.modules.pop("di_cache_zip_module", None)
+
+
+def test_factory_cache_batch(tmp_path, monkeypatch):
+    cache = FactoryInspectionCache(tmp_path)
+    writes = []
+    write = cache._write
+    monkeypatch.setattr(
+        cache,
+        "_write",
+        lambda source, data: writes.append(source) or write(source, data),
+    )
+
+    with cache.batch():
+        for factory in [Service, service_factory, shadowed_factory]:
+            cache.inspect(factory)
+        assert writes == []
+    assert len(writes) == 1
+
+    for factory in [Service, service_factory, shadowed_factory]:
+        stored = FactoryInspectionCache(tmp_path).inspect(factory)
+        assert isinstance(stored, StoredFactoryInspection)
+
+
+def test_factory_cache_declarative_batch(tmp_path, monkeypatch):
+    cache = FactoryInspectionCache(tmp_path)
+    writes = []
+    monkeypatch.setattr(cache, "_write", lambda source, data: writes.append(source))
+
+    # declaration writes cache file of python module once
+    [*add_factories(Service, service_factory, inspection_cache=cache)]
+    assert len(writes) == 1
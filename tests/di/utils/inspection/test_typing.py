@@ -1,3 +1,4 @@
+import itertools
 from typing import (
     Collection,
     Dict,
@@ -17,6 +18,14 @@ from di.utils.inspection import (
     aggregation_type_factory,
     is_base_type,
     is_compatible_type,
+    typing_cache,
+)
+from di.utils.inspection.typing import (
+    _aggregated_type,
+    _flatten_union,
+    _is_base_type,
+    _is_compatible_type,
+    flatten_union,
 )
 
 
@@ -120,3 +129,66 @@ def test_aggregation_type_factory():
 
     assert aggregation_type_factory(Optional[Set[str]]) is set
     assert aggregation_type_factory(Optional[Optional[Iterable[str]]]) is list
+
+
+def test_typing_cache():
+    class X:
+        pass
+
+    class Y(X):
+        pass
+
+    x_alias = NewType("XAlias", X)
+    types = [
+        None,
+        int,
+        str,
+        X,
+        Y,
+        x_alias,
+        Optional[X],
+        Optional[x_alias],
+        Union[X, Y],
+        Union[Y, X],
+        List[X],
+        List[x_alias],
+        Optional[List[Y]],
+        Union[List[X], Set[Y]],
+        Union[Set[Y], List[X]],
+        Dict[str, X],
+    ]
+
+    typing_cache.clear()
+    for _ in range(2):
+        for type_ in types:
+            assert is_base_type(type_) == _is_base_type(type_)
+            assert aggregated_type(type_) == _aggregated_type(type_)
+            assert flatten_union(type_) == _flatten_union(type_)
+        for proposal, model in itertools.product(types, repeat=2):
+            assert is_compatible_type(proposal, model) == _is_compatible_type(
+                proposal, model
+            )
+    info = typing_cache.info()
+    assert info.hits > 0 and info.misses > 0
+    assert info.currsize <= info.maxsize
+
+    typing_cache.clear()
+    info = typing_cache.info()
+    assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+
+
+def test_typing_cache_nested_union_order():
+    class X:
+        pass
+
+    class Y:
+        pass
+
+    # typing caches aliases too, distinct equal alias is made explicitly
+    xy = List[Union[X, Y]]
+    yx = xy.copy_with((Union[Y, X],))
+    assert xy == yx and xy is not yx
+
+    typing_cache.clear()
+    assert flatten_union(aggregated_type(xy)) == (X, Y)
+    assert flatten_union(aggregated_type(yx)) == (Y, X)
@@ -0,0 +1,49 @@
+import pytest
+
+from di.utils.cache import LRUCache
+
+
+def test_lru_cache():
+    cache = LRUCache(maxsize=2)
+    computed = []
+
+    def _compute(key):
+        def _inner():
+            computed.append(key)
+            return key * 2
+
+        return _inner
+
+    assert cache.get_or_compute(1, _compute(1)) == 2
+    assert cache.get_or_compute(2, _compute(2)) == 4
+    assert cache.get_or_compute(1, _compute(1)) == 2
+    assert cache.get_or_compute(3, _compute(3)) == 6
+    assert cache.get_or_compute(1, _compute(1)) == 2
+    assert cache.get_or_compute(2, _compute(2)) == 4
+    assert computed == [1, 2, 3, 2]
+
+    info = cache.info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (2, 4, 2, 2)
+
+    cache.clear()
+    info = cache.info()
+    assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+
+
+def test_lru_cache_unhashable():
+    cache = LRUCache()
+    assert cache.get_or_compute([1], lambda: "value") == "value"
+    assert cache.info().currsize == 0
+
+
+def test_lru_cache_get_put():
+    cache = LRUCache(maxsize=2)
+    cache.put(1, "a")
+    cache.put(2, "b")
+    assert cache.get(1) == "a"
+    cache.put(3, "c")
+    assert cache.get(2) is None
+    assert cache.get(3) == "c"
+    assert len(cache) == 2
+    with pytest.raises(TypeError):
+        cache.get([1])
@@ -1,4 +1,5 @@
-from typing import List
+import random
+from typing import List, Type
 
 import pytest
 
@@ -6,9 +7,12 @@ from di.utils.graph import (
     DirectionalGraph,
     DirectionalGraphEdge,
     DirectionalGraphIteratorError,
+    DirectionalGraphKahnIterator,
     DirectionalGraphTopologyIterator,
 )
 
+_iterators = [DirectionalGraphTopologyIterator, DirectionalGraphKahnIterator]
+
 
 @pytest.fixture
 def elements():
@@ -45,9 +49,10 @@ def cycle_edges():
     ]
 
 
-def test_graph(elements: List[int], edges: List[IntGraphEdge]):
+@pytest.mark.parametrize("iterator", _iterators)
+def test_graph(elements: List[int], edges: List[IntGraphEdge], iterator: Type):
     graph = DirectionalGraph(elements, edges)
-    stages = list(DirectionalGraphTopologyIterator(graph))
+    stages = list(iterator(graph))
     assert len(stages) == 4
     assert 4 in stages[0]
     assert 3 in stages[1]
@@ -55,7 +60,40 @@ def test_graph(elements: List[int], edges: List[IntGraphEdge]):
     assert 1 in stages[3]
 
 
-def test_graph_with_cycle(elements: List[int], cycle_edges: List[IntGraphEdge]):
+@pytest.mark.parametrize("iterator", _iterators)
+def test_graph_with_cycle(
+    elements: List[int], cycle_edges: List[IntGraphEdge], iterator: Type
+):
     graph = DirectionalGraph(elements, cycle_edges)
     with pytest.raises(DirectionalGraphIteratorError):
-        list(DirectionalGraphTopologyIterator(graph))
+        list(iterator(graph))
+
+
+def _random_graph(seed: int, cyclic: bool) -> DirectionalGraph:
+    rnd = random.Random(seed)
+    nodes = [*range(rnd.randint(1, 60))]
+    edges = []
+    for source in nodes:
+        for _ in range(rnd.randint(0, 4)):
+            target = rnd.choice(nodes)
+            if cyclic or target < source:
+                edges.append(IntGraphEdge(source, target))
+    return DirectionalGraph(nodes, edges)
+
+
+def _stages(iterator: Type, graph: DirectionalGraph):
+    try:
+        return list(iterator(graph))
+    except DirectionalGraphIteratorError:
+        return None
+
+
+@pytest.mark.parametrize("seed", range(50))
+@pytest.mark.parametrize("cyclic", [False, True])
+def test_graph_kahn_same_as_topology(seed: int, cyclic: bool):
+    graph = _random_graph(seed, cyclic=cyclic)
+    expected = _stages(DirectionalGraphTopologyIterator, graph)
+    produced = _stages(DirectionalGraphKahnIterator, graph)
+    assert expected == produced
+    if not cyclic:
+        assert produced is not None
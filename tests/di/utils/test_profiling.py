@@ -0,0 +1,64 @@
+import json
+import threading
+
+from di.utils.profiling import (
+    MemoryProfilerSink,
+    Profiler,
+    active_profiler,
+    chrome_trace,
+    profile,
+    profile_span,
+    write_chrome_trace,
+)
+
+
+def test_profile_spans():
+    with profile_span("ignored", "test") as span:
+        span.set(count=1)
+
+    with profile() as sink:
+        assert active_profiler() is not None
+        with profile_span("outer", "test", module="a") as outer:
+            with profile_span("inner", "test"):
+                pass
+            outer.set(count=2)
+    assert active_profiler() is None
+
+    assert isinstance(sink, MemoryProfilerSink)
+    inner, outer = sink.spans
+    assert (inner.name, outer.name) == ("inner", "outer")
+    assert outer.args == {"module": "a", "count": 2}
+    assert outer.start <= inner.start <= inner.end <= outer.end
+    assert sink.by_category("test") == [inner, outer]
+
+
+def test_profile_threads():
+    sink = MemoryProfilerSink()
+    profiler = Profiler(sink)
+
+    def _work():
+        with profiler.span("work", "test"):
+            pass
+
+    threads = [threading.Thread(target=_work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(sink.spans) == 4
+
+
+def test_chrome_trace(tmp_path):
+    with profile() as sink:
+        with profile_span("outer", "test", module=None, values=[1]):
+            pass
+
+    trace = chrome_trace(sink.spans)
+    (event,) = trace["traceEvents"]
+    assert event["ph"] == "X" and event["name"] == "outer"
+    assert event["dur"] >= 0
+    assert event["args"] == {"module": None, "values": "[1]"}
+
+    path = tmp_path / "trace.json"
+    write_chrome_trace(sink.spans, path)
+    assert json.loads(path.read_text()) == json.loads(json.dumps(trace))
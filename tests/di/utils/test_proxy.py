@@ -0,0 +1,125 @@
+import asyncio
+import operator
+import os
+import pathlib
+import threading
+
+from di.utils.proxy import LazyProxy, is_lazy_resolved, lazy_target
+
+
+class _Target:
+    def __init__(self):
+        self.items = [1, 2]
+
+    def total(self):
+        return sum(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+
+def test_lazy_proxy():
+    calls = []
+
+    def _create():
+        calls.append(1)
+        return _Target()
+
+    proxy = LazyProxy(_create, _Target)
+    assert isinstance(proxy, _Target)
+    assert not is_lazy_resolved(proxy)
+    assert not calls
+
+    assert proxy.total() == 3
+    assert len(proxy) == 2 and proxy[1] == 2
+    proxy.items = [5]
+    assert proxy.total() == 5
+    assert lazy_target(proxy).items == [5]
+    assert proxy == lazy_target(proxy)
+    assert is_lazy_resolved(proxy)
+    assert len(calls) == 1
+
+
+def test_lazy_proxy_undeclared_type():
+    proxy = LazyProxy(lambda: [1, 2])
+    assert isinstance(proxy, list)
+    assert [*proxy] == [1, 2] and 2 in proxy
+    assert repr(proxy) == "[1, 2]"
+
+
+def test_lazy_proxy_threads():
+    calls = []
+    barrier = threading.Barrier(16)
+
+    def _create():
+        calls.append(1)
+        return _Target()
+
+    proxy = LazyProxy(_create, _Target)
+    targets = []
+
+    def _use():
+        barrier.wait()
+        targets.append(lazy_target(proxy))
+
+    threads = [threading.Thread(target=_use) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert len({*map(id, targets)}) == 1
+
+
+def test_lazy_proxy_operators():
+    number = LazyProxy(lambda: 6, int)
+    assert number + 1 == 7 and 1 + number == 7
+    assert number * 2 == 12 and 2**number == 64 and number**2 == 36
+    assert divmod(number, 4) == (1, 2) and 13 % number == 1
+    assert -number == -6 and abs(number) == 6 and ~number == -7
+    assert number < 7 and number >= 6 and 5 < number
+    assert [0, 1, 2, 3, 4, 5, 6][number] == 6 and operator.index(number) == 6
+    assert float(number) == 6.0 and round(number) == 6 and f"{number:03}" == "006"
+    assert (number & 2, 3 | number, number ^ 1) == (2, 7, 7)
+
+    items = LazyProxy(lambda: [1])
+    items += [2]
+    assert items == [1, 2]
+
+    path = LazyProxy(lambda: pathlib.Path("a"), pathlib.Path)
+    assert os.fspath(path) == "a" and os.path.join(path, "b") == os.path.join("a", "b")
+
+
+def test_lazy_proxy_hash_resolves():
+    # hashing and equality need target, so they create it
+    proxy = LazyProxy(lambda: "value", str)
+    assert proxy in {"value"}
+    assert is_lazy_resolved(proxy)
+
+
+def test_lazy_proxy_async():
+    class _Session:
+        def __init__(self):
+            self.entered = False
+
+        async def __aenter__(self):
+            self.entered = True
+            return self
+
+        async def __aexit__(self, *args):
+            self.entered = False
+
+    async def _value():
+        return 5
+
+    async def _use():
+        session = LazyProxy(_Session, _Session)
+        async with session as entered:
+            assert entered.entered
+        assert not session.entered
+        return await LazyProxy(_value)
+
+    assert asyncio.run(_use()) == 5
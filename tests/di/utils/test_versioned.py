@@ -0,0 +1,102 @@
+from di.utils.versioned import (
+    VersionedSet,
+    current_version,
+    version_of,
+    versioned,
+    versioned_property,
+)
+
+
+def test_versioned_set_mutations():
+    values = VersionedSet([1, 2])
+    mutations = [
+        lambda: values.add(3),
+        lambda: values.discard(3),
+        lambda: values.update({4, 5}),
+        lambda: values.remove(4),
+        lambda: values.difference_update({5}),
+        lambda: values.__ior__({6}),
+        lambda: values.__isub__({6}),
+        lambda: values.pop(),
+        lambda: values.clear(),
+    ]
+    for mutation in mutations:
+        version = current_version()
+        mutation()
+        assert current_version() != version
+
+    version = current_version()
+    assert values | {1} == {1}
+    assert current_version() == version
+
+
+def test_versioned_property():
+    class Holder:
+        def __init__(self):
+            self.values = versioned({1, 2})
+            self.calls = 0
+
+        @versioned_property
+        def total(self):
+            self.calls += 1
+            return sum(self.values)
+
+    holder = Holder()
+    assert holder.total == 3
+    assert holder.total == 3
+    assert holder.calls == 1
+
+    holder.values.add(3)
+    assert holder.total == 6
+    assert holder.calls == 2
+
+    holder.values = versioned({10})
+    assert holder.total == 10
+    assert holder.calls == 3
+
+
+def test_versioned_set_own_version():
+    first, second = VersionedSet([1]), VersionedSet([2])
+    version = first.version
+    second.add(3)
+    assert first.version == version
+    assert version_of([first, second]) == second.version
+
+    first.add(2)
+    assert first.version > second.version
+    assert version_of([first, second]) == first.version
+    assert version_of([first, {1}]) is None
+
+    assert versioned(second) is second
+    assert second.version > first.version
+
+
+def test_versioned_property_dependencies():
+    class Holder:
+        def __init__(self, parts):
+            self.parts = versioned(parts)
+            self.calls = 0
+
+        @versioned_property.depending_on(
+            lambda holder: [holder.parts, *(part.values for part in holder.parts)]
+        )
+        def total(self):
+            self.calls += 1
+            return sum(sum(part.values) for part in self.parts)
+
+    class Part:
+        def __init__(self, values):
+            self.values = versioned(values)
+
+    part, other = Part({1, 2}), Part({5})
+    holder = Holder({part})
+    assert holder.total == 3
+    other.values.add(6)
+    assert holder.total == 3
+    assert holder.calls == 1
+
+    part.values.add(3)
+    assert holder.total == 6
+    holder.parts.add(other)
+    assert holder.total == 17
+    assert holder.calls == 3